@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+from requests.adapters import HTTPAdapter
+
+from hydrachain_explorer_requester.async_explorer_requester import AsyncExplorerRequester
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from stub_explorer_server import StubExplorerServer
+
+BLOCKS = 500
+LATENCY_SECONDS = 0.02
+
+
+def benchmark_sync(server: StubExplorerServer) -> float:
+    explorer_requester = ExplorerRequester(urls=server.urls(), http_adapter=HTTPAdapter())
+
+    start = time.perf_counter()
+    for height in range(BLOCKS):
+        explorer_requester.get_block(height)
+
+    return time.perf_counter() - start
+
+
+async def benchmark_async(server: StubExplorerServer) -> float:
+    async with AsyncExplorerRequester(urls=server.urls()) as explorer_requester:
+        start = time.perf_counter()
+        await asyncio.gather(*(explorer_requester.get_block(height) for height in range(BLOCKS)))
+
+        return time.perf_counter() - start
+
+
+with StubExplorerServer(latency_seconds=LATENCY_SECONDS) as server:
+    sync_seconds = benchmark_sync(server)
+    async_seconds = asyncio.run(benchmark_async(server))
+
+print(f'{BLOCKS} blocks with {LATENCY_SECONDS * 1000:.0f} ms server latency')
+print(f'ExplorerRequester:      {sync_seconds:.2f} s ({BLOCKS / sync_seconds:.0f} req/s)')
+print(f'AsyncExplorerRequester: {async_seconds:.2f} s ({BLOCKS / async_seconds:.0f} req/s)')
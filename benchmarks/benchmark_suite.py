@@ -0,0 +1,238 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Callable, Any, Dict, List
+
+from hydrachain_explorer_requester import __version__
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+from fixture_explorer_server import FixtureExplorerServer
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where the peak memory is not measured
+    resource = None
+
+ADDRESS = 'HGRpVPQKsrTyqyVjLcsfpwHDDpzqeQ4cmB'
+TRANSACTION = '9c3a9d2f1b6e8c4d7a0b5e3f2c1d8e6a4b7c9d0e1f2a3b4c5d6e7f8091a2b3c4'
+
+
+@dataclass
+class BenchmarkConfig:
+    latency_ms: float = 5.0
+    items_per_list: int = 10
+    paginated_items: int = 1000
+    page_size: int = 100
+    operations: int = 1000
+    walks: int = 10
+    bulk_operations: int = 5
+    bulk_items: int = 500
+    concurrency: int = 8
+
+
+@dataclass
+class Scenario:
+    """
+    The single calls are made concurrently by config.concurrency threads, config.operations times in total.
+    The paginated walks and bulk fetches are concurrent on their own, so they are made one after the other.
+    """
+    name: str
+    kind: str
+    operation: Callable[[ExplorerRequester, int, BenchmarkConfig], Any]
+
+    def get_operations(self, config: BenchmarkConfig) -> int:
+        return {'single': config.operations, 'paginated': config.walks, 'bulk': config.bulk_operations}[self.kind]
+
+
+def _consume(iterator) -> int:
+    return sum(1 for _ in iterator)
+
+
+SCENARIOS = [
+    Scenario('get_info', 'single', lambda explorer_requester, index, config: explorer_requester.get_info()),
+    Scenario('get_block', 'single', lambda explorer_requester, index, config: explorer_requester.get_block(index)),
+    Scenario('get_transaction', 'single', lambda explorer_requester, index, config: explorer_requester.get_transaction(TRANSACTION)),
+    Scenario('get_address_balance', 'single', lambda explorer_requester, index, config: explorer_requester.get_address_balance(ADDRESS)),
+    Scenario('iter_address_transactions', 'paginated',
+             lambda explorer_requester, index, config: _consume(
+                 explorer_requester.iter_address_transactions(ADDRESS, page_size=config.page_size))),
+    Scenario('iter_address_transactions_prefetch', 'paginated',
+             lambda explorer_requester, index, config: _consume(
+                 explorer_requester.iter_address_transactions(ADDRESS, page_size=config.page_size, prefetch=True))),
+    Scenario('iter_search_logs', 'paginated',
+             lambda explorer_requester, index, config: _consume(
+                 explorer_requester.iter_search_logs(SearchLogsQueryParameters(), page_size=config.page_size))),
+    Scenario('get_blocks_range', 'bulk',
+             lambda explorer_requester, index, config: _consume(
+                 explorer_requester.get_blocks_range(1, config.bulk_items, config.concurrency))),
+    Scenario('get_transactions', 'bulk',
+             lambda explorer_requester, index, config: explorer_requester.get_transactions(
+                 [f'{index:08x}{height:056x}' for height in range(config.bulk_items)], concurrency=config.concurrency)),
+    Scenario('stream_search_logs', 'bulk',
+             lambda explorer_requester, index, config: _consume(explorer_requester.stream_search_logs())),
+]
+
+
+def run_scenario(name: str, config: BenchmarkConfig, domain: str) -> dict:
+    """
+    Runs in a fresh process, so the CPU time and peak memory are those of the scenario alone.
+    Every attempt is counted as a request via a response hook.
+    """
+
+    scenario = next(scenario for scenario in SCENARIOS if scenario.name == name)
+    requests_counter = itertools.count()
+
+    def count_request(response, *args, **kwargs):
+        # A hook returning a value would replace the response
+        next(requests_counter)
+
+    explorer_requester = ExplorerRequester(urls=ExplorerURL(domain=domain, base_path=''),
+                                           hooks={'response': count_request},
+                                           pool_maxsize=max(config.concurrency, 10))
+    operations = scenario.get_operations(config)
+
+    def measure(index: int) -> float:
+        start = time.perf_counter()
+        scenario.operation(explorer_requester, index, config)
+        return time.perf_counter() - start
+
+    # Warms up the connections and the imports, which shouldn't be measured
+    measure(0)
+
+    rss_before = _get_peak_rss_bytes()
+    requests_before = next(requests_counter)
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+
+    if scenario.kind == 'single':
+        with ThreadPoolExecutor(max_workers=config.concurrency) as executor:
+            latencies = list(executor.map(measure, range(operations)))
+    else:
+        latencies = [measure(index) for index in range(operations)]
+
+    seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+    requests = next(requests_counter) - requests_before - 1
+    peak_rss = _get_peak_rss_bytes()
+
+    explorer_requester.close()
+
+    return {
+        'scenario': scenario.name,
+        'kind': scenario.kind,
+        'operations': operations,
+        'requests': requests,
+        'seconds': seconds,
+        'operations_per_second': operations / seconds,
+        'requests_per_second': requests / seconds,
+        'latency_p50_ms': _get_percentile(latencies, 50) * 1000,
+        'latency_p99_ms': _get_percentile(latencies, 99) * 1000,
+        'cpu_ms_per_request': cpu_seconds / requests * 1000 if requests else None,
+        'peak_rss_bytes': peak_rss,
+        'peak_rss_growth_bytes': peak_rss - rss_before if peak_rss is not None else None
+    }
+
+
+def run(config: BenchmarkConfig, scenario_names: List[str] = None) -> dict:
+    scenarios = [scenario for scenario in SCENARIOS if not scenario_names or scenario.name in scenario_names]
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    with FixtureExplorerServer(latency_seconds=config.latency_ms / 1000,
+                               items_per_list=config.items_per_list,
+                               paginated_items=config.paginated_items) as server:
+        for scenario in scenarios:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_scenario, scenario.name, config, server.domain).result()
+
+            results.append(result)
+            print(f'{result["scenario"]:<36} {result["requests_per_second"]:>9.0f} req/s  '
+                  f'p50 {result["latency_p50_ms"]:>8.2f} ms  p99 {result["latency_p99_ms"]:>8.2f} ms', file=sys.stderr)
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'config': asdict(config),
+        'results': results
+    }
+
+
+def compare(report: dict, baseline: dict) -> Dict[str, dict]:
+    """
+    :return: the ratios of the throughput and latencies of the report to the baseline's, per scenario present in both
+    """
+
+    baseline_results = {result['scenario']: result for result in baseline['results']}
+    comparison = {}
+
+    for result in report['results']:
+        baseline_result = baseline_results.get(result['scenario'])
+        if baseline_result is None:
+            continue
+
+        comparison[result['scenario']] = {
+            key: result[key] / baseline_result[key] if baseline_result[key] else None
+            for key in ('requests_per_second', 'latency_p50_ms', 'latency_p99_ms', 'cpu_ms_per_request', 'peak_rss_bytes')
+            if result[key] is not None and baseline_result[key] is not None
+        }
+
+    return comparison
+
+
+def _get_percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))]
+
+
+def _get_peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, but in bytes on macOS
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def _parse_arguments() -> argparse.Namespace:
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description='End-to-end benchmarks of the ExplorerRequester against a stub explorer, '
+                                                 'replaying the fixture responses. Progress is printed to stderr, '
+                                                 'while the results are printed as JSON to stdout or written to --output')
+
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=type(value), default=value)
+
+    parser.add_argument('--scenario', action='append', choices=[scenario.name for scenario in SCENARIOS],
+                        help='runs only the given scenarios, may be repeated')
+    parser.add_argument('--output', help='file the JSON results are written to')
+    parser.add_argument('--compare', help='JSON results of a previous run, e.g. of another version, to compare with')
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = _parse_arguments()
+    config = BenchmarkConfig(**{name: getattr(arguments, name) for name in asdict(BenchmarkConfig())})
+
+    report = run(config, arguments.scenario)
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            report['comparison'] = compare(report, json.load(file))
+
+    output = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
@@ -0,0 +1,188 @@
+import enum
+import inspect
+import itertools
+import json
+import os
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, List
+from urllib.parse import parse_qs
+
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from stub_explorer_server import StubExplorerServer
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+DEFAULT_ITEMS_PER_LIST = 10
+DEFAULT_PAGINATED_ITEMS = 1000
+
+# The keys, under which the paginated responses hold their items
+PAGINATED_ITEMS_KEYS = ('list', 'tokens', 'transactions', 'logs')
+
+_PLACEHOLDER = '__placeholder__'
+_JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+_TEXT_CONTENT_TYPE = 'text/plain; charset=utf-8'
+
+
+def create_routes() -> List[tuple[re.Pattern, Endpoint]]:
+    """
+    Derives the path pattern of every endpoint from its ExplorerURL function, so the routes follow the URLs of the requesters.
+    """
+
+    urls = ExplorerURL(domain='', base_path='')
+    routes = []
+
+    for endpoint in Endpoint:
+        get_url = getattr(urls, f'get_{endpoint.value}_url')
+
+        arguments = []
+        for name, parameter in inspect.signature(get_url).parameters.items():
+            if isinstance(parameter.default, enum.Enum):
+                arguments.append(SimpleNamespace(value=_PLACEHOLDER))
+            elif name == 'transactions':
+                arguments.append([_PLACEHOLDER])
+            else:
+                arguments.append(_PLACEHOLDER)
+
+        # The values may be empty, e.g. the category of the address balance
+        pattern = re.escape(get_url(*arguments)).replace(_PLACEHOLDER, '([^/]*)')
+        routes.append((re.compile(pattern), endpoint))
+
+    return routes
+
+
+@dataclass
+class StaticFixture:
+    content_type: str
+    body: bytes
+
+    def render(self, arguments: tuple, query: Dict[str, List[str]]) -> bytes:
+        return self.body
+
+
+@dataclass
+class PaginatedFixture:
+    """
+    Serves total_items items, cycling through the items of the fixture, in pages selected by the page size and page,
+    or by the limit and offset. Without them, all of the items are served at once.
+    """
+    content_type = _JSON_CONTENT_TYPE
+
+    prefix: bytes
+    items: List[bytes]
+    total_items: int
+
+    def render(self, arguments: tuple, query: Dict[str, List[str]]) -> bytes:
+        if 'pageSize' in query:
+            page_size = int(query['pageSize'][0])
+            start = page_size * int(query.get('page', ['0'])[0])
+        elif 'limit' in query:
+            page_size = int(query['limit'][0])
+            start = int(query.get('offset', ['0'])[0])
+        else:
+            page_size = self.total_items
+            start = 0
+
+        end = min(start + page_size, self.total_items)
+        page_items = (self.items[index % len(self.items)] for index in range(start, end))
+
+        return self.prefix + b','.join(page_items) + b']}'
+
+
+@dataclass
+class TransactionsFixture:
+    """
+    Serves the fixture transaction once per requested id, so the requested transactions can be matched by their ids.
+    """
+    content_type = _JSON_CONTENT_TYPE
+
+    template: bytes
+
+    def render(self, arguments: tuple, query: Dict[str, List[str]]) -> bytes:
+        transaction_ids = arguments[0].split(',')
+        placeholder = _PLACEHOLDER.encode()
+
+        return b'[' + b','.join(self.template.replace(placeholder, transaction_id.encode())
+                                for transaction_id in transaction_ids) + b']'
+
+
+class FixtureExplorerServer(StubExplorerServer):
+    """
+    Stub explorer server, which replays the fixture response of every ExplorerURL route.
+    The fixtures are read from <endpoint>.json, or <endpoint>.txt for the text responses.
+
+    The payload sizes are configurable: the lists of the responses, e.g. a block's transactions, are resized to
+    items_per_list by repeating their items, while the paginated responses serve paginated_items items in total.
+    The responses are rendered upfront where possible, so the server adds as little as possible to the measured latency.
+    """
+
+    def __init__(self,
+                 fixtures_path: str = FIXTURES_PATH,
+                 items_per_list: int = DEFAULT_ITEMS_PER_LIST,
+                 paginated_items: int = DEFAULT_PAGINATED_ITEMS,
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the StubExplorerServer, e.g. latency_seconds
+        """
+        super().__init__(**kwargs)
+
+        self.items_per_list = items_per_list
+        self.paginated_items = paginated_items
+        self.routes = create_routes()
+        self.fixtures = {endpoint: self._load_fixture(fixtures_path, endpoint) for endpoint in Endpoint}
+
+    def respond(self, path: str, query: str) -> tuple[int, str, bytes]:
+        for pattern, endpoint in self.routes:
+            match = pattern.fullmatch(path)
+            if match is not None:
+                fixture = self.fixtures[endpoint]
+                return 200, fixture.content_type, fixture.render(match.groups(), parse_qs(query))
+
+        return 404, _TEXT_CONTENT_TYPE, b'Not found'
+
+    def _load_fixture(self, fixtures_path: str, endpoint: Endpoint):
+        text_path = os.path.join(fixtures_path, f'{endpoint.value}.txt')
+        if os.path.exists(text_path):
+            with open(text_path, 'rb') as file:
+                return StaticFixture(_TEXT_CONTENT_TYPE, file.read().strip())
+
+        with open(os.path.join(fixtures_path, f'{endpoint.value}.json'), 'rb') as file:
+            body = json.load(file)
+
+        if endpoint is Endpoint.TRANSACTIONS:
+            return TransactionsFixture(_dumps({**body[0], 'id': _PLACEHOLDER}))
+
+        items_key = _get_paginated_items_key(body)
+        if items_key is not None:
+            head = {key: value for key, value in body.items() if key != items_key}
+            head['totalCount'] = self.paginated_items
+            prefix = _dumps(head)[:-1] + f',"{items_key}":['.encode()
+
+            return PaginatedFixture(prefix, [_dumps(item) for item in body[items_key]], self.paginated_items)
+
+        if isinstance(body, list):
+            body = self._resize(body)
+        elif isinstance(body, dict):
+            body = {key: self._resize(value) if isinstance(value, list) else value for key, value in body.items()}
+
+        return StaticFixture(_JSON_CONTENT_TYPE, _dumps(body))
+
+    def _resize(self, items: list) -> list:
+        if not items:
+            return items
+
+        return list(itertools.islice(itertools.cycle(items), self.items_per_list))
+
+
+def _get_paginated_items_key(body) -> str | None:
+    if not isinstance(body, dict) or 'totalCount' not in body:
+        return None
+
+    return next((key for key in PAGINATED_ITEMS_KEYS if isinstance(body.get(key), list)), None)
+
+
+def _dumps(body) -> bytes:
+    return json.dumps(body, separators=(',', ':')).encode()
@@ -0,0 +1,31 @@
+import json
+import timeit
+
+from hydrachain_explorer_requester.json_decoding import stdlib_decoder, raw_decoder, get_default_json_decoder
+
+REPETITIONS = 20
+
+logs = [
+    {
+        'transactionId': f'{index:064x}',
+        'outputIndex': index % 4,
+        'blockHeight': 100000 + index // 10,
+        'sender': 'HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir',
+        'contractAddress': '4ab26aaa1803daa638910d71075c06386e391147',
+        'topics': ['ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef', f'{index:064x}', f'{index + 1:064x}'],
+        'data': f'{index:064x}',
+    }
+    for index in range(20000)
+]
+content = json.dumps({'totalCount': len(logs), 'logs': logs}).encode()
+
+decoders = {
+    'json (standard library)': stdlib_decoder,
+    'default (fastest installed)': get_default_json_decoder(),
+    'raw (no decoding)': raw_decoder,
+}
+
+print(f'Decoding a {len(content) / 1024 / 1024:.1f} MiB search logs response')
+for name, decoder in decoders.items():
+    seconds = timeit.timeit(lambda: decoder(content), number=REPETITIONS) / REPETITIONS
+    print(f'{name:<32} {seconds * 1000:.2f} ms')
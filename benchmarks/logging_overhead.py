@@ -0,0 +1,63 @@
+import logging
+import time
+import timeit
+from urllib.parse import urlencode
+
+from requests.adapters import HTTPAdapter
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.log_formatting import format_content, DEFAULT_LOG_BODY_LIMIT
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+from stub_explorer_server import StubExplorerServer
+
+PAYLOAD_BYTES = 4 * 1024 * 1024
+REPETITIONS = 50
+
+logger = logging.getLogger('logging_overhead')
+logger.setLevel(logging.INFO)
+
+url = 'https://explorer.hydrachain.org/7001/searchlogs'
+params = {'fromBlock': 100000, 'toBlock': 200000, 'pageSize': 1000, 'page': 0}
+content = b'{"logs": [' + b'{"data": "00"},' * (PAYLOAD_BYTES // 15) + b'{}]}'
+
+
+def eager_logging():
+    """
+    The logging done by the request path before it became level guarded.
+    """
+
+    logger.debug(f'Starting a new hydrachain explorer request to {url}?{urlencode(params)}')
+    logger.debug(f'Received a hydrachain explorer response from {url} with content {content}')
+
+
+def guarded_logging():
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Starting a new hydrachain explorer request to %s?%s', url, urlencode(params))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Received a hydrachain explorer response from %s with content %s',
+                     url, format_content(content, DEFAULT_LOG_BODY_LIMIT))
+
+
+class LargeResponseServer(StubExplorerServer):
+
+    def respond(self, path: str, query: str) -> tuple[int, str, bytes]:
+        return 200, 'application/json', content
+
+
+eager_seconds = timeit.timeit(eager_logging, number=REPETITIONS) / REPETITIONS
+guarded_seconds = timeit.timeit(guarded_logging, number=REPETITIONS) / REPETITIONS
+
+print(f'Logging overhead per request with a {len(content) / 1024 / 1024:.1f} MiB body, DEBUG disabled')
+print(f'Eager f-strings: {eager_seconds * 1000:.3f} ms')
+print(f'Level guarded:   {guarded_seconds * 1000:.3f} ms')
+
+with LargeResponseServer() as server:
+    explorer_requester = ExplorerRequester(urls=server.urls(), http_adapter=HTTPAdapter())
+    query_parameters = SearchLogsQueryParameters()
+
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        explorer_requester.get_search_logs(query_parameters)
+    request_seconds = (time.perf_counter() - start) / REPETITIONS
+
+print(f'Whole get_search_logs request, for comparison: {request_seconds * 1000:.3f} ms')
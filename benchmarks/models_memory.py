@@ -0,0 +1,64 @@
+import json
+import tracemalloc
+
+from hydrachain_explorer_requester.models import Transaction
+
+TRANSACTIONS = 20000
+
+
+def create_transaction_json(index: int) -> bytes:
+    transaction = {
+        'id': f'{index:064x}',
+        'hash': f'{index:064x}',
+        'version': 2,
+        'lockTime': 0,
+        'blockHash': f'{index // 10:064x}',
+        'blockHeight': index // 10,
+        'confirmations': 1000,
+        'timestamp': 1650000000 + index,
+        'isCoinbase': False,
+        'isCoinstake': False,
+        'inputValue': '150000000',
+        'outputValue': '149990000',
+        'refundValue': '0',
+        'fees': '10000',
+        'size': 225,
+        'weight': 900,
+        'inputs': [{'prevTxId': f'{index + 1:064x}', 'outputIndex': 0, 'value': '150000000',
+                    'address': 'HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir', 'sequence': 4294967295,
+                    'scriptSig': {'type': 'pubkeyhash', 'hex': '47' * 53, 'asm': '3044' * 20}}],
+        'outputs': [{'value': '149990000', 'address': 'H7FYCLijimtbYk7gdN1hmweftuWLQni3m5',
+                     'scriptPubKey': {'type': 'pubkeyhash', 'hex': '76a914' * 8, 'asm': 'OP_DUP OP_HASH160'}}],
+        'contractSpends': [],
+        'qrc20TokenTransfers': [],
+    }
+    return json.dumps(transaction).encode()
+
+
+def measure(convert) -> int:
+    bodies = [create_transaction_json(index) for index in range(TRANSACTIONS)]
+
+    tracemalloc.start()
+    transactions = [convert(json.loads(body)) for body in bodies]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del transactions
+    return current
+
+
+def _materialize(transaction: Transaction) -> Transaction:
+    transaction.inputs
+    transaction.outputs
+    return transaction
+
+
+dict_bytes = measure(lambda transaction: transaction)
+model_bytes = measure(Transaction.from_json)
+model_materialized_bytes = measure(lambda transaction: _materialize(Transaction.from_json(transaction)))
+
+
+print(f'Memory held by {TRANSACTIONS} transactions')
+print(f'Raw dicts:                           {dict_bytes / 1024 / 1024:.1f} MiB')
+print(f'Transaction models:                  {model_bytes / 1024 / 1024:.1f} MiB')
+print(f'Models with inputs/outputs accessed: {model_materialized_bytes / 1024 / 1024:.1f} MiB')
@@ -0,0 +1,105 @@
+import json
+import os
+
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.json_decoding import raw_decoder
+from hydrachain_explorer_requester.query_parameters import *
+from fixture_explorer_server import FIXTURES_PATH
+
+# Records the responses of the live explorer as the fixtures of the FixtureExplorerServer.
+# The address, transaction, contract and token of the requests are taken from the explorer's latest responses.
+
+PAGE_SIZE = 10
+
+
+def record(explorer_requester: ExplorerRequester, path: str = FIXTURES_PATH):
+    decode = json.loads
+
+    height = decode(explorer_requester.get_info())['height']
+    block = decode(explorer_requester.get_block(height - 10))
+    transaction_id = block['transactions'][-1]
+    transaction = decode(explorer_requester.get_transaction(transaction_id))
+    address = next(output['address'] for output in transaction['outputs'] if output.get('address'))
+    token = decode(explorer_requester.get_tokens(_with_page(TokensQueryParameters())))['tokens'][0]
+    contract = token['addressHex']
+
+    search_logs_query_parameters = _with_page(SearchLogsQueryParameters())
+    search_logs_query_parameters.set_contract(contract)
+
+    requests = {
+        Endpoint.SEARCH: lambda: explorer_requester.search(transaction_id),
+        Endpoint.BIGGEST_MINERS: lambda: explorer_requester.get_biggest_miners(_with_page(BiggestMinersQueryParameters())),
+        Endpoint.RICH_LIST: lambda: explorer_requester.get_rich_list(_with_page(RichListQueryParameters())),
+        Endpoint.DAILY_TRANSACTIONS: explorer_requester.get_daily_transactions,
+        Endpoint.BLOCK_INTERVAL: explorer_requester.get_block_interval,
+        Endpoint.ADDRESS_GROWTH: explorer_requester.get_address_growth,
+        Endpoint.RECENT_BLOCKS: explorer_requester.get_recent_blocks,
+        Endpoint.RECENT_TXS: explorer_requester.get_recent_txs,
+        Endpoint.INFO: explorer_requester.get_info,
+        Endpoint.BLOCK: lambda: explorer_requester.get_block(height - 10),
+        Endpoint.BLOCKS: explorer_requester.get_blocks,
+        Endpoint.TOKENS: lambda: explorer_requester.get_tokens(_with_page(TokensQueryParameters())),
+        Endpoint.CONTRACT: lambda: explorer_requester.get_contract(contract),
+        Endpoint.CONTRACT_TRANSACTIONS: lambda: explorer_requester.get_contract_transactions(
+            contract, _with_page(TransactionsQueryParameters())),
+        Endpoint.CONTRACT_BASIC_TRANSACTIONS: lambda: explorer_requester.get_contract_basic_transactions(
+            contract, _with_page(TransactionsQueryParameters())),
+        Endpoint.ADDRESS: lambda: explorer_requester.get_address(address),
+        Endpoint.ADDRESS_UTXO: lambda: explorer_requester.get_address_utxo(address),
+        Endpoint.ADDRESS_BALANCE: lambda: explorer_requester.get_address_balance(address),
+        Endpoint.ADDRESS_BALANCE_HISTORY: lambda: explorer_requester.get_address_balance_history(
+            address, _with_page(AddressBalanceHistoryQueryParameters())),
+        Endpoint.ADDRESS_QRC20_BALANCE_HISTORY: lambda: explorer_requester.get_address_qrc20_balance_history(
+            address, _with_page(AddressBalanceHistoryQueryParameters())),
+        Endpoint.ADDRESS_QRC20_BALANCE_HISTORY_BY_TOKEN: lambda: explorer_requester.get_address_qrc20_balance_history_by_token(
+            address, contract, _with_page(AddressBalanceHistoryQueryParameters())),
+        Endpoint.ADDRESS_TRANSACTIONS: lambda: explorer_requester.get_address_transactions(
+            address, _with_page(TransactionsQueryParameters())),
+        Endpoint.ADDRESS_QRC20_TRANSACTIONS: lambda: explorer_requester.get_address_qrc20_transactions(
+            address, contract, _with_page(TransactionsQueryParameters())),
+        Endpoint.ADDRESS_BASIC_TRANSACTIONS: lambda: explorer_requester.get_address_basic_transactions(
+            address, _with_page(TransactionsQueryParameters())),
+        Endpoint.ADDRESS_CONTRACT_TRANSACTIONS: lambda: explorer_requester.get_address_contract_transactions(
+            address, _with_page(TransactionsQueryParameters())),
+        Endpoint.ADDRESS_CONTRACT_TRANSACTIONS_BY_CONTRACT: lambda: explorer_requester.get_address_contract_transactions_by_contract(
+            address, contract, _with_page(TransactionsQueryParameters())),
+        Endpoint.TRANSACTION: lambda: explorer_requester.get_transaction(transaction_id),
+        Endpoint.RAW_TRANSACTION: lambda: explorer_requester.get_raw_transaction(transaction_id),
+        Endpoint.TRANSACTIONS: lambda: explorer_requester._get_transactions_chunk([transaction_id]),
+        Endpoint.CALL_CONTRACT: lambda: explorer_requester.call_contract(contract, _call_total_supply()),
+        Endpoint.SEARCH_LOGS: lambda: explorer_requester.get_search_logs(search_logs_query_parameters),
+    }
+
+    for endpoint, request in requests.items():
+        response = request()
+
+        if isinstance(response, str):
+            _write(os.path.join(path, f'{endpoint.value}.txt'), response)
+        else:
+            _write(os.path.join(path, f'{endpoint.value}.json'), json.dumps(json.loads(response), indent=2) + '\n')
+
+        print(f'Recorded {endpoint.value}')
+
+
+def _with_page(query_parameters):
+    query_parameters.set_page_size(PAGE_SIZE)
+    query_parameters.set_page(0)
+    return query_parameters
+
+
+def _call_total_supply() -> CallContractQueryParameters:
+    query_parameters = CallContractQueryParameters()
+    # The selector of totalSupply()
+    query_parameters.set_data('18160ddd')
+    return query_parameters
+
+
+def _write(path: str, content: str):
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+if __name__ == '__main__':
+    with ExplorerRequester(json_decoder=raw_decoder, timeout_seconds=30) as explorer_requester:
+        record(explorer_requester)
@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    request_queue_size = 1024
+
+
+class StubExplorerServer:
+    """
+    Local stand-in for the explorer's API, which answers every request with a small static response.
+    Used by the benchmarks, so they measure the requester and not the network or the real explorer.
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency_seconds: float = 0.0
+                 ):
+        """
+        :param port: 0 lets the operating system pick a free port
+        :param latency_seconds: artificial delay added before every response is sent
+        """
+        self.latency_seconds = latency_seconds
+        self.connections = 0
+        self.requests = 0
+        self._counters_lock = threading.Lock()
+        self.server = _StubHTTPServer((host, port), self._create_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def domain(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def urls(self) -> ExplorerURL:
+        return ExplorerURL(domain=self.domain, base_path='')
+
+    def count_connection(self):
+        with self._counters_lock:
+            self.connections += 1
+
+    def count_request(self):
+        with self._counters_lock:
+            self.requests += 1
+
+    def respond(self, path: str, query: str) -> tuple[int, str, bytes]:
+        """
+        :return: tuple of the status code, content type and body, which will be sent for the given request
+        """
+
+        if '/balance' in path or path.startswith('/raw-tx/'):
+            return 200, 'text/plain; charset=utf-8', b'1234567890'
+
+        if path.startswith('/block/'):
+            value = path.rsplit('/', 1)[-1]
+            height = int(value) if value.isdigit() else 1
+            body = {'hash': f'{height:064x}', 'height': height, 'prevHash': f'{height - 1:064x}', 'transactions': []}
+            return 200, 'application/json; charset=utf-8', json.dumps(body).encode()
+
+        return 200, 'application/json; charset=utf-8', json.dumps({'path': path, 'query': query}).encode()
+
+    def _create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub.count_connection()
+
+            def do_GET(self):
+                stub.count_request()
+
+                if stub.latency_seconds:
+                    time.sleep(stub.latency_seconds)
+
+                split = urlsplit(self.path)
+                status, content_type, body = stub.respond(split.path, split.query)
+
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
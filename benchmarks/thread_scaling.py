@@ -0,0 +1,50 @@
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from stub_explorer_server import StubExplorerServer
+
+REQUESTS_PER_THREAD = 50
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+LATENCY_SECONDS = 0.02
+
+CONFIGURATIONS = {
+    'HTTPAdapter() (pool_maxsize=10)': lambda server, threads: ExplorerRequester(urls=server.urls(), http_adapter=HTTPAdapter()),
+    'pool_maxsize=threads': lambda server, threads: ExplorerRequester(urls=server.urls(), pool_maxsize=threads),
+    'pool_maxsize=threads, session_per_thread': lambda server, threads: ExplorerRequester(urls=server.urls(),
+                                                                                         pool_maxsize=threads,
+                                                                                         session_per_thread=True),
+}
+
+
+def benchmark(explorer_requester: ExplorerRequester, threads: int) -> float:
+    def work(thread: int):
+        for height in range(REQUESTS_PER_THREAD):
+            explorer_requester.get_block(thread * REQUESTS_PER_THREAD + height)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(work, range(threads)))
+
+    return time.perf_counter() - start
+
+
+# The "Connection pool is full" warnings of the undersized pools would flood the output
+warnings.filterwarnings('ignore')
+
+print(f'{REQUESTS_PER_THREAD} blocks per thread with {LATENCY_SECONDS * 1000:.0f} ms server latency')
+print(f'{"configuration":<42} {"threads":>7} {"req/s":>8} {"connections":>11}')
+
+for name, create_requester in CONFIGURATIONS.items():
+    for threads in THREAD_COUNTS:
+        with StubExplorerServer(latency_seconds=LATENCY_SECONDS) as server:
+            with create_requester(server, threads) as explorer_requester:
+                seconds = benchmark(explorer_requester, threads)
+
+            connections = server.connections
+
+        requests_count = threads * REQUESTS_PER_THREAD
+        print(f'{name:<42} {threads:>7} {requests_count / seconds:>8.0f} {connections:>11}')
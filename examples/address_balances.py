@@ -0,0 +1,24 @@
+import logging
+
+from hydrachain_explorer_requester.enum.address_balance_category import AddressBalanceCategory
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+explorer_requester = ExplorerRequester(pool_maxsize=16)
+
+addresses = ['H7FYCLijimtbYk7gdN1hmweftuWLQni3m5', 'HGRpVPQKsrTyqyVjLcsfpwHDDpzqeQ4cmB']
+
+# Every category of every address is requested concurrently, the balances are in satoshis
+address_balances = explorer_requester.get_address_balances(addresses, concurrency=16)
+
+for (address, category), error in address_balances.errors.items():
+    logger.warning(f'The {category.value} of {address} failed with {error}')
+
+# One array per category, in the order of the addresses
+staking = address_balances.get_column(AddressBalanceCategory.STAKING)
+logger.info(f'Staking in total: {sum(staking)}')
+
+for address in address_balances.addresses:
+    logger.info(f'{address}: mature {address_balances.get_balance(address, AddressBalanceCategory.MATURE)}')
@@ -0,0 +1,22 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.query_parameters import TransactionsQueryParameters
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+explorer_requester = ExplorerRequester()
+
+# Address - https://explorer.hydrachain.org/address/HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir/
+
+query_parameters = TransactionsQueryParameters()
+query_parameters.set_from_block(555555)
+query_parameters.set_to_block(666666)
+
+# Only one page (plus the prefetched one) is held in memory at a time
+for transaction in explorer_requester.iter_address_transactions("HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir",
+                                                                query_parameters,
+                                                                page_size=50,
+                                                                prefetch=True):
+    logger.info(transaction)
@@ -0,0 +1,22 @@
+import asyncio
+import logging
+
+from hydrachain_explorer_requester.async_explorer_requester import AsyncExplorerRequester
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    async with AsyncExplorerRequester(connection_limit=20) as explorer_requester:
+        # Blocks - https://explorer.hydrachain.org/block/100/ to https://explorer.hydrachain.org/block/199/
+        blocks = await asyncio.gather(*(explorer_requester.get_block(height) for height in range(100, 200)))
+
+        # Address - https://explorer.hydrachain.org/address/HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir/
+        address_transactions = await explorer_requester.get_address_transactions("HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir")
+
+    logger.info(blocks)
+    logger.info(address_transactions)
+
+
+asyncio.run(main())
@@ -0,0 +1,15 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+explorer_requester = ExplorerRequester()
+
+# Blocks - https://explorer.hydrachain.org/block/1000/ to https://explorer.hydrachain.org/block/1100/
+for block_result in explorer_requester.get_blocks_range(1000, 1100, concurrency=8):
+    if block_result.is_successful():
+        logger.info(block_result.result)
+    else:
+        logger.warning(f'Block {block_result.argument} failed with {block_result.error}')
@@ -0,0 +1,23 @@
+import logging
+
+from hydrachain_explorer_requester.chain_follower import ChainFollower
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+chain_follower = ChainFollower(ExplorerRequester(), start_height=1000)
+
+
+@chain_follower.add_block_listener
+def on_block(block: dict):
+    logger.info(f'Block {block["height"]} {block["hash"]}')
+
+
+@chain_follower.add_reorg_listener
+def on_reorg(fork_height: int, orphaned_hashes: list):
+    logger.warning(f'Reorg at height {fork_height}, orphaned {orphaned_hashes}')
+
+
+# Polls in the current thread until interrupted, use start() for polling in a background thread
+chain_follower.run()
@@ -0,0 +1,34 @@
+import logging
+import time
+
+from hydrachain_explorer_requester.chain_follower import ChainFollower
+from hydrachain_explorer_requester.contract_calls import ContractCall, ContractCallBatcher
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+explorer_requester = ExplorerRequester()
+
+# The memoized results are forgotten whenever the follower delivers a new block
+chain_follower = ChainFollower(explorer_requester)
+contract_call_batcher = ContractCallBatcher(explorer_requester, concurrency=8)
+contract_call_batcher.follow(chain_follower)
+chain_follower.start()
+
+# Token - https://explorer.hydrachain.org/contract/4ab26aaa1803daa638910d71075c06386e391147/
+token = '4ab26aaa1803daa638910d71075c06386e391147'
+holders = ['b1e8f2a0c5d7e9b3a4f6c8d0e2a4b6c8d0e2f4a6', 'c2f9a3b1d6e8fa0c4b5a7d9e1f3b5c7d9e1f3a5b']
+
+# balanceOf(address), with the address left padded to 32 bytes
+calls = [ContractCall(token, '70a08231' + holder.rjust(64, '0')) for holder in holders]
+
+while True:
+    for result in contract_call_batcher.call_many(calls):
+        if result.is_successful():
+            logger.info(f'{result.argument.data}: {result.result["executionResult"]["output"]}')
+        else:
+            logger.warning(f'{result.argument.data} failed with {result.error}')
+
+    # Repeated within the same block, the calls are answered from memory
+    time.sleep(5)
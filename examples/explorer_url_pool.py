@@ -0,0 +1,26 @@
+import logging
+
+from hydrachain_explorer_requester.enum import LoadBalancing
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.explorer_url_pool import ExplorerURLPool
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The public explorer and a self-hosted mirror. A backend failing 3 times in a row is ejected
+# and health checked again after 30 seconds
+explorer_url_pool = ExplorerURLPool(
+    urls=[ExplorerURL(), ExplorerURL(domain='http://explorer-mirror.internal:3001', base_path='/api')],
+    load_balancing=LoadBalancing.LATENCY,
+    max_failures=3,
+    ejection_seconds=30.0
+)
+
+explorer_requester = ExplorerRequester(urls=explorer_url_pool, timeout_seconds=5.0)
+
+for height in range(1000, 1010):
+    logger.info(explorer_requester.get_block(height))
+
+for backend in explorer_url_pool.backends:
+    logger.info(f'{backend.prefix}: {backend.requests} requests, {backend.failures} failures, latency {backend.latency_seconds}')
@@ -0,0 +1,21 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.store import ExplorerStore, IndexedExplorer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+indexed_explorer = IndexedExplorer(ExplorerRequester(), ExplorerStore('explorer-index.db'))
+
+# Indexing the range once answers the following queries locally, without requesting the explorer
+indexed_explorer.index_blocks(100000, 101000)
+
+logger.info(indexed_explorer.get_address_transactions('HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir', 100000, 101000))
+logger.info(indexed_explorer.count_logs(
+    contract='4ab26aaa1803daa638910d71075c06386e391147',
+    topic1='ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef',  # Transfer(address,address,uint256)
+    from_block=100000,
+    to_block=101000
+))
+logger.info(indexed_explorer.get_largest_transfers(100000, 101000, limit=5))
@@ -0,0 +1,21 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.log_scanner import LogScanner
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# A timeout lets the scanner halve the sub-ranges, which the explorer is too slow to answer
+explorer_requester = ExplorerRequester(timeout_seconds=30.0, pool_maxsize=8)
+
+# Transfer events of the token - https://explorer.hydrachain.org/contract/4ab26aaa1803daa638910d71075c06386e391147/
+query_parameters = SearchLogsQueryParameters()
+query_parameters.set_contract('4ab26aaa1803daa638910d71075c06386e391147')
+query_parameters.set_topic1('ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef')
+
+log_scanner = LogScanner(explorer_requester, sub_range_blocks=10000, concurrency=8)
+
+for log_entry in log_scanner.scan(1, 1500000, query_parameters, as_model=True):
+    logger.info(f'{log_entry.block_height} {log_entry.transaction_id} {log_entry.data}')
@@ -0,0 +1,24 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.rate_limiter import RateLimiter, TokenBucket
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# At most 10 requests per second overall, of which at most 1 per second searching the logs
+rate_limiter = RateLimiter(
+    requests_per_second=10,
+    burst=10,
+    endpoint_limits={Endpoint.SEARCH_LOGS: TokenBucket(requests_per_second=1)}
+)
+
+explorer_requester = ExplorerRequester(rate_limiter=rate_limiter)
+
+with ThreadPoolExecutor(max_workers=8) as executor:
+    blocks = list(executor.map(explorer_requester.get_block, range(1000, 1050)))
+
+logger.info(blocks)
+logger.info(rate_limiter.statistics())
@@ -0,0 +1,21 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.recording import ResponseArchive, RecordingAdapter, ReplayAdapter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+archive = ResponseArchive('explorer_responses.sqlite')
+
+# Records the responses of the explorer into the archive
+with ExplorerRequester(http_adapter=RecordingAdapter(archive)) as explorer_requester:
+    for height in range(1000, 1100):
+        explorer_requester.get_block(height)
+
+# Replays them without any network, e.g. while reprocessing them. Requests missing from the archive raise ArchiveMissError
+with ExplorerRequester(http_adapter=ReplayAdapter(archive)) as explorer_requester:
+    for height in range(1000, 1100):
+        logger.info(explorer_requester.get_block(height)['hash'])
+
+logger.info(f'{len(archive)} responses archived')
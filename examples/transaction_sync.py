@@ -0,0 +1,25 @@
+import logging
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.sync import TransactionSync, SQLiteCheckpointStore, SyncTarget, SyncResult
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The checkpoints survive restarts, so every run requests only the transactions since the previous one
+transaction_sync = TransactionSync(ExplorerRequester(), SQLiteCheckpointStore('checkpoints.db'), confirmations=10)
+
+targets = [
+    SyncTarget.address('HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir'),
+    SyncTarget.contract('4ab26aaa1803daa638910d71075c06386e391147'),
+    SyncTarget.address_qrc20('HCiMdPYCsdPPvbjxHQMmK8QVBEGwextvir', '4ab26aaa1803daa638910d71075c06386e391147'),
+]
+
+
+def on_synchronized(result: SyncResult):
+    logger.info(f'{result.target.key}: {len(result.transactions)} new transactions up to block {result.checkpoint.block_height}')
+
+
+for sync_result in transaction_sync.sync_all(targets, listener=on_synchronized, concurrency=8):
+    if not sync_result.is_successful():
+        logger.warning(f'Synchronizing {sync_result.argument.key} failed with {sync_result.error}')
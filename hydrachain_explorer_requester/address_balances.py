@@ -0,0 +1,79 @@
+from array import array
+from typing import List, Tuple, Dict
+
+from hydrachain_explorer_requester.concurrency import ConcurrentResult
+from hydrachain_explorer_requester.enum import AddressBalanceCategory
+
+# The categories of a portfolio snapshot of an address
+BALANCE_CATEGORIES = (
+    AddressBalanceCategory.TOTAL_RECEIVED,
+    AddressBalanceCategory.TOTAL_SENT,
+    AddressBalanceCategory.UNCONFIRMED,
+    AddressBalanceCategory.STAKING,
+    AddressBalanceCategory.MATURE,
+)
+
+
+def parse_balance(text: str) -> int:
+    """
+    The explorer responds with the balance as the plain text number of satoshis.
+
+    :raises ValueError: when the text is not an integer
+    """
+
+    return int(text)
+
+
+class AddressBalances:
+    """
+    Columnar balances of many addresses, in satoshis: one array of signed 64-bit integers per category,
+    whose values are in the order of the addresses.
+
+    A balance, which couldn't be requested or parsed, is left as 0 in its column, while its error is kept in the errors.
+    """
+
+    def __init__(self,
+                 addresses: List[str],
+                 categories: Tuple[AddressBalanceCategory, ...]
+                 ):
+        self.addresses = addresses
+        self.categories = categories
+        self.columns: Dict[AddressBalanceCategory, array] = {
+            category: array('q', bytes(len(addresses) * array('q').itemsize)) for category in categories
+        }
+        self.errors: Dict[Tuple[str, AddressBalanceCategory], Exception] = {}
+        self._indexes = {address: index for index, address in enumerate(addresses)}
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def add_result(self, result: ConcurrentResult):
+        """
+        :param result: whose argument is the address and category of the balance
+        """
+
+        address, category = result.argument
+
+        if result.is_successful():
+            self.columns[category][self._indexes[address]] = result.result
+        else:
+            self.errors[(address, category)] = result.error
+
+    def is_successful(self) -> bool:
+        return not self.errors
+
+    def get_column(self, category: AddressBalanceCategory) -> array:
+        return self.columns[category]
+
+    def get_balance(self,
+                    address: str,
+                    category: AddressBalanceCategory
+                    ) -> int | None:
+        """
+        :return: None if the balance failed
+        """
+
+        if (address, category) in self.errors:
+            return None
+
+        return self.columns[category][self._indexes[address]]
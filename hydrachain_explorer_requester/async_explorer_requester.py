@@ -0,0 +1,1123 @@
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Mapping, Dict, Callable, Awaitable, AsyncIterator, Iterable, Any
+from urllib.parse import urlencode
+
+import aiohttp
+
+from hydrachain_explorer_requester import __version__
+from hydrachain_explorer_requester.address_balances import AddressBalances, BALANCE_CATEGORIES, parse_balance
+from hydrachain_explorer_requester.batching import DEFAULT_TRANSACTIONS_CHUNK_SIZE, deduplicate, split_into_chunks, order_by_keys
+from hydrachain_explorer_requester.concurrency import ConcurrentResult, amap_concurrently, DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.enum import AddressBalanceCategory, Endpoint
+from hydrachain_explorer_requester.explorer_requester import ResponseCodeError, ResponseBodyError
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.explorer_url_pool import ExplorerURLPool, ExplorerBackend
+from hydrachain_explorer_requester.hedging import HedgingPolicy
+from hydrachain_explorer_requester.json_decoding import JSONDecoder, get_default_json_decoder, decode_json
+from hydrachain_explorer_requester.metrics import RequestMetrics
+from hydrachain_explorer_requester.log_formatting import DEFAULT_LOG_BODY_LIMIT, format_content
+from hydrachain_explorer_requester.models import Block, Transaction, AddressSummary, UTXO, LogEntry
+from hydrachain_explorer_requester.pagination import aiterate_paginated, aiterate_pages
+from hydrachain_explorer_requester.query_parameters import *
+from hydrachain_explorer_requester.rate_limiter import RateLimiter
+from hydrachain_explorer_requester.retry import IDEMPOTENT_METHODS, RetryPolicy, DEFAULT_RETRY_POLICY, DEFAULT_RETRY_POLICIES
+from hydrachain_explorer_requester.single_flight import AsyncSingleFlight
+
+_logger = logging.getLogger(__name__)
+
+# Raised for the sock_connect timeout since aiohttp 3.10, before which it was a plain ServerTimeoutError
+_CONNECTION_TIMEOUT_ERRORS = getattr(aiohttp, 'ConnectionTimeoutError', ())
+
+
+class AsyncExplorerRequester:
+    """
+    Asyncio counterpart of the ExplorerRequester, backed by an aiohttp client session.
+    All requests made by one instance share a single pooled set of connections,
+    which allows many explorer requests to be in flight on the same event loop.
+    Data retrieved from the explorer is returned in raw format.
+
+    The requester must be closed when no longer needed, either via close() or by using it as an async context manager.
+    """
+
+    def __init__(self,
+                 logger: logging = _logger,
+                 timeout_seconds: float = None,
+                 connection_limit: int = 100,
+                 connection_limit_per_host: int = 0,
+                 urls: ExplorerURL | ExplorerURLPool = ExplorerURL(),
+                 session: aiohttp.ClientSession = None,
+                 retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+                 retry_policies: Dict[Endpoint, RetryPolicy] = None,
+                 rate_limiter: RateLimiter = None,
+                 coalesce_requests: bool = False,
+                 log_body_limit: int | None = DEFAULT_LOG_BODY_LIMIT,
+                 json_decoder: JSONDecoder = None,
+                 hedging_policy: HedgingPolicy = None,
+                 metrics: RequestMetrics = None
+                 ):
+        """
+        :param connection_limit: maximum number of simultaneously open connections, 0 for unlimited
+        :param connection_limit_per_host: maximum number of simultaneously open connections to one host, 0 for unlimited
+        :param urls: a single explorer, or an ExplorerURLPool balancing the requests between many of them
+        :param session: an already configured session to be used instead of the one created by the requester
+        :param retry_policy: used for the endpoints without their own retry policy. NO_RETRY_POLICY disables the retries
+        :param retry_policies: overwrites the DEFAULT_RETRY_POLICIES
+        :param rate_limiter: paces every attempt of the requests, can be shared with other requesters
+        :param coalesce_requests: identical concurrent requests share one network call and one parsed result.
+                                  The callers then receive the same object, which they should not modify
+        :param log_body_limit: maximum number of bytes of a response body logged on DEBUG level, 0 for none and None for all
+        :param json_decoder: decodes the JSON responses' bodies, defaults to the fastest installed one (orjson, msgspec or json).
+                             An invalid body raises requests.JSONDecodeError, whichever the decoder is.
+                             Use the raw_decoder for receiving the undecoded bytes
+        :param hedging_policy: sends a duplicate of the slow requests of the policy's endpoints, using the first completed one.
+                               Disabled when not given
+        :param metrics: collects the latencies, received bytes, decode times, retries and errors per endpoint,
+                        can be shared with other requesters. Disabled when not given
+        """
+        self.request_user_agent = f'Hydrachain Explorer Requester/{__version__}'
+
+        self.logger = logger
+        self.log_body_limit = log_body_limit
+        self.json_decoder = json_decoder or get_default_json_decoder()
+        self.timeout = timeout_seconds
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.session = session
+        self._owns_session = session is None
+
+        self.urls = urls
+        self._health_check_tasks = set()
+
+        self.retry_policy = retry_policy
+        self.retry_policies = DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+        self.rate_limiter = rate_limiter
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.hedging_policy = hedging_policy
+        self.metrics = metrics
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    async def search(self,
+                     value: str
+                     ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_search_url(),
+            endpoint=Endpoint.SEARCH,
+            params={'query': value}
+        )
+
+    async def get_biggest_miners(self,
+                                 query_parameters: BiggestMinersQueryParameters = BiggestMinersQueryParameters()
+                                 ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_biggest_miners_url(),
+            endpoint=Endpoint.BIGGEST_MINERS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_rich_list(self,
+                            query_parameters: RichListQueryParameters = RichListQueryParameters()
+                            ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_rich_list_url(),
+            endpoint=Endpoint.RICH_LIST,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_daily_transactions(self) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_daily_transactions_url(),
+            endpoint=Endpoint.DAILY_TRANSACTIONS
+        )
+
+    async def get_block_interval(self) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_block_interval_url(),
+            endpoint=Endpoint.BLOCK_INTERVAL
+        )
+
+    async def get_address_growth(self) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_growth_url(),
+            endpoint=Endpoint.ADDRESS_GROWTH
+        )
+
+    async def get_recent_blocks(self,
+                                query_parameters: RecentBlocksQueryParameters = RecentBlocksQueryParameters()
+                                ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_recent_blocks_url(),
+            endpoint=Endpoint.RECENT_BLOCKS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_recent_txs(self) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_recent_txs_url(),
+            endpoint=Endpoint.RECENT_TXS
+        )
+
+    async def get_info(self) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_info_url(),
+            endpoint=Endpoint.INFO
+        )
+
+    async def get_block(self,
+                        value: str | int,
+                        as_model: bool = False
+                        ) -> dict | Block:
+        """
+        :param value: height or hash
+        :param as_model: return a compact Block instead of the raw response
+        """
+
+        response = await self._request_explorer_json(
+            url=self.urls.get_block_url(value),
+            endpoint=Endpoint.BLOCK
+        )
+
+        return Block.from_json(response) if as_model else response
+
+    def get_blocks_range(self,
+                         start_height: int,
+                         end_height: int,
+                         concurrency: int = DEFAULT_CONCURRENCY
+                         ) -> AsyncIterator[ConcurrentResult]:
+        """
+        Fetches the blocks of the height range concurrently, yielding them in ascending height order.
+        A failure of one height doesn't abort the range, it is reported via the yielded result instead.
+
+        :param end_height: inclusive
+        :param concurrency: maximum number of blocks being requested at a time
+        :return: results whose argument is the height and result is the block
+        """
+
+        return amap_concurrently(self.get_block, range(start_height, end_height + 1), concurrency)
+
+    async def get_blocks(self,
+                         query_parameters: BlocksQueryParameters = BlocksQueryParameters()
+                         ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_blocks_url(),
+            endpoint=Endpoint.BLOCKS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_tokens(self,
+                         query_parameters: TokensQueryParameters = TokensQueryParameters()
+                         ) -> dict:
+        return await self._request_explorer_json(
+            url=self.urls.get_tokens_url(),
+            endpoint=Endpoint.TOKENS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_contract(self,
+                           contract: str
+                           ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_contract_url(contract),
+            endpoint=Endpoint.CONTRACT
+        )
+
+    async def get_contract_transactions(self,
+                                        contract: str,
+                                        query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                        ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_contract_transactions_url(contract),
+            endpoint=Endpoint.CONTRACT_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_contract_basic_transactions(self,
+                                              contract: str,
+                                              query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                              ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_contract_basic_transactions_url(contract),
+            endpoint=Endpoint.CONTRACT_BASIC_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address(self,
+                          address: str,
+                          as_model: bool = False
+                          ) -> dict | AddressSummary:
+        """
+        :param as_model: return a compact AddressSummary instead of the raw response
+        """
+
+        response = await self._request_explorer_json(
+            url=self.urls.get_address_url(address),
+            endpoint=Endpoint.ADDRESS
+        )
+
+        return AddressSummary.from_json(response) if as_model else response
+
+    async def get_address_utxo(self,
+                               address: str,
+                               as_model: bool = False
+                               ) -> dict | List[UTXO]:
+        """
+        :param as_model: return a compact UTXO list instead of the raw response
+        """
+
+        response = await self._request_explorer_json(
+            url=self.urls.get_address_utxo_url(address),
+            endpoint=Endpoint.ADDRESS_UTXO
+        )
+
+        return [UTXO.from_json(utxo) for utxo in response] if as_model else response
+
+    async def get_address_balance(self,
+                                  address: str,
+                                  category: AddressBalanceCategory = AddressBalanceCategory.NO_CATEGORY
+                                  ) -> str:
+        return await self._request_explorer_text(
+            url=self.urls.get_address_balance_url(address, category),
+            endpoint=Endpoint.ADDRESS_BALANCE
+        )
+
+    async def get_address_balances(self,
+                                   addresses: List[str],
+                                   categories: Iterable[AddressBalanceCategory] = BALANCE_CATEGORIES,
+                                   concurrency: int = DEFAULT_CONCURRENCY
+                                   ) -> AddressBalances:
+        """
+        Requests the balance of every category of every address concurrently and parses them into satoshis.
+        Duplicated addresses are requested only once. A failure of one balance doesn't abort the rest,
+        it is kept in the errors of the result instead.
+
+        :param categories: defaults to the BALANCE_CATEGORIES
+        :param concurrency: maximum number of balances being requested at a time
+        """
+
+        balances = AddressBalances(deduplicate(addresses), tuple(categories))
+        arguments = itertools.product(balances.addresses, balances.categories)
+
+        async for result in amap_concurrently(self._get_parsed_address_balance, arguments, concurrency):
+            balances.add_result(result)
+
+        return balances
+
+    async def _get_parsed_address_balance(self, argument: tuple) -> int:
+        address, category = argument
+        balance = await self.get_address_balance(address, category)
+
+        try:
+            return parse_balance(balance)
+        except ValueError:
+            raise ResponseBodyError(f'The {category.value or "balance"} of {address} is not a number, but {balance!r}') from None
+
+    async def get_address_balance_history(self,
+                                          address: str,
+                                          query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters()
+                                          ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_balance_history_url(address),
+            endpoint=Endpoint.ADDRESS_BALANCE_HISTORY,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_qrc20_balance_history(self,
+                                                address: str,
+                                                query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters()
+                                                ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_qrc20_balance_history_url(address),
+            endpoint=Endpoint.ADDRESS_QRC20_BALANCE_HISTORY,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_qrc20_balance_history_by_token(self,
+                                                         address: str,
+                                                         token: str,
+                                                         query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters()
+                                                         ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_qrc20_balance_history_by_token_url(address, token),
+            endpoint=Endpoint.ADDRESS_QRC20_BALANCE_HISTORY_BY_TOKEN,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_transactions(self,
+                                       address: str,
+                                       query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                       ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_qrc20_transactions(self,
+                                             address: str,
+                                             token: str,
+                                             query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                             ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_qrc20_transactions_url(address, token),
+            endpoint=Endpoint.ADDRESS_QRC20_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_basic_transactions(self,
+                                             address: str,
+                                             query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                             ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_basic_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_BASIC_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_contract_transactions(self,
+                                                address: str,
+                                                query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                                ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_contract_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_CONTRACT_TRANSACTIONS,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_address_contract_transactions_by_contract(self,
+                                                            address: str,
+                                                            contract: str,
+                                                            query_parameters: TransactionsQueryParameters = TransactionsQueryParameters()
+                                                            ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_address_contract_transactions_by_contract_url(address, contract),
+            endpoint=Endpoint.ADDRESS_CONTRACT_TRANSACTIONS_BY_CONTRACT,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_transaction(self,
+                              transaction: str,
+                              as_model: bool = False
+                              ) -> dict | Transaction:
+        """
+        :param as_model: return a compact Transaction instead of the raw response
+        """
+
+        response = await self._request_explorer_json(
+            url=self.urls.get_transaction_url(transaction),
+            endpoint=Endpoint.TRANSACTION
+        )
+
+        return Transaction.from_json(response) if as_model else response
+
+    async def get_raw_transaction(self,
+                                  transaction: str
+                                  ) -> str:
+
+        return await self._request_explorer_text(
+            url=self.urls.get_raw_transaction_url(transaction),
+            endpoint=Endpoint.RAW_TRANSACTION
+        )
+
+    async def get_transactions(self,
+                               transactions: List[str],
+                               chunk_size: int = DEFAULT_TRANSACTIONS_CHUNK_SIZE,
+                               concurrency: int = DEFAULT_CONCURRENCY
+                               ) -> list:
+        """
+        Duplicated transactions are requested only once. When more than chunk_size transactions are given,
+        they are split into chunks, which are requested concurrently. The transactions are returned in the given order.
+        A transaction missing from the explorer's responses raises a KeyError naming it, so the result always lines up with the given ones.
+
+        :param chunk_size: maximum number of transactions requested by a single request
+        :param concurrency: maximum number of chunks being requested at a time
+        """
+
+        chunks = split_into_chunks(deduplicate(transactions), chunk_size)
+        responses = [result.get() async for result in amap_concurrently(self._get_transactions_chunk, chunks, concurrency)]
+
+        return order_by_keys(transactions, itertools.chain.from_iterable(responses), 'id')
+
+    async def _get_transactions_chunk(self, transactions: List[str]) -> list:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_transactions_url(transactions),
+            endpoint=Endpoint.TRANSACTIONS
+        )
+
+    async def call_contract(self,
+                            contract: str,
+                            query_parameters: CallContractQueryParameters = CallContractQueryParameters()
+                            ) -> dict:
+
+        return await self._request_explorer_json(
+            url=self.urls.get_call_contract_url(contract),
+            endpoint=Endpoint.CALL_CONTRACT,
+            params={**query_parameters.pairs()}
+        )
+
+    async def get_search_logs(self,
+                              query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+                              as_model: bool = False,
+                              retry_policy: RetryPolicy = None
+                              ) -> dict | List[LogEntry]:
+        """
+        :param as_model: return a compact LogEntry list instead of the raw response
+        :param retry_policy: overwrites the retry policy of the endpoint for this request
+        """
+
+        response = await self._request_explorer_json(
+            url=self.urls.get_search_logs_url(),
+            endpoint=Endpoint.SEARCH_LOGS,
+            params={**query_parameters.pairs()},
+            retry_policy=retry_policy
+        )
+
+        return [LogEntry.from_json(log) for log in response['logs']] if as_model else response
+
+    def iter_biggest_miners(self,
+                            query_parameters: BiggestMinersQueryParameters = BiggestMinersQueryParameters(),
+                            page_size: int = None,
+                            prefetch: bool = False
+                            ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_biggest_miners(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='list',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_rich_list(self,
+                       query_parameters: RichListQueryParameters = RichListQueryParameters(),
+                       page_size: int = None,
+                       prefetch: bool = False
+                       ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_rich_list(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='list',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_tokens(self,
+                    query_parameters: TokensQueryParameters = TokensQueryParameters(),
+                    page_size: int = None,
+                    prefetch: bool = False
+                    ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_tokens(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='tokens',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_contract_transactions(self,
+                                   contract: str,
+                                   query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                   page_size: int = None,
+                                   prefetch: bool = False
+                                   ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_contract_transactions(contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_contract_basic_transactions(self,
+                                         contract: str,
+                                         query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                         page_size: int = None,
+                                         prefetch: bool = False
+                                         ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_contract_basic_transactions(contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_balance_history(self,
+                                     address: str,
+                                     query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                     page_size: int = None,
+                                     prefetch: bool = False
+                                     ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_balance_history(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_balance_history(self,
+                                           address: str,
+                                           query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                           page_size: int = None,
+                                           prefetch: bool = False
+                                           ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_balance_history(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_balance_history_by_token(self,
+                                                    address: str,
+                                                    token: str,
+                                                    query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                                    page_size: int = None,
+                                                    prefetch: bool = False
+                                                    ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_balance_history_by_token(address, token, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_transactions(self,
+                                  address: str,
+                                  query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                  page_size: int = None,
+                                  prefetch: bool = False
+                                  ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_transactions(self,
+                                        address: str,
+                                        token: str,
+                                        query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                        page_size: int = None,
+                                        prefetch: bool = False
+                                        ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_transactions(address, token, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_basic_transactions(self,
+                                        address: str,
+                                        query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                        page_size: int = None,
+                                        prefetch: bool = False
+                                        ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_basic_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_contract_transactions(self,
+                                           address: str,
+                                           query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                           page_size: int = None,
+                                           prefetch: bool = False
+                                           ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_contract_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_contract_transactions_by_contract(self,
+                                                       address: str,
+                                                       contract: str,
+                                                       query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                                       page_size: int = None,
+                                                       prefetch: bool = False
+                                                       ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_address_contract_transactions_by_contract(address, contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_search_logs(self,
+                         query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+                         page_size: int = None,
+                         prefetch: bool = False
+                         ) -> AsyncIterator:
+
+        return self._aiter_paginated(
+            request=lambda page_query_parameters: self.get_search_logs(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='logs',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    async def iter_blocks(self,
+                          from_date: date,
+                          to_date: date = None,
+                          prefetch: bool = False
+                          ) -> AsyncIterator:
+        """
+        Yields the blocks of every day between the two dates, one day being requested at a time.
+
+        :param to_date: inclusive, defaults to the current date
+        """
+
+        to_date = to_date or date.today()
+
+        async def request_day(day: int) -> list:
+            query_parameters = BlocksQueryParameters()
+            query_parameters.set_date(from_date + timedelta(days=day))
+            return await self.get_blocks(query_parameters)
+
+        def is_last_day(response: list, day: int) -> bool:
+            return from_date + timedelta(days=day) >= to_date
+
+        async for blocks in aiterate_pages(request_day, is_last_day, prefetch=prefetch):
+            for block in blocks:
+                yield block
+
+    def _aiter_paginated(self,
+                         request: Callable[[PaginationQueryParameters], Awaitable[dict]],
+                         query_parameters: PaginationQueryParameters,
+                         items_key: str,
+                         page_size: int = None,
+                         prefetch: bool = False
+                         ) -> AsyncIterator:
+        """
+        The iter_ functions yield the items of all pages lazily, so memory stays bounded by one page (two when prefetching),
+        no matter how many items are present in total. Optionally the next page is requested by a background task.
+        """
+
+        return aiterate_paginated(request, query_parameters, items_key, page_size, prefetch)
+
+    async def _request_explorer_json(self,
+                                     url: str,
+                                     params: dict = {},
+                                     method: str = 'GET',
+                                     endpoint: Endpoint = None,
+                                     retry_policy: RetryPolicy = None
+                                     ) -> dict:
+
+        async def request():
+            response = await self._request_explorer(url, params, method, endpoint, retry_policy)
+            self._validate_response(response)
+            return self._decode_json(response.content, endpoint)
+
+        return await self._coalesce('json', method, url, params, request)
+
+    async def _request_explorer_text(self,
+                                     url: str,
+                                     params: dict = {},
+                                     method: str = 'GET',
+                                     endpoint: Endpoint = None
+                                     ) -> str:
+
+        async def request():
+            response = await self._request_explorer(url, params, method, endpoint)
+            return response.text
+
+        return await self._coalesce('text', method, url, params, request)
+
+    async def _coalesce(self,
+                        response_format: str,
+                        method: str,
+                        url: str,
+                        params: dict,
+                        request: Callable[[], Awaitable]
+                        ) -> Any:
+        """
+        Makes the request, sharing it with the identical concurrent ones when coalescing is enabled.
+        Only the idempotent requests are coalesced.
+        """
+
+        if self.single_flight is None or method not in IDEMPOTENT_METHODS:
+            return await request()
+
+        key = (response_format, method, url, tuple(sorted(params.items())))
+        return await self.single_flight.do(key, request)
+
+    async def _request_explorer(self,
+                                url: str,
+                                params: dict = {},
+                                method: str = 'GET',
+                                endpoint: Endpoint = None,
+                                retry_policy: RetryPolicy = None
+                                ) -> 'AsyncExplorerResponse':
+        """
+        The whole body is read before returning, so the connection is immediately released back to the pool.
+
+        :param retry_policy: overwrites the retry policy of the endpoint
+        """
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Starting a new hydrachain explorer request to %s?%s', url, urlencode(params))
+
+        response = await self._send_measured(url, params, method, endpoint, retry_policy)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Received a hydrachain explorer response from %s with content %s',
+                              response.url, format_content(response.content, self.log_body_limit))
+
+        return response
+
+    async def _send_measured(self,
+                             url: str,
+                             params: dict,
+                             method: str,
+                             endpoint: Endpoint,
+                             retry_policy: RetryPolicy = None
+                             ) -> 'AsyncExplorerResponse':
+        """
+        Sends the request, recording its latency and outcome.
+        """
+
+        retry_policy = retry_policy or self._get_retry_policy(endpoint)
+
+        if self.metrics is None:
+            return await self._send(url, params, method, retry_policy, endpoint)
+
+        start = time.perf_counter()
+        try:
+            response = await self._send(url, params, method, retry_policy, endpoint)
+        except BaseException:
+            self.metrics.record_request(endpoint, time.perf_counter() - start, 0, failed=True)
+            raise
+
+        self.metrics.record_request(endpoint, time.perf_counter() - start, len(response.content), failed=response.status_code != 200)
+        return response
+
+    def _decode_json(self, content: bytes, endpoint: Endpoint):
+        if self.metrics is None:
+            return decode_json(self.json_decoder, content)
+
+        start = time.perf_counter()
+        try:
+            decoded = decode_json(self.json_decoder, content)
+        except BaseException:
+            self.metrics.record_decode(endpoint, time.perf_counter() - start, failed=True)
+            raise
+
+        self.metrics.record_decode(endpoint, time.perf_counter() - start)
+        return decoded
+
+    async def _send(self,
+                    url: str,
+                    params: dict,
+                    method: str,
+                    retry_policy: RetryPolicy,
+                    endpoint: Endpoint = None
+                    ) -> 'AsyncExplorerResponse':
+        """
+        Sends the request, retrying it as long as the retry policy allows it.
+        The response of the last attempt is returned, even if it is a retryable one, so it can be validated as usual.
+        """
+
+        attempt = 1
+        tried_backends = []
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+
+            try:
+                if self.hedging_policy is not None and endpoint in self.hedging_policy.endpoints:
+                    response = await self._send_hedged(url, params, method, tried_backends, endpoint)
+                else:
+                    response = await self._send_attempt(url, params, method, tried_backends)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if not retry_policy.should_retry_error(method, attempt, _is_read_timeout(error)):
+                    raise
+
+                delay_seconds = self._get_retry_delay_seconds(retry_policy, attempt, None, tried_backends)
+                self.logger.warning(
+                    f'Hydrachain explorer request to {url} failed with {error!r}, '
+                    f'retrying in {delay_seconds:.2f} seconds (attempt {attempt}/{retry_policy.max_attempts})')
+            else:
+                if not retry_policy.should_retry_status(method, attempt, response.status_code):
+                    return response
+
+                delay_seconds = self._get_retry_delay_seconds(retry_policy, attempt, response.headers, tried_backends)
+                self.logger.warning(
+                    f'Hydrachain explorer request to {response.url} responded with code {response.status_code}, '
+                    f'retrying in {delay_seconds:.2f} seconds (attempt {attempt}/{retry_policy.max_attempts})')
+
+            if self.metrics is not None:
+                self.metrics.record_retry(endpoint)
+
+            await asyncio.sleep(delay_seconds)
+            attempt += 1
+
+    async def _send_attempt(self,
+                            url: str,
+                            params: dict,
+                            method: str,
+                            tried_backends: List[ExplorerBackend]
+                            ) -> 'AsyncExplorerResponse':
+        """
+        With an ExplorerURLPool, the attempt is sent to the backend picked by the pool, which is then added to the tried backends.
+        The outcome of the attempt is reported back to the pool, which ejects the failing backends.
+        """
+
+        if not isinstance(self.urls, ExplorerURLPool):
+            return await self._request(url, params, method)
+
+        self._start_health_checks()
+
+        backend = self.urls.acquire(tried_backends)
+        tried_backends.append(backend)
+
+        start = time.perf_counter()
+        try:
+            response = await self._request(self.urls.rebase(url, backend), params, method)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            self.urls.release(backend, failed=True)
+            raise
+        except BaseException:
+            self.urls.release(backend)
+            raise
+
+        self.urls.release(backend, time.perf_counter() - start, failed=response.status_code >= 500)
+        return response
+
+    async def _send_hedged(self,
+                           url: str,
+                           params: dict,
+                           method: str,
+                           tried_backends: List[ExplorerBackend],
+                           endpoint: Endpoint
+                           ) -> 'AsyncExplorerResponse':
+        """
+        Sends the attempt and, when it doesn't complete within the hedging delay, a duplicate of it,
+        which goes to another backend of an ExplorerURLPool when there is one.
+        The first successful response is returned and the other attempt is cancelled.
+        """
+
+        delay_seconds = self.hedging_policy.get_delay_seconds(endpoint)
+        if delay_seconds is None:
+            return await self._send_timed_attempt(url, params, method, tried_backends, endpoint)
+
+        primary = asyncio.ensure_future(self._send_timed_attempt(url, params, method, tried_backends, endpoint))
+        done, _ = await asyncio.wait([primary], timeout=delay_seconds)
+        if done or not self.hedging_policy.try_acquire_hedge():
+            return await primary
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+
+        self.logger.debug(f'Hedging the hydrachain explorer request to {url} after {delay_seconds:.3f} seconds')
+        hedge = asyncio.ensure_future(self._send_timed_attempt(url, params, method, tried_backends, endpoint))
+
+        pending = {primary, hedge}
+        winner = None
+        try:
+            while winner is None and pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner is None:
+            return primary.result()
+        if winner is hedge:
+            self.hedging_policy.record_hedge_win()
+
+        return winner.result()
+
+    async def _send_timed_attempt(self,
+                                  url: str,
+                                  params: dict,
+                                  method: str,
+                                  tried_backends: List[ExplorerBackend],
+                                  endpoint: Endpoint
+                                  ) -> 'AsyncExplorerResponse':
+        """
+        Records the latency of the successful attempt, from which the hedging delay is computed.
+        """
+
+        start = time.perf_counter()
+        response = await self._send_attempt(url, params, method, tried_backends)
+        self.hedging_policy.record_latency(endpoint, time.perf_counter() - start)
+
+        return response
+
+    async def _request(self,
+                       url: str,
+                       params: dict,
+                       method: str
+                       ) -> 'AsyncExplorerResponse':
+        async with self._get_session().request(
+                method=method,
+                url=url,
+                params={name: str(value) for name, value in params.items()},
+                headers=self._get_request_headers(),
+        ) as response:
+            return AsyncExplorerResponse(
+                method=method,
+                url=str(response.url),
+                status_code=response.status,
+                headers=response.headers,
+                content=await response.read(),
+                encoding=response.charset or 'utf-8'
+            )
+
+    def _get_retry_delay_seconds(self,
+                                 retry_policy: RetryPolicy,
+                                 attempt: int,
+                                 headers,
+                                 tried_backends: List[ExplorerBackend]
+                                 ) -> float:
+        """
+        A retry, which goes to a backend not tried yet, is sent right away.
+        """
+
+        if isinstance(self.urls, ExplorerURLPool) and self.urls.has_untried_backend(tried_backends):
+            return 0.0
+
+        return retry_policy.get_delay_seconds(attempt, headers)
+
+    def _start_health_checks(self):
+        for backend in self.urls.get_backends_to_check():
+            task = asyncio.ensure_future(self._check_health(backend))
+            # The event loop keeps only weak references to the tasks
+            self._health_check_tasks.add(task)
+            task.add_done_callback(self._health_check_tasks.discard)
+
+    async def _check_health(self, backend: ExplorerBackend):
+        try:
+            response = await self._request(backend.url.get_info_url(), {}, 'GET')
+            self._validate_response(response)
+            healthy = True
+            self.logger.info(f'Hydrachain explorer {backend.prefix} is healthy again')
+        except Exception as error:
+            self.logger.warning(f'Health check of the hydrachain explorer {backend.prefix} failed with {error!r}')
+            healthy = False
+
+        self.urls.finish_check(backend, healthy)
+
+    def _get_retry_policy(self, endpoint: Endpoint) -> RetryPolicy:
+        return self.retry_policies.get(endpoint, self.retry_policy)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                # Like the timeout of requests, bounding the connecting and every read, so the read timeouts can be told apart
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            )
+            self._owns_session = True
+
+        return self.session
+
+    def _validate_response(self, response):
+        self._validate_response_code(response)
+        self._validate_response_content_type(response)
+
+    def _validate_response_code(self, response):
+        if response.status_code != 200:
+            raise ResponseCodeError(
+                f'{response.method} {response.url} responded with unexpected code {response.status_code} and content {response.content}')
+
+    def _validate_response_content_type(self, response):
+        if not 'application/json' in response.headers.get('content-type', ''):
+            raise ResponseBodyError(
+                f'{response.method} {response.url} responded with code {response.status_code} and unexpected content {response.content}')
+
+    def _get_request_headers(self) -> dict:
+        return {'User-Agent': self.request_user_agent}
+
+
+@dataclass
+class AsyncExplorerResponse:
+    """
+    Fully read response of the AsyncExplorerRequester, detached from the connection it was received on.
+    """
+    method: str
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str = 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+
+def _is_read_timeout(error: BaseException) -> bool:
+    """
+    The counterpart of requests' ReadTimeout is aiohttp's ServerTimeoutError of the sock_read timeout. The other timeouts,
+    e.g. of connecting or of acquiring a pooled connection, are plain asyncio.TimeoutError or ConnectionTimeoutError.
+    """
+
+    return isinstance(error, aiohttp.ServerTimeoutError) and not isinstance(error, _CONNECTION_TIMEOUT_ERRORS)
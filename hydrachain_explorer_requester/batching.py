@@ -0,0 +1,41 @@
+from typing import List, Iterable, Any, Hashable
+
+# Keeps the comma separated transaction ids of a single request around 3300 characters,
+# well below the URL length limits of the common HTTP servers and proxies.
+DEFAULT_TRANSACTIONS_CHUNK_SIZE = 50
+
+
+def deduplicate(values: Iterable[Hashable]) -> List[Hashable]:
+    """
+    :return: the values without duplicates, in the order of their first occurrence
+    """
+
+    return list(dict.fromkeys(values))
+
+
+def split_into_chunks(values: List[Any], chunk_size: int) -> List[List[Any]]:
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, but was {chunk_size}')
+
+    return [values[index:index + chunk_size] for index in range(0, len(values), chunk_size)]
+
+
+def order_by_keys(keys: List[Hashable],
+                  items: Iterable[dict],
+                  key_name: str
+                  ) -> List[dict]:
+    """
+    Orders the items by the given keys, an item being repeated as many times as its key is present,
+    so the result lines up with the keys.
+
+    :param key_name: the name of the item's field, which holds its key
+    :raises KeyError: naming the keys without a matching item
+    """
+
+    items_by_key = {item.get(key_name): item for item in items}
+
+    missing_keys = [key for key in deduplicate(keys) if key not in items_by_key]
+    if missing_keys:
+        raise KeyError(f'No {key_name} matches the keys {missing_keys}')
+
+    return [items_by_key[key] for key in keys]
@@ -0,0 +1,18 @@
+__all__ = [
+    'CachedResponse',
+    'CachePolicy',
+    'CacheStatistics',
+    'ResponseCache',
+    'MemoryCache',
+    'SQLiteCache',
+    'DEFAULT_CACHE_POLICIES',
+    'IMMUTABLE_CACHE_POLICIES',
+    'immutable',
+    'volatile',
+]
+
+from .cached_response import CachedResponse
+from .cache_policy import CachePolicy, DEFAULT_CACHE_POLICIES, IMMUTABLE_CACHE_POLICIES, immutable, volatile
+from .response_cache import ResponseCache, CacheStatistics
+from .memory_cache import MemoryCache
+from .sqlite_cache import SQLiteCache
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Dict, Any
+
+import requests
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+DEFAULT_VOLATILE_TTL_SECONDS = 5.0
+DEFAULT_MIN_CONFIRMATIONS = 10
+
+
+@dataclass
+class CachePolicy:
+    """
+    Describes how the responses of an endpoint are cached.
+
+    ttl_seconds: for how long a response is served from the cache, None meaning indefinitely (until evicted)
+    min_confirmations: a JSON response is cached only if its confirmations (or of each of its items for lists)
+                       are at least this many, which keeps data near the chain tip from being cached indefinitely
+    """
+    ttl_seconds: float = None
+    min_confirmations: int = 0
+
+    def is_cacheable(self, response: requests.Response, body: Any = None) -> bool:
+        """
+        :param body: the JSON body already decoded from the response. When not given, or left undecoded by the raw_decoder,
+                     the response is decoded only if its confirmations need to be checked
+        """
+
+        if response.status_code != 200:
+            return False
+
+        if self.min_confirmations <= 0 or 'application/json' not in response.headers.get('content-type', ''):
+            return True
+
+        if body is None or isinstance(body, bytes):
+            body = response.json()
+
+        items = body if isinstance(body, list) else [body]
+        return all(self._is_confirmed(item) for item in items)
+
+    def _is_confirmed(self, item) -> bool:
+        """
+        Items without confirmations are considered immutable.
+        """
+
+        if not isinstance(item, dict) or 'confirmations' not in item:
+            return True
+
+        return item['confirmations'] >= self.min_confirmations
+
+
+def immutable(min_confirmations: int = DEFAULT_MIN_CONFIRMATIONS) -> CachePolicy:
+    return CachePolicy(ttl_seconds=None, min_confirmations=min_confirmations)
+
+
+def volatile(ttl_seconds: float = DEFAULT_VOLATILE_TTL_SECONDS) -> CachePolicy:
+    return CachePolicy(ttl_seconds=ttl_seconds)
+
+
+# Blocks and transactions don't change once deep enough in the chain, raw transactions never change,
+# while the chain's info and the recent blocks and transactions change with every block.
+DEFAULT_CACHE_POLICIES: Dict[Endpoint, CachePolicy] = {
+    Endpoint.BLOCK: immutable(),
+    Endpoint.TRANSACTION: immutable(),
+    Endpoint.TRANSACTIONS: immutable(),
+    Endpoint.RAW_TRANSACTION: immutable(min_confirmations=0),
+    Endpoint.INFO: volatile(),
+    Endpoint.RECENT_BLOCKS: volatile(),
+    Endpoint.RECENT_TXS: volatile(),
+}
+
+# Only the data, which never changes once confirmed. Suitable for the persistent caches.
+IMMUTABLE_CACHE_POLICIES: Dict[Endpoint, CachePolicy] = {
+    endpoint: cache_policy for endpoint, cache_policy in DEFAULT_CACHE_POLICIES.items() if cache_policy.ttl_seconds is None
+}
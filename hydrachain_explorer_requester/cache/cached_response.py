@@ -0,0 +1,68 @@
+import zlib
+from dataclasses import dataclass, field
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class CachedResponse:
+    """
+    The parts of an explorer response needed to reconstruct it, detached from the connection it was received on.
+    """
+    url: str
+    status_code: int
+    content: bytes
+    headers: dict = field(default_factory=dict)
+    encoding: str = None
+
+    @staticmethod
+    def from_response(response: requests.Response) -> 'CachedResponse':
+        return CachedResponse(
+            url=response.url,
+            status_code=response.status_code,
+            content=response.content,
+            headers={'content-type': response.headers.get('content-type', '')},
+            encoding=response.encoding
+        )
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response._content = self.content
+        response._content_consumed = True
+        return response
+
+    @staticmethod
+    def from_row(url: str,
+                 status_code: int,
+                 content_type: str,
+                 encoding: str,
+                 content: bytes,
+                 compressed: bool
+                 ) -> 'CachedResponse':
+        """
+        Counterpart of to_row, for the responses stored in the SQLite databases.
+        """
+
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            content=zlib.decompress(content) if compressed else content,
+            headers={'content-type': content_type},
+            encoding=encoding
+        )
+
+    def to_row(self, compression_level: int) -> tuple:
+        """
+        :param compression_level: zlib level the content is compressed with, 0 for storing it uncompressed
+        :return: the url, status code, content type, encoding, content and whether the content is compressed
+        """
+
+        compressed = compression_level > 0
+        content = zlib.compress(self.content, compression_level) if compressed else self.content
+
+        return self.url, self.status_code, self.headers.get('content-type', ''), self.encoding, content, compressed
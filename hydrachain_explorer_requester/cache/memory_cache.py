@@ -0,0 +1,55 @@
+import threading
+import time
+from collections import OrderedDict
+
+from hydrachain_explorer_requester.cache.cached_response import CachedResponse
+from hydrachain_explorer_requester.cache.response_cache import ResponseCache
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory cache bounded by its number of entries, the least recently used entry being evicted first.
+    Expired entries are dropped when looked up.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[CachedResponse, float | None]] = OrderedDict()
+
+    def _get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            cached_response, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return cached_response
+
+    def _set(self, key: str, cached_response: CachedResponse, ttl_seconds: float | None):
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+
+        with self._lock:
+            self._entries[key] = (cached_response, expires_at)
+            self._entries.move_to_end(key)
+
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+
+        if evicted:
+            self._record_evictions(evicted)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _size(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,82 @@
+import threading
+from dataclasses import dataclass
+
+from hydrachain_explorer_requester.cache.cached_response import CachedResponse
+
+
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Base of the caches, which can be given to the ExplorerRequester.
+    Implementations provide _get, _set, _clear and _size, while the hit/miss bookkeeping is done here.
+    All of the functions must be safe to be called from multiple threads.
+    """
+
+    def __init__(self):
+        self._statistics_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        cached_response = self._get(key)
+
+        with self._statistics_lock:
+            if cached_response is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return cached_response
+
+    def set(self, key: str, cached_response: CachedResponse, ttl_seconds: float = None):
+        """
+        :param ttl_seconds: None for caching until evicted
+        """
+
+        self._set(key, cached_response, ttl_seconds)
+
+        with self._statistics_lock:
+            self._stores += 1
+
+    def clear(self):
+        self._clear()
+
+    def statistics(self) -> CacheStatistics:
+        with self._statistics_lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                size=self._size()
+            )
+
+    def _record_evictions(self, count: int = 1):
+        with self._statistics_lock:
+            self._evictions += count
+
+    def _get(self, key: str) -> CachedResponse | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, cached_response: CachedResponse, ttl_seconds: float | None):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        raise NotImplementedError
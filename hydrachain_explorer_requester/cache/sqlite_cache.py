@@ -0,0 +1,135 @@
+import os
+import sqlite3
+import threading
+import time
+
+from hydrachain_explorer_requester.cache.cached_response import CachedResponse
+from hydrachain_explorer_requester.cache.response_cache import ResponseCache
+from hydrachain_explorer_requester.sqlite_database import SQLiteDatabase
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS responses ('
+    'key TEXT PRIMARY KEY, '
+    'url TEXT NOT NULL, '
+    'status_code INTEGER NOT NULL, '
+    'content_type TEXT, '
+    'encoding TEXT, '
+    'content BLOB NOT NULL, '
+    'compressed INTEGER NOT NULL, '
+    'size INTEGER NOT NULL, '
+    'expires_at REAL, '
+    'accessed_at REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)',
+)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent cache stored in a SQLite database file, so cached responses survive restarts of the process.
+    Meant for the immutable chain data, see IMMUTABLE_CACHE_POLICIES.
+
+    The database is opened in WAL mode with one connection per thread, so any number of threads and processes
+    can read concurrently, while writes are serialized by SQLite. When the database grows beyond max_bytes,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self,
+                 path: str | os.PathLike,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 compress: bool = True,
+                 access_resolution_seconds: float = 60.0
+                 ):
+        """
+        :param compress: compress the content of the responses with zlib
+        :param access_resolution_seconds: how old the last access time of an entry must be before a read updates it.
+                                          Keeps the reads from turning into writes, at the cost of less precise LRU eviction
+        """
+        super().__init__()
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.access_resolution_seconds = access_resolution_seconds
+        self._eviction_lock = threading.Lock()
+        self._database = SQLiteDatabase(path, _SCHEMA)
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+
+        self._database.close()
+
+    def _get(self, key: str) -> CachedResponse | None:
+        connection = self._database.get_connection()
+        row = connection.execute(
+            'SELECT url, status_code, content_type, encoding, content, compressed, expires_at, accessed_at '
+            'FROM responses WHERE key = ?',
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        url, status_code, content_type, encoding, content, compressed, expires_at, accessed_at = row
+        now = time.time()
+
+        if expires_at is not None and expires_at <= now:
+            with connection:
+                connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            return None
+
+        if now - accessed_at >= self.access_resolution_seconds:
+            with connection:
+                connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+
+        return CachedResponse.from_row(url, status_code, content_type, encoding, content, compressed)
+
+    def _set(self, key: str, cached_response: CachedResponse, ttl_seconds: float | None):
+        now = time.time()
+        row = cached_response.to_row(1 if self.compress else 0)
+
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, url, status_code, content_type, encoding, content, compressed, size, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, *row, len(row[4]), now + ttl_seconds if ttl_seconds is not None else None, now)
+            )
+
+        if self._get_database_bytes(connection) > self.max_bytes:
+            self._evict(connection)
+
+    def _clear(self):
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute('DELETE FROM responses')
+
+    def _size(self) -> int:
+        return self._database.get_connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def _evict(self, connection: sqlite3.Connection):
+        """
+        Deletes the least recently used tenth of the entries, whose pages are then reused by the next inserts.
+        """
+
+        with self._eviction_lock:
+            if self._get_database_bytes(connection) <= self.max_bytes:
+                return
+
+            with connection:
+                connection.execute('DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+                evicted = connection.execute(
+                    'DELETE FROM responses WHERE key IN '
+                    '(SELECT key FROM responses ORDER BY accessed_at LIMIT (SELECT COUNT(*) / 10 + 1 FROM responses))'
+                ).rowcount
+
+        self._record_evictions(evicted)
+
+    def _get_database_bytes(self, connection: sqlite3.Connection) -> int:
+        page_size = connection.execute('PRAGMA page_size').fetchone()[0]
+        page_count = connection.execute('PRAGMA page_count').fetchone()[0]
+        freelist_count = connection.execute('PRAGMA freelist_count').fetchone()[0]
+        return (page_count - freelist_count) * page_size
@@ -0,0 +1,401 @@
+import asyncio
+import logging
+import threading
+import time
+from contextlib import closing, aclosing
+from typing import Callable, List, AsyncIterator, TYPE_CHECKING
+
+from hydrachain_explorer_requester.concurrency import DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.query_parameters import RecentBlocksQueryParameters
+
+if TYPE_CHECKING:
+    # aiohttp is an optional dependency
+    from hydrachain_explorer_requester.async_explorer_requester import AsyncExplorerRequester
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_REORG_DEPTH = 20
+DEFAULT_MAX_BLOCKS_PER_POLL = 100
+DEFAULT_MIN_POLL_SECONDS = 1.0
+DEFAULT_MAX_POLL_SECONDS = 60.0
+# Used until the block time has been received from the explorer
+DEFAULT_BLOCK_TIME_SECONDS = 32.0
+
+# Once the next block is overdue, the tip is polled this many times per block time
+OVERDUE_POLLS_PER_BLOCK_TIME = 4
+# Weight of every observed block interval in the moving average of the block time
+BLOCK_TIME_SMOOTHING = 0.1
+
+BlockListener = Callable[[dict], None]
+ReorgListener = Callable[[int, List[str]], None]
+TipListener = Callable[[int], None]
+
+
+class BaseChainFollower:
+    """
+    Tracks the tip of the chain and delivers every new block exactly once and in height order.
+
+    The tip height is polled via get_info. When it hasn't changed, only the hash of the latest block is compared with the delivered one.
+    Otherwise the hashes of the recent blocks are compared with the delivered ones and the missing blocks are fetched via get_block.
+    A tip lower than the known one is requested once more, and skipped as stale when it stays lower.
+    A reorg is detected either by a delivered block missing from the recent blocks, or by a new block not linking
+    to the previously delivered one. The orphaned blocks are then reported to the reorg listeners and the blocks of
+    the new branch are delivered again from the fork height on.
+
+    The poll interval follows the block time, which is initialized from get_block_interval and then adjusted by
+    the observed intervals of the delivered blocks. The tip is polled right before the next block is expected,
+    and a few times per block time once it is overdue.
+    """
+
+    def __init__(self,
+                 start_height: int = None,
+                 reorg_depth: int = DEFAULT_REORG_DEPTH,
+                 max_blocks_per_poll: int = DEFAULT_MAX_BLOCKS_PER_POLL,
+                 min_poll_seconds: float = DEFAULT_MIN_POLL_SECONDS,
+                 max_poll_seconds: float = DEFAULT_MAX_POLL_SECONDS,
+                 block_time_seconds: float = None,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 logger: logging = _logger
+                 ):
+        """
+        :param start_height: height of the first delivered block, defaults to the block after the current tip
+        :param reorg_depth: number of the latest delivered blocks, whose hashes are re-checked for reorgs
+        :param max_blocks_per_poll: maximum number of blocks fetched by a single poll, while catching up with the tip
+        :param block_time_seconds: expected time between two blocks, requested from the explorer when not given
+        :param concurrency: maximum number of blocks being requested at a time
+        """
+        self.height = None if start_height is None else start_height - 1
+        self.tip_height = None
+        self.reorg_depth = reorg_depth
+        self.max_blocks_per_poll = max_blocks_per_poll
+        self.min_poll_seconds = min_poll_seconds
+        self.max_poll_seconds = max_poll_seconds
+        self.block_time_seconds = block_time_seconds
+        self.concurrency = concurrency
+        self.logger = logger
+
+        self._hashes = {}
+        self._last_timestamp = None
+        self._notified_height = None
+
+        self._block_listeners: List[BlockListener] = []
+        self._reorg_listeners: List[ReorgListener] = []
+        self._tip_listeners: List[TipListener] = []
+
+    def add_block_listener(self, listener: BlockListener) -> BlockListener:
+        """
+        The listener receives every delivered block, in height order.
+        """
+
+        self._block_listeners.append(listener)
+        return listener
+
+    def add_reorg_listener(self, listener: ReorgListener) -> ReorgListener:
+        """
+        The listener receives the fork height and the hashes of the orphaned blocks, before the blocks of the new branch are delivered.
+        """
+
+        self._reorg_listeners.append(listener)
+        return listener
+
+    def add_tip_listener(self, listener: TipListener) -> TipListener:
+        """
+        The listener receives the height of the latest delivered block, whenever it changes or is reorged after a poll.
+        """
+
+        self._tip_listeners.append(listener)
+        return listener
+
+    def get_poll_delay_seconds(self) -> float:
+        if self.tip_height is not None and self.height is not None and self.height < self.tip_height:
+            return 0.0
+
+        block_time_seconds = self.block_time_seconds or DEFAULT_BLOCK_TIME_SECONDS
+        delay_seconds = block_time_seconds / OVERDUE_POLLS_PER_BLOCK_TIME
+
+        if self._last_timestamp is not None:
+            next_block_in_seconds = self._last_timestamp + block_time_seconds - time.time()
+            if next_block_in_seconds > 0:
+                delay_seconds = next_block_in_seconds
+
+        return min(max(delay_seconds, self.min_poll_seconds), self.max_poll_seconds)
+
+    def _is_synchronized(self, tip_height: int) -> bool:
+        return tip_height == self.tip_height and self.height is not None and self.height >= tip_height
+
+    def _is_stale(self, tip_height: int) -> bool:
+        """
+        A tip below the known one is most likely reported by a lagging explorer, e.g. a backend of an ExplorerURLPool.
+        A reorg to a shorter chain is detected once the new chain has grown past the known tip.
+        """
+
+        return self.tip_height is not None and tip_height < self.tip_height
+
+    def _is_tip_unchanged(self, latest_blocks: list) -> bool:
+        """
+        :param latest_blocks: the latest block of the chain, whose hash reveals a reorg keeping the tip height
+        """
+
+        return all(self._hashes.get(block['height']) == block['hash'] for block in latest_blocks)
+
+    def _get_latest_block_query_parameters(self) -> RecentBlocksQueryParameters:
+        query_parameters = RecentBlocksQueryParameters()
+        query_parameters.set_count(1)
+        return query_parameters
+
+    def _get_recent_blocks_query_parameters(self) -> RecentBlocksQueryParameters:
+        query_parameters = RecentBlocksQueryParameters()
+        query_parameters.set_count(self.reorg_depth)
+        return query_parameters
+
+    def _set_block_time(self, block_interval: list):
+        """
+        :param block_interval: the response of get_block_interval, which is the distribution of the block intervals
+        """
+
+        count = sum(entry['count'] for entry in block_interval)
+        if count:
+            self.block_time_seconds = sum(entry['interval'] * entry['count'] for entry in block_interval) / count
+
+    def _update_tip(self, tip_height: int, recent_blocks: list) -> tuple[int, int]:
+        """
+        Rolls back the orphaned blocks, if the recent blocks reveal a reorg.
+
+        :return: the inclusive height range of the blocks, which should be fetched by the poll
+        """
+
+        if recent_blocks:
+            tip_height = max(tip_height, max(block['height'] for block in recent_blocks))
+        self.tip_height = tip_height
+
+        if self.height is None:
+            self.height = tip_height
+
+        recent_hashes = {block['height']: block['hash'] for block in recent_blocks}
+        for height in sorted(self._hashes):
+            if height > tip_height or recent_hashes.get(height, self._hashes[height]) != self._hashes[height]:
+                self._rollback(height)
+                break
+
+        # The hashes of the recent blocks up to the start height link the first fetched block
+        for height in sorted(recent_hashes):
+            if height <= self.height and height not in self._hashes:
+                self._record(height, recent_hashes[height])
+
+        return self.height + 1, min(tip_height, self.height + self.max_blocks_per_poll)
+
+    def _accept(self, block: dict) -> bool:
+        """
+        Delivers the block, unless it doesn't link to the previously delivered one.
+        The previous block is then orphaned, so the next poll fetches it again from the new branch.
+        """
+
+        height = block['height']
+        previous_hash = self._hashes.get(height - 1)
+
+        if previous_hash is not None and block.get('prevHash') != previous_hash:
+            self._rollback(height - 1)
+            return False
+
+        self._record(height, block['hash'])
+        self.height = height
+        self._observe_interval(block)
+
+        for listener in self._block_listeners:
+            listener(block)
+
+        return True
+
+    def _record(self, height: int, block_hash: str):
+        self._hashes[height] = block_hash
+
+        while len(self._hashes) > self.reorg_depth:
+            del self._hashes[min(self._hashes)]
+
+    def _rollback(self, fork_height: int):
+        orphaned_heights = [height for height in self._hashes if height >= fork_height]
+        orphaned_hashes = [self._hashes.pop(height) for height in orphaned_heights]
+
+        if orphaned_heights and not self._hashes:
+            self.logger.warning(f'Reorg at height {fork_height} may be deeper than the reorg depth of {self.reorg_depth} blocks')
+
+        self.logger.info(f'Reorg at height {fork_height} orphaned {len(orphaned_hashes)} blocks')
+        self.height = fork_height - 1
+        # The tip listeners are notified again, even when the new branch ends at the same height
+        self._notified_height = None
+
+        for listener in self._reorg_listeners:
+            listener(fork_height, orphaned_hashes)
+
+    def _observe_interval(self, block: dict):
+        timestamp = block.get('timestamp')
+        if timestamp is not None:
+            self._last_timestamp = timestamp
+
+        interval = block.get('interval')
+        if interval and interval > 0 and self.block_time_seconds:
+            self.block_time_seconds += BLOCK_TIME_SMOOTHING * (interval - self.block_time_seconds)
+
+    def _notify_tip(self):
+        if self.height == self._notified_height:
+            return
+
+        self._notified_height = self.height
+        for listener in self._tip_listeners:
+            listener(self.height)
+
+
+class ChainFollower(BaseChainFollower):
+    """
+    Follows the chain via the ExplorerRequester, delivering the blocks to the listeners.
+    Either call poll yourself, or start polling in a background thread via start.
+    """
+
+    def __init__(self,
+                 explorer_requester: ExplorerRequester,
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the BaseChainFollower
+        """
+        super().__init__(**kwargs)
+
+        self.explorer_requester = explorer_requester
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def poll(self) -> list[dict]:
+        """
+        :return: the newly delivered blocks
+        """
+
+        tip_height = self.explorer_requester.get_info()['height']
+        if self._is_stale(tip_height):
+            tip_height = self.explorer_requester.get_info()['height']
+            if self._is_stale(tip_height):
+                self.logger.debug(f'Skipping the poll, as the tip {tip_height} is below the known tip {self.tip_height}')
+                return []
+
+        if self._is_synchronized(tip_height):
+            if self._is_tip_unchanged(self.explorer_requester.get_recent_blocks(self._get_latest_block_query_parameters())):
+                return []
+
+        if self.block_time_seconds is None:
+            self._set_block_time(self.explorer_requester.get_block_interval())
+
+        recent_blocks = self.explorer_requester.get_recent_blocks(self._get_recent_blocks_query_parameters())
+        start_height, end_height = self._update_tip(tip_height, recent_blocks)
+
+        delivered_blocks = []
+        try:
+            with closing(self.explorer_requester.get_blocks_range(start_height, end_height, self.concurrency)) as results:
+                for result in results:
+                    block = result.get()
+                    if not self._accept(block):
+                        break
+
+                    delivered_blocks.append(block)
+        finally:
+            self._notify_tip()
+
+        return delivered_blocks
+
+    def run(self):
+        """
+        Polls until stopped. A failed poll is logged and retried after the poll delay.
+        """
+
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as error:
+                self.logger.warning(f'Following the chain at height {self.height} failed with {error!r}')
+
+            self._stop_event.wait(self.get_poll_delay_seconds())
+
+    def start(self) -> threading.Thread:
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name='explorer-chain-follower', daemon=True)
+        self._thread.start()
+
+        return self._thread
+
+    def stop(self, timeout_seconds: float = None):
+        self._stop_event.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout_seconds)
+
+
+class AsyncChainFollower(BaseChainFollower):
+    """
+    Asyncio counterpart of the ChainFollower. Besides to the listeners, the blocks are delivered by iterating over the follower:
+
+        async for block in AsyncChainFollower(explorer_requester):
+            ...
+    """
+
+    def __init__(self,
+                 explorer_requester: 'AsyncExplorerRequester',
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the BaseChainFollower
+        """
+        super().__init__(**kwargs)
+
+        self.explorer_requester = explorer_requester
+
+    async def poll(self) -> list[dict]:
+        """
+        :return: the newly delivered blocks
+        """
+
+        tip_height = (await self.explorer_requester.get_info())['height']
+        if self._is_stale(tip_height):
+            tip_height = (await self.explorer_requester.get_info())['height']
+            if self._is_stale(tip_height):
+                self.logger.debug(f'Skipping the poll, as the tip {tip_height} is below the known tip {self.tip_height}')
+                return []
+
+        if self._is_synchronized(tip_height):
+            if self._is_tip_unchanged(await self.explorer_requester.get_recent_blocks(self._get_latest_block_query_parameters())):
+                return []
+
+        if self.block_time_seconds is None:
+            self._set_block_time(await self.explorer_requester.get_block_interval())
+
+        recent_blocks = await self.explorer_requester.get_recent_blocks(self._get_recent_blocks_query_parameters())
+        start_height, end_height = self._update_tip(tip_height, recent_blocks)
+
+        delivered_blocks = []
+        try:
+            async with aclosing(self.explorer_requester.get_blocks_range(start_height, end_height, self.concurrency)) as results:
+                async for result in results:
+                    block = result.get()
+                    if not self._accept(block):
+                        break
+
+                    delivered_blocks.append(block)
+        finally:
+            self._notify_tip()
+
+        return delivered_blocks
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """
+        Polls forever, yielding the delivered blocks. A failed poll is logged and retried after the poll delay.
+        """
+
+        while True:
+            try:
+                blocks = await self.poll()
+            except Exception as error:
+                self.logger.warning(f'Following the chain at height {self.height} failed with {error!r}')
+                blocks = []
+
+            for block in blocks:
+                yield block
+
+            await asyncio.sleep(self.get_poll_delay_seconds())
@@ -0,0 +1,94 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Any, Awaitable, AsyncIterator
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class ConcurrentResult:
+    """
+    Outcome of a single call made by map_concurrently.
+    Either the result or the error is present, depending on whether the call succeeded.
+    """
+    argument: Any
+    result: Any = None
+    error: Exception = None
+
+    def is_successful(self) -> bool:
+        return self.error is None
+
+    def get(self) -> Any:
+        """
+        :return: the result of the call, re-raising its error if it failed
+        """
+
+        if self.error is not None:
+            raise self.error
+
+        return self.result
+
+
+def map_concurrently(function: Callable[[Any], Any],
+                     arguments: Iterable[Any],
+                     concurrency: int = DEFAULT_CONCURRENCY
+                     ) -> Iterator[ConcurrentResult]:
+    """
+    Calls the function with every argument using up to `concurrency` threads and yields the results in the order of the arguments.
+    Calls that complete out of order are held back until every call before them has been yielded.
+    A failed call doesn't abort the rest, its error is reported in the yielded result instead.
+    At most `concurrency` calls are in flight at a time, so the arguments may be a lazy, unbounded iterable.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='explorer-concurrent')
+    try:
+        in_flight = deque()
+        for argument in arguments:
+            in_flight.append((argument, executor.submit(function, argument)))
+
+            if len(in_flight) >= concurrency:
+                yield _to_result(*in_flight.popleft())
+
+        while in_flight:
+            yield _to_result(*in_flight.popleft())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def amap_concurrently(function: Callable[[Any], Awaitable[Any]],
+                            arguments: Iterable[Any],
+                            concurrency: int = DEFAULT_CONCURRENCY
+                            ) -> AsyncIterator[ConcurrentResult]:
+    """
+    Asyncio counterpart of map_concurrently, where the calls are tasks on the running event loop instead of threads.
+    """
+
+    in_flight = deque()
+    try:
+        for argument in arguments:
+            in_flight.append((argument, asyncio.ensure_future(function(argument))))
+
+            if len(in_flight) >= concurrency:
+                yield await _to_result_async(*in_flight.popleft())
+
+        while in_flight:
+            yield await _to_result_async(*in_flight.popleft())
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+
+
+def _to_result(argument, future) -> ConcurrentResult:
+    try:
+        return ConcurrentResult(argument, result=future.result())
+    except Exception as error:
+        return ConcurrentResult(argument, error=error)
+
+
+async def _to_result_async(argument, task) -> ConcurrentResult:
+    try:
+        return ConcurrentResult(argument, result=await task)
+    except Exception as error:
+        return ConcurrentResult(argument, error=error)
@@ -0,0 +1,76 @@
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+DEFAULT_POOL_CONNECTIONS = 10
+# Every thread holds a connection while its request is in flight. Pools smaller than the number of threads
+# discard the surplus connections after every request ("Connection pool is full") and open new ones on the next.
+DEFAULT_POOL_MAXSIZE = 32
+
+DEFAULT_KEEP_ALIVE_IDLE_SECONDS = 60
+DEFAULT_KEEP_ALIVE_INTERVAL_SECONDS = 10
+DEFAULT_KEEP_ALIVE_PROBES = 6
+
+
+class ExplorerHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter, whose pooled connections are kept alive with TCP keep-alive probes,
+    so idle connections aren't silently dropped by proxies or load balancers between the requests.
+
+    The adapter and its connection pools are thread-safe and may be shared by many sessions.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['keep_alive_idle_seconds', 'keep_alive_interval_seconds', 'keep_alive_probes']
+
+    def __init__(self,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 keep_alive_idle_seconds: int | None = DEFAULT_KEEP_ALIVE_IDLE_SECONDS,
+                 keep_alive_interval_seconds: int = DEFAULT_KEEP_ALIVE_INTERVAL_SECONDS,
+                 keep_alive_probes: int = DEFAULT_KEEP_ALIVE_PROBES,
+                 **kwargs
+                 ):
+        """
+        :param pool_connections: number of hosts, for which connection pools are kept
+        :param pool_maxsize: maximum number of idle connections kept per host
+        :param pool_block: wait for a free connection instead of opening one over pool_maxsize
+        :param keep_alive_idle_seconds: idle time of a connection before the first probe is sent, None disables the probes
+        :param keep_alive_interval_seconds: time between the unanswered probes
+        :param keep_alive_probes: number of unanswered probes, after which the connection is dropped
+        """
+        self.keep_alive_idle_seconds = keep_alive_idle_seconds
+        self.keep_alive_interval_seconds = keep_alive_interval_seconds
+        self.keep_alive_probes = keep_alive_probes
+
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._get_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._get_socket_options())
+        return super().proxy_manager_for(*args, **kwargs)
+
+    def _get_socket_options(self) -> list:
+        """
+        The options of the probes are platform specific, so only the ones supported by the platform are set.
+        """
+
+        socket_options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive_idle_seconds is None:
+            return socket_options
+
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+        # TCP_KEEPALIVE is the macOS name of TCP_KEEPIDLE
+        idle_option = getattr(socket, 'TCP_KEEPIDLE', None) or getattr(socket, 'TCP_KEEPALIVE', None)
+        for option, value in ((idle_option, self.keep_alive_idle_seconds),
+                              (getattr(socket, 'TCP_KEEPINTVL', None), self.keep_alive_interval_seconds),
+                              (getattr(socket, 'TCP_KEEPCNT', None), self.keep_alive_probes)):
+            if option is not None:
+                socket_options.append((socket.IPPROTO_TCP, option, value))
+
+        return socket_options
@@ -0,0 +1,182 @@
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, TYPE_CHECKING
+
+from hydrachain_explorer_requester.batching import deduplicate
+from hydrachain_explorer_requester.chain_follower import BaseChainFollower
+from hydrachain_explorer_requester.concurrency import ConcurrentResult, map_concurrently, amap_concurrently, DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.query_parameters import CallContractQueryParameters
+
+if TYPE_CHECKING:
+    # aiohttp is an optional dependency
+    from hydrachain_explorer_requester.async_explorer_requester import AsyncExplorerRequester
+
+
+@dataclass(frozen=True)
+class ContractCall:
+    """
+    A read-only call of a contract, e.g. of a token's balanceOf.
+
+    :param data: the ABI encoded function selector and arguments, in hex
+    :param sender: the address, from which the call is made
+    """
+    contract: str
+    data: str
+    sender: str = None
+
+    def to_query_parameters(self) -> CallContractQueryParameters:
+        query_parameters = CallContractQueryParameters()
+        query_parameters.set_data(self.data)
+        query_parameters.set_sender(self.sender)
+        return query_parameters
+
+
+class BaseContractCallBatcher:
+    """
+    Memoizes the results of the contract calls per tip height, so the repeated calls within one block are answered from memory.
+    The results are forgotten whenever the tip height changes, e.g. by a chain follower the batcher follows.
+    Until the tip height is known, nothing is memoized.
+
+    The memoized results are shared between the callers, which should not modify them.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        :param concurrency: maximum number of calls being requested at a time
+        """
+        self.concurrency = concurrency
+        self.tip_height = None
+
+        self._lock = threading.Lock()
+        self._results: Dict[ContractCall, dict] = {}
+
+    def follow(self, chain_follower: BaseChainFollower):
+        """
+        Keeps the tip height of the batcher at the chain tip seen by the follower, once the follower has delivered it.
+        While the follower catches up, and after a reorg until the new branch is delivered, nothing is memoized.
+        """
+
+        def update_tip_height(height: int = None):
+            if chain_follower.height is not None and chain_follower.tip_height is not None and chain_follower.height >= chain_follower.tip_height:
+                self.set_tip_height(chain_follower.tip_height)
+            else:
+                self.set_tip_height(None)
+
+        update_tip_height()
+        chain_follower.add_tip_listener(update_tip_height)
+        chain_follower.add_reorg_listener(lambda fork_height, orphaned_hashes: self.set_tip_height(None))
+
+    def set_tip_height(self, tip_height: int | None):
+        """
+        :param tip_height: None stops memoizing
+        """
+
+        with self._lock:
+            if tip_height != self.tip_height:
+                self.tip_height = tip_height
+                self._results.clear()
+
+    def _split(self, calls: Iterable[ContractCall]) -> tuple[List[ContractCall], Dict[ContractCall, ConcurrentResult], int]:
+        """
+        :return: the calls, the memoized results of the calls, and the tip height, at which the rest of them is requested
+        """
+
+        calls = list(calls)
+        with self._lock:
+            results = {call: ConcurrentResult(call, result=self._results[call]) for call in calls if call in self._results}
+            return calls, results, self.tip_height
+
+    def _memoize(self, result: ConcurrentResult, tip_height: int | None):
+        """
+        The result is dropped when the tip has changed while it was requested, as it may be of the previous block.
+        """
+
+        with self._lock:
+            if result.is_successful() and tip_height is not None and tip_height == self.tip_height:
+                self._results[result.argument] = result.result
+
+
+class ContractCallBatcher(BaseContractCallBatcher):
+    """
+    Requests many contract calls concurrently via the ExplorerRequester, memoizing their results per tip height.
+    Can be shared by many threads.
+
+        batcher = ContractCallBatcher(explorer_requester)
+        batcher.follow(chain_follower)
+        results = batcher.call_many([ContractCall(token, balance_of_data) for balance_of_data in ...])
+    """
+
+    def __init__(self,
+                 explorer_requester: ExplorerRequester,
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the BaseContractCallBatcher
+        """
+        super().__init__(**kwargs)
+
+        self.explorer_requester = explorer_requester
+
+    def call(self, call: ContractCall) -> dict:
+        return self.call_many([call])[0].get()
+
+    def call_many(self, calls: Iterable[ContractCall]) -> List[ConcurrentResult]:
+        """
+        The calls, which aren't memoized, are requested concurrently, duplicated calls only once.
+        A failure of one call doesn't abort the rest, it is reported in its result instead.
+
+        :return: results whose argument is the call, in the order of the calls
+        """
+
+        calls, results, tip_height = self._split(calls)
+        missing_calls = deduplicate(call for call in calls if call not in results)
+
+        for result in map_concurrently(self._request, missing_calls, self.concurrency):
+            self._memoize(result, tip_height)
+            results[result.argument] = result
+
+        return [results[call] for call in calls]
+
+    def _request(self, call: ContractCall) -> dict:
+        return self.explorer_requester.call_contract(call.contract, call.to_query_parameters())
+
+
+class AsyncContractCallBatcher(BaseContractCallBatcher):
+    """
+    Asyncio counterpart of the ContractCallBatcher.
+    """
+
+    def __init__(self,
+                 explorer_requester: 'AsyncExplorerRequester',
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the BaseContractCallBatcher
+        """
+        super().__init__(**kwargs)
+
+        self.explorer_requester = explorer_requester
+
+    async def call(self, call: ContractCall) -> dict:
+        return (await self.call_many([call]))[0].get()
+
+    async def call_many(self, calls: Iterable[ContractCall]) -> List[ConcurrentResult]:
+        """
+        The calls, which aren't memoized, are requested concurrently, duplicated calls only once.
+        A failure of one call doesn't abort the rest, it is reported in its result instead.
+
+        :return: results whose argument is the call, in the order of the calls
+        """
+
+        calls, results, tip_height = self._split(calls)
+        missing_calls = deduplicate(call for call in calls if call not in results)
+
+        async for result in amap_concurrently(self._request, missing_calls, self.concurrency):
+            self._memoize(result, tip_height)
+            results[result.argument] = result
+
+        return [results[call] for call in calls]
+
+    async def _request(self, call: ContractCall) -> dict:
+        return await self.explorer_requester.call_contract(call.contract, call.to_query_parameters())
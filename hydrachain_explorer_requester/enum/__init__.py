@@ -1,5 +1,9 @@
 __all__ = [
-    'AddressBalanceCategory'
+    'AddressBalanceCategory',
+    'Endpoint',
+    'LoadBalancing'
 ]
 
 from hydrachain_explorer_requester.enum.address_balance_category import AddressBalanceCategory
+from hydrachain_explorer_requester.enum.endpoint import Endpoint
+from hydrachain_explorer_requester.enum.load_balancing import LoadBalancing
@@ -0,0 +1,38 @@
+import enum
+
+
+class Endpoint(enum.Enum):
+    """
+    The explorer's endpoints, the value being the name of the corresponding ExplorerURL function without the get_ prefix and _url suffix.
+    """
+    SEARCH = 'search'
+    BIGGEST_MINERS = 'biggest_miners'
+    RICH_LIST = 'rich_list'
+    DAILY_TRANSACTIONS = 'daily_transactions'
+    BLOCK_INTERVAL = 'block_interval'
+    ADDRESS_GROWTH = 'address_growth'
+    RECENT_BLOCKS = 'recent_blocks'
+    RECENT_TXS = 'recent_txs'
+    INFO = 'info'
+    BLOCK = 'block'
+    BLOCKS = 'blocks'
+    TOKENS = 'tokens'
+    CONTRACT = 'contract'
+    CONTRACT_TRANSACTIONS = 'contract_transactions'
+    CONTRACT_BASIC_TRANSACTIONS = 'contract_basic_transactions'
+    ADDRESS = 'address'
+    ADDRESS_UTXO = 'address_utxo'
+    ADDRESS_BALANCE = 'address_balance'
+    ADDRESS_BALANCE_HISTORY = 'address_balance_history'
+    ADDRESS_QRC20_BALANCE_HISTORY = 'address_qrc20_balance_history'
+    ADDRESS_QRC20_BALANCE_HISTORY_BY_TOKEN = 'address_qrc20_balance_history_by_token'
+    ADDRESS_TRANSACTIONS = 'address_transactions'
+    ADDRESS_QRC20_TRANSACTIONS = 'address_qrc20_transactions'
+    ADDRESS_BASIC_TRANSACTIONS = 'address_basic_transactions'
+    ADDRESS_CONTRACT_TRANSACTIONS = 'address_contract_transactions'
+    ADDRESS_CONTRACT_TRANSACTIONS_BY_CONTRACT = 'address_contract_transactions_by_contract'
+    TRANSACTION = 'transaction'
+    RAW_TRANSACTION = 'raw_transaction'
+    TRANSACTIONS = 'transactions'
+    CALL_CONTRACT = 'call_contract'
+    SEARCH_LOGS = 'search_logs'
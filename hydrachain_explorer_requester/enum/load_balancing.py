@@ -0,0 +1,12 @@
+import enum
+
+
+class LoadBalancing(enum.Enum):
+    """
+    How the ExplorerURLPool picks the backend of a request.
+
+    LEAST_OUTSTANDING picks the backend with the fewest requests in flight.
+    LATENCY picks the backend with the lowest average latency, weighted by its requests in flight.
+    """
+    LEAST_OUTSTANDING = 'least_outstanding'
+    LATENCY = 'latency'
@@ -1,5 +1,10 @@
+import itertools
 import logging
-from typing import List, Callable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from datetime import date, timedelta
+from typing import List, Callable, Iterator, Iterable, Dict, Any
 from urllib.parse import urlencode
 
 import requests
@@ -7,12 +12,30 @@ from requests import Session
 from requests.adapters import HTTPAdapter
 
 from hydrachain_explorer_requester import __version__
-from hydrachain_explorer_requester.enum import AddressBalanceCategory
+from hydrachain_explorer_requester.address_balances import AddressBalances, BALANCE_CATEGORIES, parse_balance
+from hydrachain_explorer_requester.batching import DEFAULT_TRANSACTIONS_CHUNK_SIZE, deduplicate, split_into_chunks, order_by_keys
+from hydrachain_explorer_requester.cache import ResponseCache, CachePolicy, CachedResponse, DEFAULT_CACHE_POLICIES
+from hydrachain_explorer_requester.connection_pool import ExplorerHTTPAdapter, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from hydrachain_explorer_requester.concurrency import ConcurrentResult, map_concurrently, DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.enum import AddressBalanceCategory, Endpoint
 from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.explorer_url_pool import ExplorerURLPool, ExplorerBackend
+from hydrachain_explorer_requester.hedging import HedgingPolicy, MAX_HEDGING_THREADS
+from hydrachain_explorer_requester.json_decoding import JSONDecoder, get_default_json_decoder, decode_json
+from hydrachain_explorer_requester.json_streaming import iterate_json_array_items
+from hydrachain_explorer_requester.metrics import RequestMetrics
+from hydrachain_explorer_requester.log_formatting import DEFAULT_LOG_BODY_LIMIT, format_content
+from hydrachain_explorer_requester.models import Block, Transaction, AddressSummary, UTXO, LogEntry
+from hydrachain_explorer_requester.pagination import iterate_paginated, iterate_pages
 from hydrachain_explorer_requester.query_parameters import *
+from hydrachain_explorer_requester.rate_limiter import RateLimiter
+from hydrachain_explorer_requester.retry import IDEMPOTENT_METHODS, RetryPolicy, DEFAULT_RETRY_POLICY, DEFAULT_RETRY_POLICIES
+from hydrachain_explorer_requester.single_flight import SingleFlight
 
 _logger = logging.getLogger(__name__)
 
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class ResponseCodeError(Exception):
     """
@@ -33,33 +56,135 @@ class ExplorerRequester:
     Easy-to-use class that provides function, which return data from the explorer's API.
     Optionally you can customize the logger or properties of the used requester.
     Data retrieved from the explorer is returned in raw format.
+
+    A requester may be shared by many threads. Its connection pool should then hold at least as many connections
+    as there are threads (pool_maxsize), and with session_per_thread every thread sends its requests through its own session.
     """
 
     def __init__(self,
                  logger: logging = _logger,
                  timeout_seconds: float = None,
                  hooks: dict = None,
-                 http_adapter: HTTPAdapter = HTTPAdapter(),
-                 urls: ExplorerURL = ExplorerURL()
+                 http_adapter: HTTPAdapter = None,
+                 urls: ExplorerURL | ExplorerURLPool = ExplorerURL(),
+                 cache: ResponseCache = None,
+                 cache_policies: Dict[Endpoint, CachePolicy] = None,
+                 retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+                 retry_policies: Dict[Endpoint, RetryPolicy] = None,
+                 rate_limiter: RateLimiter = None,
+                 coalesce_requests: bool = False,
+                 log_body_limit: int | None = DEFAULT_LOG_BODY_LIMIT,
+                 json_decoder: JSONDecoder = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 session_per_thread: bool = False,
+                 hedging_policy: HedgingPolicy = None,
+                 metrics: RequestMetrics = None
                  ):
+        """
+        :param http_adapter: mounted for both http and https, defaults to a new ExplorerHTTPAdapter per requester.
+                             When given, the pool parameters are ignored
+        :param urls: a single explorer, or an ExplorerURLPool balancing the requests between many of them.
+                     Give a pool a timeout_seconds too, so a stalled backend fails over instead of blocking
+        :param cache: caches the responses of the endpoints, which have a cache policy. Disabled when not given
+        :param cache_policies: overwrites the DEFAULT_CACHE_POLICIES. Endpoints without a policy are never cached
+        :param retry_policy: used for the endpoints without their own retry policy. NO_RETRY_POLICY disables the retries
+        :param retry_policies: overwrites the DEFAULT_RETRY_POLICIES
+        :param rate_limiter: paces every attempt of the requests, can be shared with other requesters
+        :param coalesce_requests: identical concurrent requests share one network call and one parsed result.
+                                  The callers then receive the same object, which they should not modify
+        :param log_body_limit: maximum number of bytes of a response body logged on DEBUG level, 0 for none and None for all
+        :param json_decoder: decodes the JSON responses' bodies, defaults to the fastest installed one (orjson, msgspec or json).
+                             An invalid body raises requests.JSONDecodeError, whichever the decoder is.
+                             Use the raw_decoder for receiving the undecoded bytes
+        :param pool_connections: number of hosts, for which connection pools are kept
+        :param pool_maxsize: maximum number of idle connections kept per host, should be at least the number of threads
+        :param pool_block: wait for a free connection instead of opening one over pool_maxsize
+        :param session_per_thread: every thread uses its own session, all of them sharing the connection pool.
+                                   Otherwise a single session is shared by the threads
+        :param hedging_policy: sends a duplicate of the slow requests of the policy's endpoints, using the first completed one.
+                               Disabled when not given
+        :param metrics: collects the latencies, received bytes, decode times, retries, cache hits and errors per endpoint,
+                        can be shared with other requesters. Disabled when not given
+        """
         self.request_user_agent = f'Hydrachain Explorer Requester/{__version__}'
 
         self.logger = logger
-        self.session = Session()
+        self.log_body_limit = log_body_limit
+        self.json_decoder = json_decoder or get_default_json_decoder()
         self.timeout = timeout_seconds
         self.hooks = hooks
-        self.http_adapter = http_adapter
-        self.session.mount('http://', self.http_adapter)
-        self.session.mount('https://', self.http_adapter)
+        self.http_adapter = http_adapter or ExplorerHTTPAdapter(pool_connections=pool_connections,
+                                                                pool_maxsize=pool_maxsize,
+                                                                pool_block=pool_block)
+        self.session_per_thread = session_per_thread
+        self._session = self._create_session()
+        self._thread_local = threading.local()
 
         self.urls = urls
 
+        self.cache = cache
+        self.cache_policies = DEFAULT_CACHE_POLICIES if cache_policies is None else cache_policies
+        self.retry_policy = retry_policy
+        self.retry_policies = DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+        self.rate_limiter = rate_limiter
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.hedging_policy = hedging_policy
+        self._hedging_executor = None
+        self._hedging_executor_lock = threading.Lock()
+        self.metrics = metrics
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self) -> Session:
+        """
+        The session of the calling thread with session_per_thread, otherwise the one shared by all threads.
+        """
+
+        if not self.session_per_thread:
+            return self._session
+
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._thread_local.session = self._create_session()
+
+        return session
+
+    @session.setter
+    def session(self, session: Session):
+        """
+        The given session is then used by all threads, even with session_per_thread. The http_adapter is mounted on it.
+        """
+
+        self._mount_adapter(session)
+        self._session = session
+        self.session_per_thread = False
+
+    def close(self):
+        """
+        Closes the pooled connections. The requester can still be used afterwards, opening new connections.
+        """
+
+        self._session.close()
+        self.http_adapter.close()
+
+        if self._hedging_executor is not None:
+            self._hedging_executor.shutdown(wait=False)
+            self._hedging_executor = None
+
     def search(self,
                value: str
                ) -> dict:
 
         return self._request_explorer_json(
             url=self.urls.get_search_url(),
+            endpoint=Endpoint.SEARCH,
             params={'query': value}
         )
 
@@ -69,6 +194,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_biggest_miners_url(),
+            endpoint=Endpoint.BIGGEST_MINERS,
             params={**query_parameters.pairs()}
         )
 
@@ -78,25 +204,29 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_rich_list_url(),
+            endpoint=Endpoint.RICH_LIST,
             params={**query_parameters.pairs()}
         )
 
     def get_daily_transactions(self) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_daily_transactions_url()
+            url=self.urls.get_daily_transactions_url(),
+            endpoint=Endpoint.DAILY_TRANSACTIONS
         )
 
     def get_block_interval(self) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_block_interval_url()
+            url=self.urls.get_block_interval_url(),
+            endpoint=Endpoint.BLOCK_INTERVAL
         )
 
     def get_address_growth(self) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_address_growth_url()
+            url=self.urls.get_address_growth_url(),
+            endpoint=Endpoint.ADDRESS_GROWTH
         )
 
     def get_recent_blocks(self,
@@ -105,38 +235,63 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_recent_blocks_url(),
+            endpoint=Endpoint.RECENT_BLOCKS,
             params={**query_parameters.pairs()}
         )
 
     def get_recent_txs(self) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_recent_txs_url()
+            url=self.urls.get_recent_txs_url(),
+            endpoint=Endpoint.RECENT_TXS
         )
 
     def get_info(self) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_info_url()
+            url=self.urls.get_info_url(),
+            endpoint=Endpoint.INFO
         )
 
     def get_block(self,
-                  value: str | int
-                  ) -> dict:
+                  value: str | int,
+                  as_model: bool = False
+                  ) -> dict | Block:
         """
         :param value: height or hash
+        :param as_model: return a compact Block instead of the raw response
         """
 
-        return self._request_explorer_json(
-            url=self.urls.get_block_url(value)
+        response = self._request_explorer_json(
+            url=self.urls.get_block_url(value),
+            endpoint=Endpoint.BLOCK
         )
 
+        return Block.from_json(response) if as_model else response
+
+    def get_blocks_range(self,
+                         start_height: int,
+                         end_height: int,
+                         concurrency: int = DEFAULT_CONCURRENCY
+                         ) -> Iterator[ConcurrentResult]:
+        """
+        Fetches the blocks of the height range concurrently, yielding them in ascending height order.
+        A failure of one height doesn't abort the range, it is reported via the yielded result instead.
+
+        :param end_height: inclusive
+        :param concurrency: maximum number of blocks being requested at a time
+        :return: results whose argument is the height and result is the block
+        """
+
+        return map_concurrently(self.get_block, range(start_height, end_height + 1), concurrency)
+
     def get_blocks(self,
                    query_parameters: BlocksQueryParameters = BlocksQueryParameters()
                    ) -> dict:
 
         return self._request_explorer_json(
             url=self.urls.get_blocks_url(),
+            endpoint=Endpoint.BLOCKS,
             params={**query_parameters.pairs()}
         )
 
@@ -145,6 +300,7 @@ class ExplorerRequester:
                    ) -> dict:
         return self._request_explorer_json(
             url=self.urls.get_tokens_url(),
+            endpoint=Endpoint.TOKENS,
             params={**query_parameters.pairs()}
         )
 
@@ -153,7 +309,8 @@ class ExplorerRequester:
                      ) -> dict:
 
         return self._request_explorer_json(
-            url=self.urls.get_contract_url(contract)
+            url=self.urls.get_contract_url(contract),
+            endpoint=Endpoint.CONTRACT
         )
 
     def get_contract_transactions(self,
@@ -163,6 +320,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_contract_transactions_url(contract),
+            endpoint=Endpoint.CONTRACT_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
@@ -173,33 +331,80 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_contract_basic_transactions_url(contract),
+            endpoint=Endpoint.CONTRACT_BASIC_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
     def get_address(self,
-                    address: str
-                    ) -> dict:
+                    address: str,
+                    as_model: bool = False
+                    ) -> dict | AddressSummary:
+        """
+        :param as_model: return a compact AddressSummary instead of the raw response
+        """
 
-        return self._request_explorer_json(
-            url=self.urls.get_address_url(address)
+        response = self._request_explorer_json(
+            url=self.urls.get_address_url(address),
+            endpoint=Endpoint.ADDRESS
         )
 
+        return AddressSummary.from_json(response) if as_model else response
+
     def get_address_utxo(self,
-                         address: str
-                         ) -> dict:
+                         address: str,
+                         as_model: bool = False
+                         ) -> dict | List[UTXO]:
+        """
+        :param as_model: return a compact UTXO list instead of the raw response
+        """
 
-        return self._request_explorer_json(
-            url=self.urls.get_address_utxo_url(address)
+        response = self._request_explorer_json(
+            url=self.urls.get_address_utxo_url(address),
+            endpoint=Endpoint.ADDRESS_UTXO
         )
 
+        return [UTXO.from_json(utxo) for utxo in response] if as_model else response
+
     def get_address_balance(self,
                             address: str,
                             category: AddressBalanceCategory = AddressBalanceCategory.NO_CATEGORY
                             ) -> str:
         return self._request_explorer_text(
-            url=self.urls.get_address_balance_url(address, category)
+            url=self.urls.get_address_balance_url(address, category),
+            endpoint=Endpoint.ADDRESS_BALANCE
         )
 
+    def get_address_balances(self,
+                             addresses: List[str],
+                             categories: Iterable[AddressBalanceCategory] = BALANCE_CATEGORIES,
+                             concurrency: int = DEFAULT_CONCURRENCY
+                             ) -> AddressBalances:
+        """
+        Requests the balance of every category of every address concurrently and parses them into satoshis.
+        Duplicated addresses are requested only once. A failure of one balance doesn't abort the rest,
+        it is kept in the errors of the result instead.
+
+        :param categories: defaults to the BALANCE_CATEGORIES
+        :param concurrency: maximum number of balances being requested at a time
+        """
+
+        balances = AddressBalances(deduplicate(addresses), tuple(categories))
+        arguments = itertools.product(balances.addresses, balances.categories)
+
+        for result in map_concurrently(self._get_parsed_address_balance, arguments, concurrency):
+            balances.add_result(result)
+
+        return balances
+
+    def _get_parsed_address_balance(self, argument: tuple) -> int:
+        address, category = argument
+        balance = self.get_address_balance(address, category)
+
+        try:
+            return parse_balance(balance)
+        except ValueError:
+            raise ResponseBodyError(f'The {category.value or "balance"} of {address} is not a number, but {balance!r}') from None
+
     def get_address_balance_history(self,
                                     address: str,
                                     query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters()
@@ -207,6 +412,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_balance_history_url(address),
+            endpoint=Endpoint.ADDRESS_BALANCE_HISTORY,
             params={**query_parameters.pairs()}
         )
 
@@ -217,6 +423,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_qrc20_balance_history_url(address),
+            endpoint=Endpoint.ADDRESS_QRC20_BALANCE_HISTORY,
             params={**query_parameters.pairs()}
         )
 
@@ -228,6 +435,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_qrc20_balance_history_by_token_url(address, token),
+            endpoint=Endpoint.ADDRESS_QRC20_BALANCE_HISTORY_BY_TOKEN,
             params={**query_parameters.pairs()}
         )
 
@@ -238,6 +446,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
@@ -249,6 +458,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_qrc20_transactions_url(address, token),
+            endpoint=Endpoint.ADDRESS_QRC20_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
@@ -259,6 +469,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_basic_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_BASIC_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
@@ -269,6 +480,7 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_contract_transactions_url(address),
+            endpoint=Endpoint.ADDRESS_CONTRACT_TRANSACTIONS,
             params={**query_parameters.pairs()}
         )
 
@@ -280,29 +492,62 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_address_contract_transactions_by_contract_url(address, contract),
+            endpoint=Endpoint.ADDRESS_CONTRACT_TRANSACTIONS_BY_CONTRACT,
             params={**query_parameters.pairs()}
         )
 
     def get_transaction(self,
-                        transaction: str
-                        ) -> dict:
+                        transaction: str,
+                        as_model: bool = False
+                        ) -> dict | Transaction:
+        """
+        :param as_model: return a compact Transaction instead of the raw response
+        """
 
-        return self._request_explorer_json(
-            url=self.urls.get_transaction_url(transaction)
+        response = self._request_explorer_json(
+            url=self.urls.get_transaction_url(transaction),
+            endpoint=Endpoint.TRANSACTION
         )
 
+        return Transaction.from_json(response) if as_model else response
+
     def get_raw_transaction(self,
                             transaction: str
                             ) -> str:
 
         return self._request_explorer_text(
-            url=self.urls.get_raw_transaction_url(transaction)
+            url=self.urls.get_raw_transaction_url(transaction),
+            endpoint=Endpoint.RAW_TRANSACTION
         )
 
-    def get_transactions(self, transactions: List[str]) -> dict:
+    def get_transactions(self,
+                         transactions: List[str],
+                         chunk_size: int = DEFAULT_TRANSACTIONS_CHUNK_SIZE,
+                         concurrency: int = DEFAULT_CONCURRENCY
+                         ) -> list:
+        """
+        Duplicated transactions are requested only once. When more than chunk_size transactions are given,
+        they are split into chunks, which are requested concurrently. The transactions are returned in the given order.
+        A transaction missing from the explorer's responses raises a KeyError naming it, so the result always lines up with the given ones.
+
+        :param chunk_size: maximum number of transactions requested by a single request
+        :param concurrency: maximum number of chunks being requested at a time
+        """
+
+        chunks = split_into_chunks(deduplicate(transactions), chunk_size)
+
+        if len(chunks) <= 1:
+            responses = [self._get_transactions_chunk(chunk) for chunk in chunks]
+        else:
+            responses = [result.get() for result in map_concurrently(self._get_transactions_chunk, chunks, concurrency)]
+
+        return order_by_keys(transactions, itertools.chain.from_iterable(responses), 'id')
+
+    def _get_transactions_chunk(self, transactions: List[str]) -> list:
 
         return self._request_explorer_json(
-            url=self.urls.get_transactions_url(transactions)
+            url=self.urls.get_transactions_url(transactions),
+            endpoint=Endpoint.TRANSACTIONS
         )
 
     def call_contract(self,
@@ -312,41 +557,464 @@ class ExplorerRequester:
 
         return self._request_explorer_json(
             url=self.urls.get_call_contract_url(contract),
+            endpoint=Endpoint.CALL_CONTRACT,
             params={**query_parameters.pairs()}
         )
 
     def get_search_logs(self,
-                        query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters()
-                        ) -> dict:
+                        query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+                        as_model: bool = False,
+                        retry_policy: RetryPolicy = None
+                        ) -> dict | List[LogEntry]:
+        """
+        :param as_model: return a compact LogEntry list instead of the raw response
+        :param retry_policy: overwrites the retry policy of the endpoint for this request
+        """
 
-        return self._request_explorer_json(
+        response = self._request_explorer_json(
             url=self.urls.get_search_logs_url(),
-            params={**query_parameters.pairs()}
+            endpoint=Endpoint.SEARCH_LOGS,
+            params={**query_parameters.pairs()},
+            retry_policy=retry_policy
+        )
+
+        return [LogEntry.from_json(log) for log in response['logs']] if as_model else response
+
+    def stream_blocks(self,
+                      query_parameters: BlocksQueryParameters = BlocksQueryParameters(),
+                      chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+                      ) -> Iterator:
+        """
+        Streaming counterpart of get_blocks, yielding every block as soon as it has been received.
+
+        :param chunk_size: number of bytes read from the body at a time
+        """
+
+        return self._stream_explorer_json_items(
+            url=self.urls.get_blocks_url(),
+            endpoint=Endpoint.BLOCKS,
+            params={**query_parameters.pairs()},
+            items_key=None,
+            chunk_size=chunk_size
+        )
+
+    def stream_address_balance_history(self,
+                                       address: str,
+                                       query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                       chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+                                       ) -> Iterator:
+        """
+        Streaming counterpart of get_address_balance_history, yielding every entry as soon as it has been received.
+
+        :param chunk_size: number of bytes read from the body at a time
+        """
+
+        return self._stream_explorer_json_items(
+            url=self.urls.get_address_balance_history_url(address),
+            endpoint=Endpoint.ADDRESS_BALANCE_HISTORY,
+            params={**query_parameters.pairs()},
+            items_key='transactions',
+            chunk_size=chunk_size
+        )
+
+    def stream_search_logs(self,
+                           query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+                           chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+                           ) -> Iterator:
+        """
+        Streaming counterpart of get_search_logs, yielding every log as soon as it has been received.
+
+        :param chunk_size: number of bytes read from the body at a time
+        """
+
+        return self._stream_explorer_json_items(
+            url=self.urls.get_search_logs_url(),
+            endpoint=Endpoint.SEARCH_LOGS,
+            params={**query_parameters.pairs()},
+            items_key='logs',
+            chunk_size=chunk_size
+        )
+
+    def iter_biggest_miners(self,
+                            query_parameters: BiggestMinersQueryParameters = BiggestMinersQueryParameters(),
+                            page_size: int = None,
+                            prefetch: bool = False
+                            ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_biggest_miners(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='list',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_rich_list(self,
+                       query_parameters: RichListQueryParameters = RichListQueryParameters(),
+                       page_size: int = None,
+                       prefetch: bool = False
+                       ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_rich_list(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='list',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_tokens(self,
+                    query_parameters: TokensQueryParameters = TokensQueryParameters(),
+                    page_size: int = None,
+                    prefetch: bool = False
+                    ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_tokens(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='tokens',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_contract_transactions(self,
+                                   contract: str,
+                                   query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                   page_size: int = None,
+                                   prefetch: bool = False
+                                   ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_contract_transactions(contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_contract_basic_transactions(self,
+                                         contract: str,
+                                         query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                         page_size: int = None,
+                                         prefetch: bool = False
+                                         ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_contract_basic_transactions(contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_balance_history(self,
+                                     address: str,
+                                     query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                     page_size: int = None,
+                                     prefetch: bool = False
+                                     ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_balance_history(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_balance_history(self,
+                                           address: str,
+                                           query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                           page_size: int = None,
+                                           prefetch: bool = False
+                                           ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_balance_history(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_balance_history_by_token(self,
+                                                    address: str,
+                                                    token: str,
+                                                    query_parameters: AddressBalanceHistoryQueryParameters = AddressBalanceHistoryQueryParameters(),
+                                                    page_size: int = None,
+                                                    prefetch: bool = False
+                                                    ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_balance_history_by_token(address, token, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_transactions(self,
+                                  address: str,
+                                  query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                  page_size: int = None,
+                                  prefetch: bool = False
+                                  ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_qrc20_transactions(self,
+                                        address: str,
+                                        token: str,
+                                        query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                        page_size: int = None,
+                                        prefetch: bool = False
+                                        ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_qrc20_transactions(address, token, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_basic_transactions(self,
+                                        address: str,
+                                        query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                        page_size: int = None,
+                                        prefetch: bool = False
+                                        ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_basic_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_contract_transactions(self,
+                                           address: str,
+                                           query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                           page_size: int = None,
+                                           prefetch: bool = False
+                                           ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_contract_transactions(address, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_address_contract_transactions_by_contract(self,
+                                                       address: str,
+                                                       contract: str,
+                                                       query_parameters: TransactionsQueryParameters = TransactionsQueryParameters(),
+                                                       page_size: int = None,
+                                                       prefetch: bool = False
+                                                       ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_address_contract_transactions_by_contract(address, contract, page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='transactions',
+            page_size=page_size,
+            prefetch=prefetch
         )
 
+    def iter_search_logs(self,
+                         query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+                         page_size: int = None,
+                         prefetch: bool = False
+                         ) -> Iterator:
+
+        return self._iter_paginated(
+            request=lambda page_query_parameters: self.get_search_logs(page_query_parameters),
+            query_parameters=query_parameters,
+            items_key='logs',
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+    def iter_blocks(self,
+                    from_date: date,
+                    to_date: date = None,
+                    prefetch: bool = False
+                    ) -> Iterator:
+        """
+        Yields the blocks of every day between the two dates, one day being requested at a time.
+
+        :param to_date: inclusive, defaults to the current date
+        """
+
+        to_date = to_date or date.today()
+
+        def request_day(day: int) -> list:
+            query_parameters = BlocksQueryParameters()
+            query_parameters.set_date(from_date + timedelta(days=day))
+            return self.get_blocks(query_parameters)
+
+        def is_last_day(response: list, day: int) -> bool:
+            return from_date + timedelta(days=day) >= to_date
+
+        for blocks in iterate_pages(request_day, is_last_day, prefetch=prefetch):
+            yield from blocks
+
+    def _iter_paginated(self,
+                        request: Callable[[PaginationQueryParameters], dict],
+                        query_parameters: PaginationQueryParameters,
+                        items_key: str,
+                        page_size: int = None,
+                        prefetch: bool = False
+                        ) -> Iterator:
+        """
+        The iter_ functions yield the items of all pages lazily, so memory stays bounded by one page (two when prefetching),
+        no matter how many items are present in total. Optionally the next page is requested in the background.
+        """
+
+        return iterate_paginated(request, query_parameters, items_key, page_size, prefetch)
+
     def _request_explorer_json(self,
                                url: str,
                                params: dict = {},
                                method: str = 'GET',
+                               endpoint: Endpoint = None,
+                               retry_policy: RetryPolicy = None
                                ) -> dict:
-        response = self._request_explorer(url, params, method)
-        self._validate_response(response)
-        return response.json()
+
+        def request():
+            return self._request_explorer(url, params, method, endpoint, decode_json=True, retry_policy=retry_policy)
+
+        return self._coalesce('json', method, url, params, request)
 
     def _request_explorer_text(self,
                                url: str,
                                params: dict = {},
                                method: str = 'GET',
+                               endpoint: Endpoint = None
                                ) -> str:
-        response = self._request_explorer(url, params, method)
-        return response.text
+
+        def request():
+            response = self._request_explorer(url, params, method, endpoint)
+            return response.text
+
+        return self._coalesce('text', method, url, params, request)
+
+    def _coalesce(self,
+                  response_format: str,
+                  method: str,
+                  url: str,
+                  params: dict,
+                  request: Callable[[], Any]
+                  ) -> Any:
+        """
+        Makes the request, sharing it with the identical concurrent ones when coalescing is enabled.
+        Only the idempotent requests are coalesced.
+        """
+
+        if self.single_flight is None or method not in IDEMPOTENT_METHODS:
+            return request()
+
+        key = (response_format, method, url, tuple(sorted(params.items())))
+        return self.single_flight.do(key, request)
 
     def _request_explorer(self,
                           url: str,
                           params: dict = {},
                           method: str = 'GET',
+                          endpoint: Endpoint = None,
+                          decode_json: bool = False,
+                          retry_policy: RetryPolicy = None
                           ):
+        """
+        :param endpoint: the requested endpoint, used to look up its cache and retry policies
+        :param decode_json: validate the response and return its decoded JSON body instead of it.
+                            The cache policy then checks the decoded body, so it isn't decoded twice
+        :param retry_policy: overwrites the retry policy of the endpoint
+        """
+
+        cache_policy = self._get_cache_policy(endpoint, method)
+        cache_key = self._get_cache_key(url, params, method) if cache_policy is not None else None
+
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+
+            if cached_response is not None:
+                self.logger.debug('Serving the hydrachain explorer request to %s from the cache', cache_key)
+                if self.metrics is not None:
+                    self.metrics.record_cache_hit(endpoint)
+
+                response = cached_response.to_response()
+                return self._decode_response(response, endpoint) if decode_json else response
+
+            if self.metrics is not None:
+                self.metrics.record_cache_miss(endpoint)
 
+        prepared_request = self._prepare_request(url, params, method)
+        response = self._send_measured(prepared_request, endpoint, retry_policy=retry_policy)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Received a hydrachain explorer response from %s with content %s',
+                              response.url, format_content(response.content, self.log_body_limit))
+
+        body = self._decode_response(response, endpoint) if decode_json else None
+
+        if cache_key is not None and cache_policy.is_cacheable(response, body):
+            self.cache.set(cache_key, CachedResponse.from_response(response), cache_policy.ttl_seconds)
+
+        return body if decode_json else response
+
+    def _stream_explorer_json_items(self,
+                                    url: str,
+                                    items_key: str | None,
+                                    params: dict = {},
+                                    method: str = 'GET',
+                                    endpoint: Endpoint = None,
+                                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+                                    ) -> Iterator:
+        """
+        Yields the decoded items of the response's JSON array while its body is still being received.
+        Streamed responses bypass the cache and the request coalescing.
+
+        :param items_key: the top-level key holding the array, None when the body itself is the array
+        """
+
+        prepared_request = self._prepare_request(url, params, method)
+        response = self._send_measured(prepared_request, endpoint, stream=True)
+        received_bytes = 0
+
+        def iter_chunks() -> Iterator[bytes]:
+            nonlocal received_bytes
+            for chunk in response.iter_content(chunk_size):
+                received_bytes += len(chunk)
+                yield chunk
+
+        try:
+            self._validate_response(response)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Streaming a hydrachain explorer response from %s', response.url)
+
+            for item in iterate_json_array_items(iter_chunks(), items_key):
+                yield self._decode_json(item, endpoint)
+        finally:
+            response.close()
+            if self.metrics is not None:
+                self.metrics.record_received_bytes(endpoint, received_bytes)
+
+    def _prepare_request(self,
+                         url: str,
+                         params: dict,
+                         method: str
+                         ) -> requests.PreparedRequest:
         request = requests.Request(
             method=method,
             url=url,
@@ -355,19 +1023,279 @@ class ExplorerRequester:
             hooks=self.hooks
         )
 
-        self.logger.debug(f'Starting a new hydrachain explorer request to {request.url}?{urlencode(request.params)}')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Starting a new hydrachain explorer request to %s?%s', request.url, urlencode(request.params))
 
-        prepared_request = self.session.prepare_request(request)
-        response = self.session.send(
-            request=prepared_request,
-            timeout=self.timeout
-        )
+        return self.session.prepare_request(request)
+
+    def _send_measured(self,
+                       prepared_request: requests.PreparedRequest,
+                       endpoint: Endpoint,
+                       stream: bool = False,
+                       retry_policy: RetryPolicy = None
+                       ) -> requests.Response:
+        """
+        Sends the request, recording its latency and outcome. A streamed response is recorded once its headers are received,
+        as its body is received only while it is being iterated.
 
-        self.logger.debug(
-            f'Received a hydrachain explorer response from {response.url} with content {response.content}')
+        :param retry_policy: overwrites the retry policy of the endpoint
+        """
+
+        retry_policy = retry_policy or self._get_retry_policy(endpoint)
+
+        if self.metrics is None:
+            return self._send(prepared_request, retry_policy, endpoint, stream)
+
+        start = time.perf_counter()
+        try:
+            response = self._send(prepared_request, retry_policy, endpoint, stream)
+        except BaseException:
+            self.metrics.record_request(endpoint, time.perf_counter() - start, 0, failed=True)
+            raise
+
+        self.metrics.record_request(endpoint,
+                                    time.perf_counter() - start,
+                                    0 if stream else len(response.content),
+                                    failed=response.status_code != 200)
+        return response
+
+    def _decode_response(self, response: requests.Response, endpoint: Endpoint):
+        self._validate_response(response)
+        return self._decode_json(response.content, endpoint)
+
+    def _decode_json(self, content: bytes, endpoint: Endpoint):
+        if self.metrics is None:
+            return decode_json(self.json_decoder, content)
+
+        start = time.perf_counter()
+        try:
+            decoded = decode_json(self.json_decoder, content)
+        except BaseException:
+            self.metrics.record_decode(endpoint, time.perf_counter() - start, failed=True)
+            raise
+
+        self.metrics.record_decode(endpoint, time.perf_counter() - start)
+        return decoded
+
+    def _send(self,
+              prepared_request: requests.PreparedRequest,
+              retry_policy: RetryPolicy,
+              endpoint: Endpoint = None,
+              stream: bool = False
+              ) -> requests.Response:
+        """
+        Sends the request, retrying it as long as the retry policy allows it.
+        The response of the last attempt is returned, even if it is a retryable one, so it can be validated as usual.
+
+        :param stream: defer downloading the body until it is accessed
+        """
+
+        attempt = 1
+        tried_backends = []
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+
+            try:
+                if self.hedging_policy is not None and endpoint in self.hedging_policy.endpoints:
+                    response = self._send_hedged(prepared_request, stream, tried_backends, endpoint)
+                else:
+                    response = self._send_attempt(prepared_request, stream, tried_backends)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not retry_policy.should_retry_error(prepared_request.method, attempt, isinstance(error, requests.ReadTimeout)):
+                    raise
+
+                delay_seconds = self._get_retry_delay_seconds(retry_policy, attempt, None, tried_backends)
+                self.logger.warning(
+                    f'Hydrachain explorer request to {prepared_request.url} failed with {error!r}, '
+                    f'retrying in {delay_seconds:.2f} seconds (attempt {attempt}/{retry_policy.max_attempts})')
+            else:
+                if not retry_policy.should_retry_status(prepared_request.method, attempt, response.status_code):
+                    return response
+
+                delay_seconds = self._get_retry_delay_seconds(retry_policy, attempt, response.headers, tried_backends)
+                self.logger.warning(
+                    f'Hydrachain explorer request to {response.url} responded with code {response.status_code}, '
+                    f'retrying in {delay_seconds:.2f} seconds (attempt {attempt}/{retry_policy.max_attempts})')
+                response.close()
+
+            if self.metrics is not None:
+                self.metrics.record_retry(endpoint)
+
+            time.sleep(delay_seconds)
+            attempt += 1
+
+    def _send_attempt(self,
+                      prepared_request: requests.PreparedRequest,
+                      stream: bool,
+                      tried_backends: List[ExplorerBackend]
+                      ) -> requests.Response:
+        """
+        With an ExplorerURLPool, the attempt is sent to the backend picked by the pool, which is then added to the tried backends.
+        The outcome of the attempt is reported back to the pool, which ejects the failing backends.
+        """
+
+        if not isinstance(self.urls, ExplorerURLPool):
+            return self._send_request(prepared_request, stream)
+
+        self._start_health_checks()
+
+        backend = self.urls.acquire(tried_backends)
+        tried_backends.append(backend)
+
+        backend_request = prepared_request.copy()
+        backend_request.url = self.urls.rebase(prepared_request.url, backend)
+
+        start = time.perf_counter()
+        try:
+            response = self._send_request(backend_request, stream)
+        except (requests.ConnectionError, requests.Timeout):
+            self.urls.release(backend, failed=True)
+            raise
+        except BaseException:
+            self.urls.release(backend)
+            raise
+
+        self.urls.release(backend, time.perf_counter() - start, failed=response.status_code >= 500)
+        return response
+
+    def _send_request(self, prepared_request: requests.PreparedRequest, stream: bool) -> requests.Response:
+        """
+        An adapter, which never uses the network, e.g. a ReplayAdapter without a fallback, is given no proxies.
+        Resolving them from the environment would otherwise scan all of its variables on every request.
+        """
+
+        if getattr(self.http_adapter, 'uses_network', True):
+            return self.session.send(request=prepared_request, timeout=self.timeout, stream=stream)
+
+        return self.session.send(request=prepared_request, timeout=self.timeout, stream=stream, proxies={})
+
+    def _send_hedged(self,
+                     prepared_request: requests.PreparedRequest,
+                     stream: bool,
+                     tried_backends: List[ExplorerBackend],
+                     endpoint: Endpoint
+                     ) -> requests.Response:
+        """
+        Sends the attempt and, when it doesn't complete within the hedging delay, a duplicate of it,
+        which goes to another backend of an ExplorerURLPool when there is one. The first successful response is returned,
+        while the other attempt is left to complete in the background and its response is discarded.
+        """
+
+        delay_seconds = self.hedging_policy.get_delay_seconds(endpoint)
+        if delay_seconds is None:
+            return self._send_timed_attempt(prepared_request, stream, tried_backends, endpoint)
+
+        primary = self._submit_hedging_attempt(prepared_request, stream, tried_backends, endpoint)
+        if wait([primary], timeout=delay_seconds).done or not self.hedging_policy.try_acquire_hedge():
+            return primary.result()
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+
+        self.logger.debug(f'Hedging the hydrachain explorer request to {prepared_request.url} after {delay_seconds:.3f} seconds')
+        hedge = self._submit_hedging_attempt(prepared_request, stream, tried_backends, endpoint)
+
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+
+            if winner is not None or not pending:
+                break
+
+        if winner is None:
+            return primary.result()
+
+        for future in (primary, hedge):
+            if future is not winner:
+                future.add_done_callback(_close_response)
+        if winner is hedge:
+            self.hedging_policy.record_hedge_win()
+
+        return winner.result()
+
+    def _submit_hedging_attempt(self,
+                                prepared_request: requests.PreparedRequest,
+                                stream: bool,
+                                tried_backends: List[ExplorerBackend],
+                                endpoint: Endpoint
+                                ) -> Future:
+        with self._hedging_executor_lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = ThreadPoolExecutor(max_workers=MAX_HEDGING_THREADS, thread_name_prefix='explorer-hedging')
+
+        return self._hedging_executor.submit(self._send_timed_attempt, prepared_request, stream, tried_backends, endpoint)
+
+    def _send_timed_attempt(self,
+                            prepared_request: requests.PreparedRequest,
+                            stream: bool,
+                            tried_backends: List[ExplorerBackend],
+                            endpoint: Endpoint
+                            ) -> requests.Response:
+        """
+        Records the latency of the successful attempt, from which the hedging delay is computed.
+        """
+
+        start = time.perf_counter()
+        response = self._send_attempt(prepared_request, stream, tried_backends)
+        self.hedging_policy.record_latency(endpoint, time.perf_counter() - start)
 
         return response
 
+    def _get_retry_delay_seconds(self,
+                                 retry_policy: RetryPolicy,
+                                 attempt: int,
+                                 headers,
+                                 tried_backends: List[ExplorerBackend]
+                                 ) -> float:
+        """
+        A retry, which goes to a backend not tried yet, is sent right away.
+        """
+
+        if isinstance(self.urls, ExplorerURLPool) and self.urls.has_untried_backend(tried_backends):
+            return 0.0
+
+        return retry_policy.get_delay_seconds(attempt, headers)
+
+    def _start_health_checks(self):
+        for backend in self.urls.get_backends_to_check():
+            threading.Thread(target=self._check_health, args=(backend,), name='explorer-health-check', daemon=True).start()
+
+    def _check_health(self, backend: ExplorerBackend):
+        try:
+            response = self.session.get(backend.url.get_info_url(), headers=self._get_request_headers(), timeout=self.timeout)
+            self._validate_response(response)
+            healthy = True
+            self.logger.info(f'Hydrachain explorer {backend.prefix} is healthy again')
+        except Exception as error:
+            self.logger.warning(f'Health check of the hydrachain explorer {backend.prefix} failed with {error!r}')
+            healthy = False
+
+        self.urls.finish_check(backend, healthy)
+
+    def _create_session(self) -> Session:
+        session = Session()
+        self._mount_adapter(session)
+
+        return session
+
+    def _mount_adapter(self, session: Session):
+        session.mount('http://', self.http_adapter)
+        session.mount('https://', self.http_adapter)
+
+    def _get_retry_policy(self, endpoint: Endpoint) -> RetryPolicy:
+        return self.retry_policies.get(endpoint, self.retry_policy)
+
+    def _get_cache_policy(self, endpoint: Endpoint, method: str) -> CachePolicy | None:
+        if self.cache is None or endpoint is None or method != 'GET':
+            return None
+
+        return self.cache_policies.get(endpoint)
+
+    def _get_cache_key(self, url: str, params: dict, method: str) -> str:
+        return f'{method} {url}?{urlencode(sorted(params.items()))}'
+
     def _validate_response(self, response):
         self._validate_response_code(response)
         self._validate_response_content_type(response)
@@ -384,3 +1312,8 @@ class ExplorerRequester:
 
     def _get_request_headers(self) -> dict:
         return {'User-Agent': self.request_user_agent}
+
+
+def _close_response(future: Future):
+    if future.exception() is None:
+        future.result().close()
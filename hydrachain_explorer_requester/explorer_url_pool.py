@@ -0,0 +1,171 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Iterable
+
+from hydrachain_explorer_requester.enum import LoadBalancing
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_EJECTION_SECONDS = 30.0
+# Weight of every observed latency in the moving average of the backend's latency
+LATENCY_SMOOTHING = 0.2
+
+
+@dataclass(eq=False)
+class ExplorerBackend:
+    """
+    An explorer instance of the ExplorerURLPool, together with the state the pool balances and ejects it by.
+    Backends are compared by identity, as two of them may hold equal state.
+    """
+    url: ExplorerURL
+    outstanding: int = 0
+    latency_seconds: float = None
+    consecutive_failures: int = 0
+    ejected_at: float = None
+    checking: bool = False
+    requests: int = 0
+    failures: int = 0
+
+    @property
+    def prefix(self) -> str:
+        return f'{self.url.domain}{self.url.base_path}'
+
+    def is_ejected(self) -> bool:
+        return self.ejected_at is not None
+
+
+class ExplorerURLPool:
+    """
+    Pool of explorer instances serving the same API, e.g. the public explorer and self-hosted mirrors,
+    which can be given to the requesters instead of a single ExplorerURL.
+
+    The URLs are built by the first backend and every attempt of a request is then sent to the backend picked by
+    the load balancing, so a retry after a failure goes to another backend when there is one.
+    A backend failing max_failures times in a row is ejected. After ejection_seconds it is health checked
+    via get_info and re-admitted once the check succeeds. While every backend is ejected, the requests are still sent
+    to the one ejected the longest ago, instead of failing without trying.
+    """
+
+    def __init__(self,
+                 urls: List[ExplorerURL],
+                 load_balancing: LoadBalancing = LoadBalancing.LEAST_OUTSTANDING,
+                 max_failures: int = DEFAULT_MAX_FAILURES,
+                 ejection_seconds: float = DEFAULT_EJECTION_SECONDS
+                 ):
+        """
+        :param max_failures: number of consecutive connection errors, timeouts or server errors, which eject a backend
+        :param ejection_seconds: time after which an ejected backend is health checked
+        """
+        if not urls:
+            raise ValueError('At least one explorer URL is required')
+
+        self.backends = [ExplorerBackend(url) for url in urls]
+        self.load_balancing = load_balancing
+        self.max_failures = max_failures
+        self.ejection_seconds = ejection_seconds
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        # The get_*_url functions are delegated to the first backend, whose prefix is then replaced by the picked backend's one
+        if name.startswith('get_') and name.endswith('_url'):
+            return getattr(self.backends[0].url, name)
+
+        raise AttributeError(name)
+
+    def acquire(self, excluded: Iterable[ExplorerBackend] = ()) -> ExplorerBackend:
+        """
+        Picks the backend of a request attempt, which must be released afterwards.
+
+        :param excluded: backends, which already failed the request and are avoided while there are others
+        """
+
+        with self._lock:
+            candidates = [backend for backend in self.backends if not backend.is_ejected() and backend not in excluded]
+            candidates = candidates or [backend for backend in self.backends if not backend.is_ejected()]
+
+            if candidates:
+                backend = min(candidates, key=self._get_load)
+            else:
+                backend = min(self.backends, key=lambda ejected_backend: ejected_backend.ejected_at)
+
+            backend.outstanding += 1
+            backend.requests += 1
+            return backend
+
+    def release(self, backend: ExplorerBackend, latency_seconds: float = None, failed: bool = False):
+        """
+        :param latency_seconds: the duration of the successful attempt
+        :param failed: the attempt failed to connect, timed out or received a server error
+        """
+
+        with self._lock:
+            backend.outstanding -= 1
+
+            if failed:
+                backend.failures += 1
+                backend.consecutive_failures += 1
+                if backend.consecutive_failures >= self.max_failures and not backend.is_ejected():
+                    backend.ejected_at = time.monotonic()
+                return
+
+            backend.consecutive_failures = 0
+            if latency_seconds is not None:
+                if backend.latency_seconds is None:
+                    backend.latency_seconds = latency_seconds
+                else:
+                    backend.latency_seconds += LATENCY_SMOOTHING * (latency_seconds - backend.latency_seconds)
+
+    def has_untried_backend(self, tried_backends: Iterable[ExplorerBackend]) -> bool:
+        with self._lock:
+            return any(not backend.is_ejected() and backend not in tried_backends for backend in self.backends)
+
+    def get_backends_to_check(self) -> List[ExplorerBackend]:
+        """
+        :return: the ejected backends, whose ejection has expired. They are reserved for the caller, which must finish their checks
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            backends = [backend for backend in self.backends
+                        if backend.is_ejected() and not backend.checking and now - backend.ejected_at >= self.ejection_seconds]
+
+            for backend in backends:
+                backend.checking = True
+
+            return backends
+
+    def finish_check(self, backend: ExplorerBackend, healthy: bool):
+        """
+        Re-admits the healthy backend, while the unhealthy one stays ejected for another ejection_seconds.
+        """
+
+        with self._lock:
+            backend.checking = False
+            if healthy:
+                backend.ejected_at = None
+                backend.consecutive_failures = 0
+            else:
+                backend.ejected_at = time.monotonic()
+
+    def rebase(self, url: str, backend: ExplorerBackend) -> str:
+        """
+        :return: the URL built by the first backend, pointing to the given backend instead
+        """
+
+        prefix = self.backends[0].prefix
+        if backend is self.backends[0] or not url.startswith(prefix):
+            return url
+
+        return backend.prefix + url[len(prefix):]
+
+    def _get_load(self, backend: ExplorerBackend) -> tuple:
+        """
+        Equally loaded backends are picked by their number of requests, so they take turns.
+        """
+
+        if self.load_balancing is LoadBalancing.LATENCY:
+            # Backends without a measured latency are preferred, so every backend gets measured
+            return (backend.latency_seconds or 0.0) * (backend.outstanding + 1), backend.requests
+
+        return backend.outstanding, backend.requests
@@ -0,0 +1,141 @@
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+# Fetching a single block or transaction is cheap for the explorer, while its latency is what the callers wait for
+HEDGED_ENDPOINTS = frozenset({Endpoint.BLOCK, Endpoint.TRANSACTION})
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_MAX_HEDGE_RATIO = 0.1
+DEFAULT_LATENCY_WINDOW = 1000
+DEFAULT_MIN_SAMPLES = 20
+
+# The hedged attempts are sent from a thread pool. An attempt waiting for a free thread would add to the latency,
+# which the hedging is meant to cut, so the pool is sized well above the usual number of concurrent requests.
+MAX_HEDGING_THREADS = 256
+
+
+@dataclass
+class HedgingStatistics:
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    hedges_over_budget: int = 0
+
+
+class _LatencyWindow:
+    """
+    The latest latencies of an endpoint, whose percentile is recomputed only after a twentieth of the window has changed.
+    """
+
+    def __init__(self, size: int):
+        self.latencies = deque(maxlen=size)
+        self.threshold_seconds = None
+        self._changes = 0
+
+    def record(self, latency_seconds: float):
+        self.latencies.append(latency_seconds)
+        self._changes += 1
+
+    def get_percentile(self, percentile: float) -> float:
+        if self.threshold_seconds is None or self._changes * 20 >= self.latencies.maxlen:
+            ordered = sorted(self.latencies)
+            self.threshold_seconds = ordered[min(len(ordered) - 1, math.ceil(percentile / 100 * len(ordered)) - 1)]
+            self._changes = 0
+
+        return self.threshold_seconds
+
+
+class HedgingPolicy:
+    """
+    Decides when a request is hedged: when it hasn't completed within the given percentile of its endpoint's recent latencies,
+    a duplicate of it is sent and whichever of them completes first is used.
+
+    The hedges are capped by a budget, which grows by max_hedge_ratio with every request, so they add at most that share of load.
+    The endpoints are hedged only once min_samples of their latencies have been observed.
+    A policy can be shared between requesters, which then share its latencies and budget.
+    """
+
+    def __init__(self,
+                 percentile: float = DEFAULT_HEDGE_PERCENTILE,
+                 max_hedge_ratio: float = DEFAULT_MAX_HEDGE_RATIO,
+                 min_delay_seconds: float = 0.0,
+                 endpoints: frozenset = HEDGED_ENDPOINTS,
+                 latency_window: int = DEFAULT_LATENCY_WINDOW,
+                 min_samples: int = DEFAULT_MIN_SAMPLES,
+                 max_budget: float = 10.0
+                 ):
+        """
+        :param percentile: percentile of the latencies, after which a request is hedged
+        :param max_hedge_ratio: maximum number of hedges per request
+        :param min_delay_seconds: minimum time before a request is hedged, regardless of the percentile
+        :param endpoints: the hedged endpoints, defaults to HEDGED_ENDPOINTS
+        :param latency_window: number of the latest latencies per endpoint, from which the percentile is computed
+        :param max_budget: maximum number of hedges, which can be saved up while the requests are fast
+        """
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay_seconds = min_delay_seconds
+        self.endpoints = endpoints
+        self.latency_window = latency_window
+        self.min_samples = min_samples
+        self.max_budget = max_budget
+
+        self._lock = threading.Lock()
+        self._windows: Dict[Endpoint, _LatencyWindow] = {}
+        self._budget = 0.0
+        self._statistics = HedgingStatistics()
+
+    def get_delay_seconds(self, endpoint: Endpoint) -> float | None:
+        """
+        Called once per request, which is also what grows the budget.
+
+        :return: the time after which the request should be hedged, None if it shouldn't be
+        """
+
+        if endpoint not in self.endpoints:
+            return None
+
+        with self._lock:
+            self._statistics.requests += 1
+            self._budget = min(self._budget + self.max_hedge_ratio, self.max_budget)
+
+            window = self._windows.get(endpoint)
+            if window is None or len(window.latencies) < self.min_samples:
+                return None
+
+            return max(window.get_percentile(self.percentile), self.min_delay_seconds)
+
+    def record_latency(self, endpoint: Endpoint, latency_seconds: float):
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = self._windows[endpoint] = _LatencyWindow(self.latency_window)
+
+            window.record(latency_seconds)
+
+    def try_acquire_hedge(self) -> bool:
+        """
+        :return: whether the budget allows one more hedge, which is then spent
+        """
+
+        with self._lock:
+            if self._budget < 1.0:
+                self._statistics.hedges_over_budget += 1
+                return False
+
+            self._budget -= 1.0
+            self._statistics.hedges += 1
+            return True
+
+    def record_hedge_win(self):
+        with self._lock:
+            self._statistics.hedge_wins += 1
+
+    def statistics(self) -> HedgingStatistics:
+        with self._lock:
+            return HedgingStatistics(**vars(self._statistics))
@@ -0,0 +1,61 @@
+import json
+from typing import Callable, Any
+
+import requests
+
+JSONDecoder = Callable[[bytes], Any]
+
+try:
+    # msgspec's decode error, unlike the others, isn't a ValueError
+    import msgspec
+    _DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+except ImportError:
+    _DECODE_ERRORS = (ValueError,)
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    return json.loads(content)
+
+
+def raw_decoder(content: bytes) -> bytes:
+    """
+    Skips the decoding and returns the undecoded body, for callers which only persist or forward the responses.
+    The functions post-processing the decoded response (as_model, iter_, merging the chunks of get_transactions) can't be used with it.
+    """
+
+    return content
+
+
+def get_default_json_decoder() -> JSONDecoder:
+    """
+    :return: the fastest installed decoder, trying orjson, then msgspec and falling back to the standard library
+    """
+
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+        return msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+
+    return stdlib_decoder
+
+
+def decode_json(json_decoder: JSONDecoder, content: bytes) -> Any:
+    """
+    Decodes the body with the decoder, raising requests.JSONDecodeError for an invalid one whichever the decoder is,
+    as response.json() does.
+    """
+
+    try:
+        return json_decoder(content)
+    except requests.JSONDecodeError:
+        raise
+    except _DECODE_ERRORS as error:
+        document = content.decode('utf-8', errors='replace') if isinstance(content, (bytes, bytearray)) else str(content)
+        raise requests.JSONDecodeError(str(error), document, getattr(error, 'pos', 0) or 0) from error
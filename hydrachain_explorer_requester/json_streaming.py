@@ -0,0 +1,260 @@
+import re
+from typing import Iterator, Iterable
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",:\\]')
+_CONTAINER_SPECIAL = re.compile(rb'[\[\]{}"\\]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_ITEM_START = re.compile(rb'[^\s,]')
+_SCALAR_END = re.compile(rb'[\s,\]]')
+
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_OPENING = (ord('['), ord('{'))
+_CLOSING = (ord(']'), ord('}'))
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally extracts the items of a JSON array from a body received in chunks,
+    without decoding or holding the whole body. The array is either the body itself or the value of one of its top-level keys.
+
+    Every item is returned as soon as its last byte has been fed, as the undecoded bytes of the item.
+    Only the bytes of the item currently being received are buffered.
+    """
+
+    def __init__(self, items_key: str = None):
+        """
+        :param items_key: the top-level key holding the array, None when the body itself is the array
+        """
+        self.items_key = items_key.encode() if items_key is not None else None
+        self.done = False
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._in_array = False
+
+        # State of seeking the array
+        self._depth = 0
+        self._in_string = False
+        self._string_start = None
+        self._expecting_key = False
+        self._last_key = None
+        self._value_of_items_key = False
+
+        # State of the item currently being received
+        self._item_start = None
+        self._item_kind = None
+        self._item_depth = 0
+        self._item_in_string = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        :return: the items completed by the chunk
+        """
+
+        if self.done:
+            return []
+
+        self._buffer += chunk
+        items = []
+
+        if not self._in_array:
+            self._seek_array()
+        if self._in_array:
+            self._scan_items(items)
+
+        self._compact()
+        return items
+
+    def _seek_array(self):
+        """
+        Walks the body until the opening bracket of the array, tracking the nesting and the top-level keys on the way.
+        """
+
+        buffer = self._buffer
+
+        while True:
+            match = (_STRING_SPECIAL if self._in_string else _STRUCTURAL).search(buffer, self._position)
+            if match is None:
+                self._position = len(buffer)
+                return
+
+            character = buffer[match.start()]
+            self._position = match.end()
+
+            if character == _BACKSLASH:
+                if self._position >= len(buffer):
+                    self._position = match.start()
+                    return
+                self._position += 1
+                continue
+
+            if self._in_string:
+                self._in_string = False
+                if self._depth == 1 and self._expecting_key:
+                    self._last_key = bytes(buffer[self._string_start + 1:match.start()])
+                    self._expecting_key = False
+                self._string_start = None
+                continue
+
+            if character == _QUOTE:
+                self._in_string = True
+                self._string_start = match.start()
+            elif character in _OPENING:
+                if character == ord('[') and (self._depth == 0 and self.items_key is None
+                                              or self._depth == 1 and self._value_of_items_key):
+                    self._in_array = True
+                    return
+
+                self._depth += 1
+                self._expecting_key = self._depth == 1 and character == ord('{')
+            elif character in _CLOSING:
+                self._depth -= 1
+                if self._depth <= 0:
+                    self.done = True
+                    return
+            elif character == ord(',') and self._depth == 1:
+                self._expecting_key = True
+                self._value_of_items_key = False
+            elif character == ord(':') and self._depth == 1:
+                self._value_of_items_key = self._last_key == self.items_key
+
+    def _scan_items(self, items: list):
+        buffer = self._buffer
+
+        while True:
+            if self._item_kind is None:
+                match = _ITEM_START.search(buffer, self._position)
+                if match is None:
+                    self._position = len(buffer)
+                    return
+
+                character = buffer[match.start()]
+                if character in _CLOSING:
+                    self.done = True
+                    return
+
+                self._item_start = match.start()
+                self._position = match.end()
+                if character in _OPENING:
+                    self._item_kind = 'container'
+                    self._item_depth = 1
+                    self._item_in_string = False
+                elif character == _QUOTE:
+                    self._item_kind = 'string'
+                else:
+                    self._item_kind = 'scalar'
+
+            if self._item_kind == 'container':
+                end = self._scan_container()
+            elif self._item_kind == 'string':
+                end = self._scan_string()
+            else:
+                end = self._scan_scalar()
+
+            if end is None:
+                return
+
+            items.append(bytes(buffer[self._item_start:end]))
+            self._item_start = None
+            self._item_kind = None
+
+    def _scan_container(self) -> int | None:
+        """
+        :return: the end of the object or array item, None if it hasn't been fully received yet
+        """
+
+        buffer = self._buffer
+        search = _CONTAINER_SPECIAL.search
+        position = self._position
+        depth = self._item_depth
+        in_string = self._item_in_string
+
+        while True:
+            match = search(buffer, position)
+            if match is None:
+                self._position, self._item_depth, self._item_in_string = len(buffer), depth, in_string
+                return None
+
+            character = buffer[match.start()]
+            position = match.end()
+
+            if character == _BACKSLASH:
+                if position >= len(buffer):
+                    self._position, self._item_depth, self._item_in_string = match.start(), depth, in_string
+                    return None
+                position += 1
+            elif character == _QUOTE:
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif character in _OPENING:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._position = position
+                    return position
+
+    def _scan_string(self) -> int | None:
+        buffer = self._buffer
+
+        while True:
+            match = _STRING_SPECIAL.search(buffer, self._position)
+            if match is None:
+                self._position = len(buffer)
+                return None
+
+            if buffer[match.start()] == _BACKSLASH:
+                if match.end() >= len(buffer):
+                    self._position = match.start()
+                    return None
+                self._position = match.end() + 1
+                continue
+
+            self._position = match.end()
+            return self._position
+
+    def _scan_scalar(self) -> int | None:
+        """
+        Numbers, booleans and nulls end with the first whitespace, comma or closing bracket after them.
+        """
+
+        match = _SCALAR_END.search(self._buffer, self._position)
+        if match is None:
+            self._position = len(self._buffer)
+            return None
+
+        self._position = match.start()
+        return self._position
+
+    def _compact(self):
+        """
+        Drops the already scanned bytes, which aren't part of an item or key still being received.
+        """
+
+        keep_from = min(
+            position for position in (self._item_start, self._string_start, self._position) if position is not None
+        )
+
+        if keep_from > 0:
+            del self._buffer[:keep_from]
+            self._position -= keep_from
+            if self._item_start is not None:
+                self._item_start -= keep_from
+            if self._string_start is not None:
+                self._string_start -= keep_from
+
+
+def iterate_json_array_items(chunks: Iterable[bytes], items_key: str = None) -> Iterator[bytes]:
+    """
+    Yields the undecoded items of the JSON array while the chunks of the body are still being received.
+    """
+
+    parser = JSONArrayStreamParser(items_key)
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+        if parser.done:
+            return
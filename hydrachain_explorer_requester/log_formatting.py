@@ -0,0 +1,17 @@
+DEFAULT_LOG_BODY_LIMIT = 1024
+
+
+def format_content(content: bytes, limit: int | None = DEFAULT_LOG_BODY_LIMIT) -> str:
+    """
+    Formats a response body for logging, truncated to at most limit bytes.
+
+    :param limit: 0 for omitting the body, None for the whole body
+    """
+
+    if limit is None or len(content) <= limit:
+        return str(content)
+
+    if limit == 0:
+        return f'<{len(content)} bytes omitted>'
+
+    return f'{content[:limit]}... <{len(content) - limit} more bytes truncated>'
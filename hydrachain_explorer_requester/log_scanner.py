@@ -0,0 +1,189 @@
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, replace
+from typing import Iterator, List
+
+import requests
+
+from hydrachain_explorer_requester.concurrency import DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.models import LogEntry
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+from hydrachain_explorer_requester.retry import RetryPolicy
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_SUB_RANGE_BLOCKS = 10000
+DEFAULT_MAX_LOGS_PER_REQUEST = 1000
+# A sub-range is halved at most this many times, into at most 1024 parts
+DEFAULT_MAX_SPLIT_DEPTH = 10
+
+
+class _SubRangeTooLarge(Exception):
+    pass
+
+
+@dataclass
+class _SubRange:
+    from_block: int
+    to_block: int
+    depth: int
+    future: Future = None
+
+    def can_split(self, max_split_depth: int) -> bool:
+        return self.from_block < self.to_block and self.depth < max_split_depth
+
+    def split(self) -> tuple['_SubRange', '_SubRange']:
+        middle = (self.from_block + self.to_block) // 2
+        return _SubRange(self.from_block, middle, self.depth + 1), _SubRange(middle + 1, self.to_block, self.depth + 1)
+
+
+class LogScanner:
+    """
+    Scans the contract logs of a wide block range via get_search_logs, by splitting it into sub-ranges requested concurrently.
+
+    A sub-range is requested at once, as a single page of up to max_logs_per_request logs. When it holds more logs,
+    or the explorer times out while reading it, it is halved and both halves are requested instead.
+    A single block holding more logs is paginated. The halving stops at max_split_depth, after which the error is raised.
+    The requests of the sub-ranges, which can still be halved, aren't retried after a timeout, as they are halved instead.
+
+    The logs are yielded ordered by their block and, within a block, by their log index. The search logs don't hold
+    the log index, but the explorer returns them in its order, which the filtered responses keep.
+    """
+
+    def __init__(self,
+                 explorer_requester: ExplorerRequester,
+                 sub_range_blocks: int = DEFAULT_SUB_RANGE_BLOCKS,
+                 max_logs_per_request: int = DEFAULT_MAX_LOGS_PER_REQUEST,
+                 max_split_depth: int = DEFAULT_MAX_SPLIT_DEPTH,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 logger: logging = _logger
+                 ):
+        """
+        :param sub_range_blocks: number of blocks of the initial sub-ranges
+        :param max_logs_per_request: page size of the requests, above which a sub-range is halved
+        :param max_split_depth: maximum number of times the same initial sub-range is halved
+        :param concurrency: maximum number of sub-ranges being requested at a time
+        """
+        if sub_range_blocks < 1:
+            raise ValueError(f'Sub-range blocks must be positive, but was {sub_range_blocks}')
+
+        self.explorer_requester = explorer_requester
+        self.sub_range_blocks = sub_range_blocks
+        self.max_logs_per_request = max_logs_per_request
+        self.max_split_depth = max_split_depth
+        self.concurrency = concurrency
+        self.logger = logger
+
+    def scan(self,
+             from_block: int,
+             to_block: int,
+             query_parameters: SearchLogsQueryParameters = SearchLogsQueryParameters(),
+             as_model: bool = False
+             ) -> Iterator[dict | LogEntry]:
+        """
+        At most `concurrency` sub-ranges, and their halves, are held in memory at a time.
+
+        :param to_block: inclusive
+        :param query_parameters: the contract, topic and time filters. Their blocks and pagination are ignored
+        :param as_model: yield compact LogEntry instead of the raw logs
+        """
+
+        initial_sub_ranges = (_SubRange(start, min(start + self.sub_range_blocks - 1, to_block), 0)
+                              for start in range(from_block, to_block + 1, self.sub_range_blocks))
+        sub_ranges: List[_SubRange] = []
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='explorer-log-scanner')
+        try:
+            while True:
+                while len(sub_ranges) < self.concurrency:
+                    sub_range = next(initial_sub_ranges, None)
+                    if sub_range is None:
+                        break
+
+                    sub_ranges.append(self._submit(executor, sub_range, query_parameters))
+
+                if not sub_ranges:
+                    return
+
+                if not sub_ranges[0].future.done():
+                    wait([sub_range.future for sub_range in sub_ranges if not sub_range.future.done()], return_when=FIRST_COMPLETED)
+
+                # One snapshot of the completed sub-ranges serves both passes, so a head completing in between isn't
+                # yielded without being checked for halving first
+                head = sub_ranges[0]
+                done = [sub_range.future.done() for sub_range in sub_ranges]
+
+                # Halving the completed sub-ranges right away, not only once they reach the head, keeps the halves concurrent
+                for index in reversed(range(len(sub_ranges))):
+                    sub_range = sub_ranges[index]
+                    if done[index] and self._should_split(sub_range):
+                        sub_ranges[index:index + 1] = [self._submit(executor, half, query_parameters) for half in sub_range.split()]
+
+                if done[0] and sub_ranges[0] is head:
+                    sub_ranges.pop(0)
+
+                    for log in head.future.result():
+                        yield LogEntry.from_json(log) if as_model else log
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self,
+                executor: ThreadPoolExecutor,
+                sub_range: _SubRange,
+                query_parameters: SearchLogsQueryParameters
+                ) -> _SubRange:
+        sub_range.future = executor.submit(self._request_sub_range, sub_range, query_parameters)
+        return sub_range
+
+    def _should_split(self, sub_range: _SubRange) -> bool:
+        error = sub_range.future.exception()
+        if not isinstance(error, (_SubRangeTooLarge, requests.ReadTimeout)) or not sub_range.can_split(self.max_split_depth):
+            return False
+
+        self.logger.debug(f'Halving the logs of the blocks {sub_range.from_block} to {sub_range.to_block} after {error!r}')
+        return True
+
+    def _get_halving_retry_policy(self) -> RetryPolicy:
+        """
+        :return: the retry policy of the search logs, without the retries after a timeout
+        """
+
+        retry_policy = self.explorer_requester.retry_policies.get(Endpoint.SEARCH_LOGS, self.explorer_requester.retry_policy)
+        return replace(retry_policy, retry_timeouts=False)
+
+    def _request_sub_range(self,
+                           sub_range: _SubRange,
+                           query_parameters: SearchLogsQueryParameters
+                           ) -> list:
+        """
+        :raises _SubRangeTooLarge: when the sub-range holds more logs than a single request returns and can still be halved
+        """
+
+        query_parameters = copy.deepcopy(query_parameters)
+        query_parameters.set_from_block(sub_range.from_block)
+        query_parameters.set_to_block(sub_range.to_block)
+        query_parameters.set_limit(None)
+        query_parameters.set_offset(None)
+        query_parameters.set_from(None)
+        query_parameters.set_to(None)
+        query_parameters.set_page(0)
+        query_parameters.set_page_size(self.max_logs_per_request)
+
+        can_split = sub_range.can_split(self.max_split_depth)
+        retry_policy = self._get_halving_retry_policy() if can_split else None
+
+        response = self.explorer_requester.get_search_logs(query_parameters, retry_policy=retry_policy)
+        logs = response['logs']
+
+        if response['totalCount'] > len(logs):
+            if can_split:
+                raise _SubRangeTooLarge(f'{response["totalCount"]} logs')
+
+            logs = list(self.explorer_requester.iter_search_logs(query_parameters, page_size=self.max_logs_per_request))
+
+        # The position in the response stands for the log index within the block
+        return [log for _, _, log in sorted((log['blockHeight'], index, log) for index, log in enumerate(logs))]
+
@@ -0,0 +1,232 @@
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+# Upper bounds of the latency histogram buckets, the last bucket holding everything above them
+DEFAULT_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+DEFAULT_PROMETHEUS_PREFIX = 'hydrachain_explorer'
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Counts of the latencies per bucket, the count at index i being the latencies up to bounds[i]
+    and above the previous bound. The last count holds the latencies above every bound.
+    """
+    bounds: Tuple[float, ...]
+    counts: List[int]
+    count: int = 0
+    sum_seconds: float = 0.0
+
+    def get_percentile(self, percentile: float) -> float | None:
+        """
+        Estimates the percentile by interpolating within its bucket.
+        Latencies above the last bound are estimated as the last bound.
+
+        :return: None if no latency has been observed
+        """
+
+        if not self.count:
+            return None
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                return lower + (self.bounds[index] - lower) * (rank - cumulative) / bucket_count
+
+            cumulative += bucket_count
+
+        return self.bounds[-1]
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Snapshot of the metrics of one endpoint.
+
+    The latency is the network time of a request: from sending it until its body is received, including its retries
+    and rate limiting. Streamed responses are timed until their headers are received.
+    The decode time is the time spent parsing the JSON bodies. Requests served from the cache are counted only as cache hits.
+    """
+    latency: LatencyHistogram
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    bytes_received: int = 0
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+class _EndpointCounters:
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.latency_counts = [0] * (len(bounds) + 1)
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_received = 0
+        self.network_seconds = 0.0
+        self.decode_seconds = 0.0
+
+    def snapshot(self) -> EndpointMetrics:
+        return EndpointMetrics(
+            latency=LatencyHistogram(self.bounds, list(self.latency_counts), self.requests, self.network_seconds),
+            requests=self.requests,
+            errors=self.errors,
+            retries=self.retries,
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+            bytes_received=self.bytes_received,
+            network_seconds=self.network_seconds,
+            decode_seconds=self.decode_seconds
+        )
+
+
+class RequestMetrics:
+    """
+    Collects the metrics of the requests per endpoint: latency histograms, received bytes, network versus decode time,
+    retries, cache hits and misses, and errors. A request is counted as an error when it raises,
+    or when its response has a status code other than 200 or a body, which can't be decoded.
+
+    Requests made without an endpoint are collected under None.
+    One instance can be shared by many requesters, threads and async tasks.
+    """
+
+    def __init__(self, latency_buckets_seconds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_SECONDS):
+        """
+        :param latency_buckets_seconds: ascending upper bounds of the latency histogram buckets
+        """
+        self.latency_buckets_seconds = tuple(latency_buckets_seconds)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Endpoint | None, _EndpointCounters] = {}
+
+    def record_request(self, endpoint: Endpoint | None, network_seconds: float, bytes_received: int, failed: bool = False):
+        bucket = bisect.bisect_left(self.latency_buckets_seconds, network_seconds)
+
+        with self._lock:
+            counters = self._get_counters(endpoint)
+            counters.requests += 1
+            counters.latency_counts[bucket] += 1
+            counters.network_seconds += network_seconds
+            counters.bytes_received += bytes_received
+            if failed:
+                counters.errors += 1
+
+    def record_decode(self, endpoint: Endpoint | None, decode_seconds: float, failed: bool = False):
+        with self._lock:
+            counters = self._get_counters(endpoint)
+            counters.decode_seconds += decode_seconds
+            if failed:
+                counters.errors += 1
+
+    def record_received_bytes(self, endpoint: Endpoint | None, bytes_received: int):
+        """
+        Records the bytes of a streamed response, which are counted only once its body has been iterated.
+        """
+
+        with self._lock:
+            self._get_counters(endpoint).bytes_received += bytes_received
+
+    def record_retry(self, endpoint: Endpoint | None):
+        with self._lock:
+            self._get_counters(endpoint).retries += 1
+
+    def record_cache_hit(self, endpoint: Endpoint | None):
+        with self._lock:
+            self._get_counters(endpoint).cache_hits += 1
+
+    def record_cache_miss(self, endpoint: Endpoint | None):
+        with self._lock:
+            self._get_counters(endpoint).cache_misses += 1
+
+    def snapshot(self) -> Dict[Endpoint | None, EndpointMetrics]:
+        """
+        :return: the metrics of the endpoints, which have been requested so far
+        """
+
+        with self._lock:
+            return {endpoint: counters.snapshot() for endpoint, counters in self._endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus_text(self, prefix: str = DEFAULT_PROMETHEUS_PREFIX) -> str:
+        """
+        :return: the metrics in the Prometheus text exposition format, labeled by endpoint
+        """
+
+        return format_prometheus_text(self.snapshot(), prefix)
+
+    def _get_counters(self, endpoint: Endpoint | None) -> _EndpointCounters:
+        counters = self._endpoints.get(endpoint)
+        if counters is None:
+            counters = self._endpoints[endpoint] = _EndpointCounters(self.latency_buckets_seconds)
+
+        return counters
+
+
+# Name, help and the EndpointMetrics attribute of the exported counters
+_PROMETHEUS_COUNTERS = (
+    ('requests_total', 'Requests sent to the explorer', 'requests'),
+    ('errors_total', 'Requests, which failed or responded with an error', 'errors'),
+    ('retries_total', 'Retried request attempts', 'retries'),
+    ('cache_hits_total', 'Requests served from the cache', 'cache_hits'),
+    ('cache_misses_total', 'Cacheable requests not found in the cache', 'cache_misses'),
+    ('received_bytes_total', 'Bytes of the received response bodies', 'bytes_received'),
+    ('decode_seconds_total', 'Time spent decoding the JSON response bodies', 'decode_seconds'),
+)
+
+
+def format_prometheus_text(metrics: Dict[Endpoint | None, EndpointMetrics], prefix: str = DEFAULT_PROMETHEUS_PREFIX) -> str:
+    """
+    :param metrics: a snapshot of the RequestMetrics
+    """
+
+    labels = {endpoint: endpoint.value if endpoint is not None else 'unknown' for endpoint in metrics}
+    endpoints = sorted(metrics, key=labels.get)
+    lines = []
+
+    name = f'{prefix}_request_duration_seconds'
+    lines.append(f'# HELP {name} Network time of the requests, including their retries')
+    lines.append(f'# TYPE {name} histogram')
+    for endpoint in endpoints:
+        latency = metrics[endpoint].latency
+        cumulative = 0
+        for bound, bucket_count in zip(latency.bounds + (float('inf'),), latency.counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{endpoint="{labels[endpoint]}",le="{_format_bound(bound)}"}} {cumulative}')
+
+        lines.append(f'{name}_sum{{endpoint="{labels[endpoint]}"}} {latency.sum_seconds!r}')
+        lines.append(f'{name}_count{{endpoint="{labels[endpoint]}"}} {latency.count}')
+
+    for counter_name, counter_help, attribute in _PROMETHEUS_COUNTERS:
+        name = f'{prefix}_{counter_name}'
+        lines.append(f'# HELP {name} {counter_help}')
+        lines.append(f'# TYPE {name} counter')
+        for endpoint in endpoints:
+            lines.append(f'{name}{{endpoint="{labels[endpoint]}"}} {getattr(metrics[endpoint], attribute)!r}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(bound)
@@ -0,0 +1,17 @@
+__all__ = [
+    'AddressSummary',
+    'Block',
+    'LogEntry',
+    'TokenInfo',
+    'Transaction',
+    'TransactionInput',
+    'TransactionOutput',
+    'UTXO',
+]
+
+from .address_summary import AddressSummary
+from .block import Block
+from .log_entry import LogEntry
+from .token_info import TokenInfo
+from .transaction import Transaction, TransactionInput, TransactionOutput
+from .utxo import UTXO
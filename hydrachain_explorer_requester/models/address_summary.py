@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True)
+class AddressSummary:
+    """
+    Compact representation of the explorer's address response. The token balances are kept in their raw form.
+    """
+    balance: str = None
+    total_received: str = None
+    total_sent: str = None
+    unconfirmed: str = None
+    staking: str = None
+    mature: str = None
+    ranking: int = None
+    transaction_count: int = None
+    blocks_mined: int = None
+    qrc20_balances: List[dict] = field(default_factory=list)
+
+    @staticmethod
+    def from_json(data: dict) -> 'AddressSummary':
+        return AddressSummary(
+            balance=data.get('balance'),
+            total_received=data.get('totalReceived'),
+            total_sent=data.get('totalSent'),
+            unconfirmed=data.get('unconfirmed'),
+            staking=data.get('staking'),
+            mature=data.get('mature'),
+            ranking=data.get('ranking'),
+            transaction_count=data.get('transactionCount'),
+            blocks_mined=data.get('blocksMined'),
+            qrc20_balances=data.get('qrc20Balances') or []
+        )
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True)
+class Block:
+    """
+    Compact representation of the explorer's block response. The transactions are the ids of the block's transactions.
+    """
+    hash: str
+    height: int
+    prev_hash: str = None
+    next_hash: str = None
+    merkle_root: str = None
+    timestamp: int = None
+    size: int = None
+    weight: int = None
+    interval: int = None
+    miner: str = None
+    difficulty: float = None
+    reward: str = None
+    confirmations: int = None
+    transactions: List[str] = field(default_factory=list)
+
+    @staticmethod
+    def from_json(data: dict) -> 'Block':
+        return Block(
+            hash=data.get('hash'),
+            height=data.get('height'),
+            prev_hash=data.get('prevHash'),
+            next_hash=data.get('nextHash'),
+            merkle_root=data.get('merkleRoot'),
+            timestamp=data.get('timestamp'),
+            size=data.get('size'),
+            weight=data.get('weight'),
+            interval=data.get('interval'),
+            miner=data.get('miner'),
+            difficulty=data.get('difficulty'),
+            reward=data.get('reward'),
+            confirmations=data.get('confirmations'),
+            transactions=data.get('transactions') or []
+        )
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """
+    A single contract event log of the explorer's search logs response.
+    """
+    transaction_id: str
+    output_index: int = None
+    block_height: int = None
+    sender: str = None
+    contract_address: str = None
+    address: str = None
+    topics: List[str] = field(default_factory=list)
+    data: str = None
+
+    @staticmethod
+    def from_json(data: dict) -> 'LogEntry':
+        return LogEntry(
+            transaction_id=data.get('transactionId'),
+            output_index=data.get('outputIndex'),
+            block_height=data.get('blockHeight'),
+            sender=data.get('sender'),
+            contract_address=data.get('contractAddress'),
+            address=data.get('address'),
+            topics=data.get('topics') or [],
+            data=data.get('data')
+        )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TokenInfo:
+    """
+    A single QRC20 token of the explorer's tokens response.
+    """
+    address: str
+    address_hex: str = None
+    name: str = None
+    symbol: str = None
+    decimals: int = None
+    total_supply: str = None
+    version: str = None
+    holders: int = None
+    transactions: int = None
+
+    @staticmethod
+    def from_json(data: dict) -> 'TokenInfo':
+        return TokenInfo(
+            address=data.get('address'),
+            address_hex=data.get('addressHex'),
+            name=data.get('name'),
+            symbol=data.get('symbol'),
+            decimals=data.get('decimals'),
+            total_supply=data.get('totalSupply'),
+            version=data.get('version'),
+            holders=data.get('holders'),
+            transactions=data.get('transactions')
+        )
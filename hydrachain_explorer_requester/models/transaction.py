@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True)
+class TransactionInput:
+    prev_transaction_id: str = None
+    output_index: int = None
+    value: str = None
+    address: str = None
+    sequence: int = None
+
+    @staticmethod
+    def from_json(data: dict) -> 'TransactionInput':
+        return TransactionInput(
+            prev_transaction_id=data.get('prevTxId'),
+            output_index=data.get('outputIndex'),
+            value=data.get('value'),
+            address=data.get('address'),
+            sequence=data.get('sequence')
+        )
+
+
+@dataclass(slots=True)
+class TransactionOutput:
+    value: str = None
+    address: str = None
+    script_type: str = None
+    spent_transaction_id: str = None
+    spent_index: int = None
+    receipt: dict = None
+
+    @staticmethod
+    def from_json(data: dict) -> 'TransactionOutput':
+        return TransactionOutput(
+            value=data.get('value'),
+            address=data.get('address'),
+            script_type=(data.get('scriptPubKey') or {}).get('type'),
+            spent_transaction_id=data.get('spentTxId'),
+            spent_index=data.get('spentIndex'),
+            receipt=data.get('receipt')
+        )
+
+
+@dataclass(slots=True)
+class Transaction:
+    """
+    Compact representation of the explorer's transaction response.
+    The inputs and outputs are kept in their raw form and are materialized only when first accessed.
+    """
+    id: str
+    hash: str = None
+    block_hash: str = None
+    block_height: int = None
+    confirmations: int = None
+    timestamp: int = None
+    is_coinbase: bool = False
+    is_coinstake: bool = False
+    input_value: str = None
+    output_value: str = None
+    fees: str = None
+    size: int = None
+    weight: int = None
+    _raw_inputs: List[dict] = field(default=None, repr=False)
+    _raw_outputs: List[dict] = field(default=None, repr=False)
+    _inputs: List[TransactionInput] = field(default=None, repr=False)
+    _outputs: List[TransactionOutput] = field(default=None, repr=False)
+
+    @property
+    def inputs(self) -> List[TransactionInput]:
+        if self._inputs is None:
+            self._inputs = [TransactionInput.from_json(raw_input) for raw_input in self._raw_inputs or []]
+            self._raw_inputs = None
+
+        return self._inputs
+
+    @property
+    def outputs(self) -> List[TransactionOutput]:
+        if self._outputs is None:
+            self._outputs = [TransactionOutput.from_json(raw_output) for raw_output in self._raw_outputs or []]
+            self._raw_outputs = None
+
+        return self._outputs
+
+    @staticmethod
+    def from_json(data: dict) -> 'Transaction':
+        return Transaction(
+            id=data.get('id'),
+            hash=data.get('hash'),
+            block_hash=data.get('blockHash'),
+            block_height=data.get('blockHeight'),
+            confirmations=data.get('confirmations'),
+            timestamp=data.get('timestamp'),
+            is_coinbase=data.get('isCoinbase', False),
+            is_coinstake=data.get('isCoinstake', False),
+            input_value=data.get('inputValue'),
+            output_value=data.get('outputValue'),
+            fees=data.get('fees'),
+            size=data.get('size'),
+            weight=data.get('weight'),
+            _raw_inputs=data.get('inputs'),
+            _raw_outputs=data.get('outputs')
+        )
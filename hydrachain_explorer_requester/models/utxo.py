@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class UTXO:
+    transaction_id: str
+    output_index: int
+    address: str = None
+    value: str = None
+    script_pub_key: str = None
+    is_stake: bool = False
+    block_height: int = None
+    confirmations: int = None
+
+    @staticmethod
+    def from_json(data: dict) -> 'UTXO':
+        return UTXO(
+            transaction_id=data.get('transactionId'),
+            output_index=data.get('outputIndex'),
+            address=data.get('address'),
+            value=data.get('value'),
+            script_pub_key=data.get('scriptPubKey'),
+            is_stake=data.get('isStake', False),
+            block_height=data.get('blockHeight'),
+            confirmations=data.get('confirmations')
+        )
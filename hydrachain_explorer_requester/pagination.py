@@ -0,0 +1,168 @@
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Any, TypeVar, Awaitable, AsyncIterator
+
+from hydrachain_explorer_requester.query_parameters import PaginationQueryParameters
+
+DEFAULT_PAGE_SIZE = 100
+
+P = TypeVar('P', bound=PaginationQueryParameters)
+
+
+def iterate_pages(request_page: Callable[[int], Any],
+                  is_last_page: Callable[[Any, int], bool],
+                  first_page: int = 0,
+                  prefetch: bool = False
+                  ) -> Iterator[Any]:
+    """
+    Yields the responses of consecutive pages, starting from the first page until the last page is reached.
+    Only the current page, and the next one when prefetching, are held in memory.
+
+    :param request_page: requests the page with the given number
+    :param is_last_page: decides whether the given response of the given page number is the last one
+    :param prefetch: request the next page in the background, while the current one is being processed
+    """
+
+    if not prefetch:
+        page = first_page
+        while True:
+            response = request_page(page)
+            yield response
+
+            if is_last_page(response, page):
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='explorer-prefetch')
+    try:
+        page = first_page
+        future = executor.submit(request_page, page)
+        while future is not None:
+            response = future.result()
+
+            future = None
+            if not is_last_page(response, page):
+                page += 1
+                future = executor.submit(request_page, page)
+
+            yield response
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiterate_pages(request_page: Callable[[int], Awaitable[Any]],
+                         is_last_page: Callable[[Any, int], bool],
+                         first_page: int = 0,
+                         prefetch: bool = False
+                         ) -> AsyncIterator[Any]:
+    """
+    Asyncio counterpart of iterate_pages. The prefetched page is requested by a task on the running event loop.
+    """
+
+    page = first_page
+    next_page_task = None
+    try:
+        response = await request_page(page)
+        while True:
+            last_page = is_last_page(response, page)
+            if prefetch and not last_page:
+                next_page_task = asyncio.ensure_future(request_page(page + 1))
+
+            yield response
+
+            if last_page:
+                return
+            page += 1
+
+            if next_page_task is not None:
+                response = await next_page_task
+                next_page_task = None
+            else:
+                response = await request_page(page)
+    finally:
+        if next_page_task is not None:
+            next_page_task.cancel()
+
+
+def iterate_paginated(request: Callable[[P], dict],
+                      query_parameters: P,
+                      items_key: str,
+                      page_size: int = None,
+                      prefetch: bool = False
+                      ) -> Iterator[Any]:
+    """
+    Yields the items of a paginated explorer response, walking through all of its pages.
+    The given query parameters are not modified. Their page and page size are used as a starting point,
+    while the rest of the pagination parameters are ignored.
+
+    :param request: requests a single page with the given query parameters
+    :param items_key: the key of the response under which the page's items are present
+    :param page_size: overwrites the page size of the query parameters, which otherwise defaults to DEFAULT_PAGE_SIZE
+    """
+
+    request_page, is_last_page, first_page = _create_paginated(request, query_parameters, items_key, page_size)
+
+    for response in iterate_pages(request_page, is_last_page, first_page, prefetch):
+        yield from response[items_key]
+
+
+async def aiterate_paginated(request: Callable[[P], Awaitable[dict]],
+                             query_parameters: P,
+                             items_key: str,
+                             page_size: int = None,
+                             prefetch: bool = False
+                             ) -> AsyncIterator[Any]:
+    """
+    Asyncio counterpart of iterate_paginated.
+    """
+
+    request_page, is_last_page, first_page = _create_paginated(request, query_parameters, items_key, page_size)
+
+    async for response in aiterate_pages(request_page, is_last_page, first_page, prefetch):
+        for item in response[items_key]:
+            yield item
+
+
+def _create_paginated(request, query_parameters, items_key, page_size):
+    query_parameters = copy.deepcopy(query_parameters)
+    query_parameters.set_limit(None)
+    query_parameters.set_offset(None)
+    query_parameters.set_from(None)
+    query_parameters.set_to(None)
+
+    page_size = int(page_size or query_parameters.page_size.value or DEFAULT_PAGE_SIZE)
+    first_page = int(query_parameters.page.value or 0)
+
+    def request_page(page: int):
+        page_query_parameters = copy.deepcopy(query_parameters)
+        page_query_parameters.set_page_size(page_size)
+        page_query_parameters.set_page(page)
+        return request(page_query_parameters)
+
+    received_count = 0
+    served_page_size = None
+
+    def is_last_page(response: dict, page: int) -> bool:
+        """
+        Decided by the totalCount when present, as the explorer may serve fewer items per page than requested.
+        The items served per page are then learned from the first page. Otherwise a short page is the last one.
+        """
+
+        nonlocal received_count, served_page_size
+        items_count = len(response[items_key])
+        total_count = response.get('totalCount')
+
+        if items_count == 0:
+            return True
+
+        if total_count is None:
+            return items_count < page_size
+
+        if served_page_size is None:
+            served_page_size = items_count
+        received_count += items_count
+
+        return first_page * served_page_size + received_count >= total_count
+
+    return request_page, is_last_page, first_page
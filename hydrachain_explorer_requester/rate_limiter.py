@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+
+class TokenBucket:
+    """
+    Allows requests_per_second on average with bursts of up to burst requests.
+    Callers reserve a token and are told how long to wait for it, so they are served in order of arrival
+    and the waiting itself happens outside the lock. Safe to be shared between threads.
+    """
+
+    def __init__(self,
+                 requests_per_second: float,
+                 burst: int = None
+                 ):
+        """
+        :param burst: the capacity of the bucket, defaults to one second worth of requests
+        """
+        if requests_per_second <= 0:
+            raise ValueError(f'Requests per second must be positive, but was {requests_per_second}')
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max(1, int(requests_per_second))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, which may not yet be available.
+
+        :return: the seconds after which the token becomes available
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.requests_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+
+            return max(0.0, -self._tokens / self.requests_per_second)
+
+
+@dataclass
+class RateLimiterStatistics:
+    acquired: int = 0
+    waited: int = 0
+    waited_seconds: float = 0.0
+    max_waited_seconds: float = 0.0
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter, which paces the requests instead of letting the explorer throttle them.
+    The overall limit applies to every request, while the endpoint limits additionally apply to the requests of their endpoint.
+    One rate limiter can be shared by many requesters, threads and async tasks.
+    """
+
+    def __init__(self,
+                 requests_per_second: float = None,
+                 burst: int = None,
+                 endpoint_limits: Dict[Endpoint, TokenBucket] = None
+                 ):
+        """
+        :param requests_per_second: the overall limit, None for limiting only the endpoints with their own limit
+        :param endpoint_limits: stricter limits for specific endpoints, e.g. for searching logs or calling contracts
+        """
+        self.bucket = TokenBucket(requests_per_second, burst) if requests_per_second is not None else None
+        self.endpoint_limits = endpoint_limits or {}
+        self._statistics_lock = threading.Lock()
+        self._statistics = RateLimiterStatistics()
+
+    def acquire(self, endpoint: Endpoint = None) -> float:
+        """
+        Blocks the calling thread until a request to the endpoint is allowed.
+
+        :return: the seconds spent waiting
+        """
+
+        wait_seconds = self._reserve(endpoint)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+        return wait_seconds
+
+    async def acquire_async(self, endpoint: Endpoint = None) -> float:
+        """
+        Suspends the calling task until a request to the endpoint is allowed, without blocking the event loop.
+
+        :return: the seconds spent waiting
+        """
+
+        wait_seconds = self._reserve(endpoint)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+        return wait_seconds
+
+    def statistics(self) -> RateLimiterStatistics:
+        with self._statistics_lock:
+            return RateLimiterStatistics(**vars(self._statistics))
+
+    def _reserve(self, endpoint: Endpoint) -> float:
+        wait_seconds = 0.0
+
+        if self.bucket is not None:
+            wait_seconds = self.bucket.reserve()
+
+        endpoint_bucket = self.endpoint_limits.get(endpoint)
+        if endpoint_bucket is not None:
+            wait_seconds = max(wait_seconds, endpoint_bucket.reserve())
+
+        with self._statistics_lock:
+            self._statistics.acquired += 1
+            if wait_seconds > 0:
+                self._statistics.waited += 1
+                self._statistics.waited_seconds += wait_seconds
+                self._statistics.max_waited_seconds = max(self._statistics.max_waited_seconds, wait_seconds)
+
+        return wait_seconds
@@ -0,0 +1,10 @@
+__all__ = [
+    'ArchiveMissError',
+    'RecordingAdapter',
+    'ReplayAdapter',
+    'ResponseArchive',
+    'get_archive_key',
+]
+
+from .response_archive import ResponseArchive, get_archive_key
+from .recording_adapter import ArchiveMissError, RecordingAdapter, ReplayAdapter
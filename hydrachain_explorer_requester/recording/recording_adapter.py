@@ -0,0 +1,108 @@
+from http.client import responses as reasons
+
+import requests
+from requests.adapters import BaseAdapter
+
+from hydrachain_explorer_requester.cache import CachedResponse
+from hydrachain_explorer_requester.connection_pool import ExplorerHTTPAdapter
+from hydrachain_explorer_requester.recording.response_archive import ResponseArchive, get_archive_key
+from hydrachain_explorer_requester.retry import RETRYABLE_STATUS_CODES
+
+
+class ArchiveMissError(requests.RequestException):
+    """
+    The replayed request has not been recorded in the archive.
+    It is not a connection error, so the request isn't retried.
+    """
+
+
+class RecordingAdapter(ExplorerHTTPAdapter):
+    """
+    Sends the requests to the explorer as usual, recording their responses into the archive.
+    Responses with a retryable status code, e.g. 503, are transient and therefore not recorded.
+    The bodies of streamed requests are read fully before they are recorded.
+
+    Give it to the requester as its http_adapter:
+
+        ExplorerRequester(http_adapter=RecordingAdapter(ResponseArchive('explorer.sqlite')))
+    """
+
+    def __init__(self,
+                 archive: ResponseArchive,
+                 **kwargs
+                 ):
+        """
+        :param kwargs: passed to the ExplorerHTTPAdapter, e.g. pool_maxsize
+        """
+        super().__init__(**kwargs)
+
+        self.archive = archive
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        response = super().send(request, *args, **kwargs)
+
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            self.archive.put(get_archive_key(request.method, request.url), CachedResponse.from_response(response))
+
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Answers the requests from the archive without any network access, so the recorded historical data can be
+    processed again at the speed of the disk and the decoding.
+
+    Give it to the requester as its http_adapter:
+
+        ExplorerRequester(http_adapter=ReplayAdapter(ResponseArchive('explorer.sqlite')))
+    """
+
+    def __init__(self,
+                 archive: ResponseArchive,
+                 fallback_adapter: BaseAdapter = None
+                 ):
+        """
+        :param fallback_adapter: sends the requests missing from the archive, e.g. a RecordingAdapter of the same archive,
+                                 which then records them for the next replay. Without it, they raise an ArchiveMissError
+        """
+        super().__init__()
+
+        self.archive = archive
+        self.fallback_adapter = fallback_adapter
+
+    @property
+    def uses_network(self) -> bool:
+        """
+        Without a fallback adapter, every request is answered from the archive, so the requester doesn't resolve their proxies.
+        """
+
+        return self.fallback_adapter is not None
+
+    def send(self,
+             request: requests.PreparedRequest,
+             stream: bool = False,
+             timeout=None,
+             verify=True,
+             cert=None,
+             proxies=None
+             ) -> requests.Response:
+        cached_response = self.archive.get(get_archive_key(request.method, request.url))
+
+        if cached_response is None:
+            if self.fallback_adapter is None:
+                raise ArchiveMissError(f'{request.method} {request.url} has not been recorded', request=request)
+
+            return self.fallback_adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        # The body is already in memory, so even a streamed response is served from it
+        response = cached_response.to_response()
+        response.url = request.url
+        response.reason = reasons.get(response.status_code)
+        response.request = request
+        response.connection = self
+
+        return response
+
+    def close(self):
+        if self.fallback_adapter is not None:
+            self.fallback_adapter.close()
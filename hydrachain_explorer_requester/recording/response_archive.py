@@ -0,0 +1,115 @@
+import os
+import time
+from typing import Iterator
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from hydrachain_explorer_requester.cache import CachedResponse
+from hydrachain_explorer_requester.sqlite_database import SQLiteDatabase
+
+# Archives are written once and replayed many times, so they are compressed harder than the caches
+DEFAULT_COMPRESSION_LEVEL = 6
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS responses ('
+    'key TEXT PRIMARY KEY, '
+    'url TEXT NOT NULL, '
+    'status_code INTEGER NOT NULL, '
+    'content_type TEXT, '
+    'encoding TEXT, '
+    'content BLOB NOT NULL, '
+    'compressed INTEGER NOT NULL, '
+    'recorded_at REAL NOT NULL)',
+)
+
+
+def get_archive_key(method: str, url: str) -> str:
+    """
+    The key of a request is its method, path and sorted query parameters. The domain is left out,
+    so an archive recorded from one explorer instance, e.g. the ones of an ExplorerURLPool, replays for all of them.
+    """
+
+    split = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(split.query, keep_blank_values=True)))
+
+    return f'{method} {split.path}?{query}'
+
+
+class ResponseArchive:
+    """
+    Local archive of explorer responses stored in a SQLite database file, with their content compressed by zlib.
+    The responses are indexed by their archive key, see get_archive_key.
+
+    Unlike the caches, the archive never expires or evicts its responses, so the same historical data can be
+    processed again without the explorer. The database is opened in WAL mode with one connection per thread,
+    so the archive may be shared by many threads.
+    """
+
+    def __init__(self,
+                 path: str | os.PathLike,
+                 compression_level: int = DEFAULT_COMPRESSION_LEVEL
+                 ):
+        """
+        :param compression_level: zlib level the content is compressed with, 0 for storing it uncompressed
+        """
+        self.path = os.fspath(path)
+        self.compression_level = compression_level
+        self._database = SQLiteDatabase(path, _SCHEMA)
+
+    def __len__(self) -> int:
+        return self._database.get_connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._database.get_connection().execute('SELECT 1 FROM responses WHERE key = ?', (key,)).fetchone() is not None
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+
+        self._database.close()
+
+    def get(self, key: str) -> CachedResponse | None:
+        row = self._database.get_connection().execute(
+            'SELECT url, status_code, content_type, encoding, content, compressed FROM responses WHERE key = ?',
+            (key,)
+        ).fetchone()
+
+        return CachedResponse.from_row(*row) if row is not None else None
+
+    def put(self, key: str, cached_response: CachedResponse):
+        """
+        Stores the response, replacing the previously recorded response of the key.
+        """
+
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, url, status_code, content_type, encoding, content, compressed, recorded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, *cached_response.to_row(self.compression_level), time.time())
+            )
+
+    def delete(self, key: str):
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def iter_responses(self, key_prefix: str = None) -> Iterator[tuple[str, CachedResponse]]:
+        """
+        Yields the archived responses in the order they were recorded, reading the database sequentially.
+        Meant for reprocessing the archive in bulk, without going through the requester.
+
+        :param key_prefix: yields only the responses, whose key starts with it, e.g. 'GET /7001/block/'
+        """
+
+        query = 'SELECT key, url, status_code, content_type, encoding, content, compressed FROM responses'
+        parameters = ()
+        if key_prefix is not None:
+            # The range covers exactly the keys starting with the prefix, while being able to use the primary key's index
+            query += ' WHERE key >= ? AND key < ?'
+            parameters = (key_prefix, key_prefix + '\U0010ffff')
+
+        for row in self._database.get_connection().execute(query + ' ORDER BY rowid', parameters):
+            yield row[0], CachedResponse.from_row(*row[1:])
+
@@ -0,0 +1,101 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Describes how many times and after what delay a failed request is retried.
+    A request is retried when it failed to connect or timed out, or when it was answered with one of the retryable status codes.
+    Only the idempotent methods are retried, unless others are explicitly given. Without retry_timeouts a request, which timed out
+    while reading the response, is not retried, e.g. when the caller rather retries it with a smaller request.
+
+    The delay grows exponentially with every attempt, up to max_backoff_seconds. With jitter a random delay between zero and
+    the exponential one is used, so many clients throttled at the same time don't retry in lockstep.
+    A Retry-After header of the response takes precedence over the exponential delay, up to max_retry_after_seconds.
+    """
+    max_attempts: int = 4
+    backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after_seconds: float = 120.0
+    retry_status_codes: frozenset = field(default_factory=lambda: RETRYABLE_STATUS_CODES)
+    retry_methods: frozenset = field(default_factory=lambda: IDEMPOTENT_METHODS)
+    retry_timeouts: bool = True
+
+    def should_retry_status(self, method: str, attempt: int, status_code: int) -> bool:
+        """
+        :param attempt: the number of the attempt, which received the status code, starting from 1
+        """
+
+        return status_code in self.retry_status_codes and self._can_retry(method, attempt)
+
+    def should_retry_error(self, method: str, attempt: int, timed_out: bool = False) -> bool:
+        """
+        :param attempt: the number of the attempt, which failed to connect or timed out, starting from 1
+        :param timed_out: whether the attempt timed out while reading the response
+        """
+
+        return (self.retry_timeouts or not timed_out) and self._can_retry(method, attempt)
+
+    def get_delay_seconds(self, attempt: int, headers: Mapping[str, str] = None) -> float:
+        """
+        :param attempt: the number of the attempt, which failed, starting from 1
+        :param headers: the headers of the failed attempt's response, if it was received
+        """
+
+        retry_after = self._get_retry_after_seconds(headers) if self.respect_retry_after and headers else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after_seconds)
+
+        delay = min(self.backoff_seconds * 2 ** (attempt - 1), self.max_backoff_seconds)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        return method.upper() in self.retry_methods and attempt < self.max_attempts
+
+    def _get_retry_after_seconds(self, headers: Mapping[str, str]) -> float | None:
+        """
+        The Retry-After header holds either the number of seconds to wait or the date after which to retry.
+        """
+
+        retry_after = headers.get('Retry-After')
+        if not retry_after:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+NO_RETRY_POLICY = RetryPolicy(max_attempts=1)
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Searching the logs and calling a contract are the most expensive requests for the explorer,
+# so they are retried fewer times and backed off for longer.
+EXPENSIVE_RETRY_POLICY = RetryPolicy(max_attempts=3, backoff_seconds=2.0)
+
+DEFAULT_RETRY_POLICIES: Dict[Endpoint, RetryPolicy] = {
+    Endpoint.SEARCH_LOGS: EXPENSIVE_RETRY_POLICY,
+    Endpoint.CALL_CONTRACT: EXPENSIVE_RETRY_POLICY,
+}
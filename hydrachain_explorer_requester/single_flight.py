@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Callable, Any, Hashable, Awaitable
+
+
+@dataclass
+class SingleFlightStatistics:
+    calls: int = 0
+    shared: int = 0
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call with a given key is in flight,
+    every other caller with the same key waits for it and receives its result (or error) instead of making the call again.
+    Once the call completes, the next call with the key is made anew.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._statistics = SingleFlightStatistics()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+                self._statistics.calls += 1
+            else:
+                self._statistics.shared += 1
+
+        if not leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def statistics(self) -> SingleFlightStatistics:
+        with self._lock:
+            return SingleFlightStatistics(**vars(self._statistics))
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight, coalescing the identical calls of the tasks on one event loop.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self._statistics = SingleFlightStatistics()
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+
+        if call is not None:
+            self._statistics.shared += 1
+            return await asyncio.shield(call)
+
+        call = self._calls[key] = asyncio.ensure_future(function())
+        self._statistics.calls += 1
+        try:
+            return await asyncio.shield(call)
+        finally:
+            if call.done():
+                del self._calls[key]
+            else:
+                call.add_done_callback(lambda _: self._calls.pop(key, None))
+
+    def statistics(self) -> SingleFlightStatistics:
+        return SingleFlightStatistics(**vars(self._statistics))
@@ -0,0 +1,51 @@
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+
+class SQLiteDatabase:
+    """
+    A SQLite database file opened in WAL mode with one connection per thread, so it may be shared by many threads
+    and processes: the reads run concurrently, while the writes are serialized by SQLite.
+    """
+
+    def __init__(self,
+                 path: str | os.PathLike,
+                 schema: Iterable[str] = ()
+                 ):
+        """
+        :param schema: the statements creating the tables and indexes, which should use IF NOT EXISTS
+        """
+        self.path = os.fspath(path)
+        self._local = threading.local()
+
+        connection = self.get_connection()
+        with connection:
+            for statement in schema:
+                connection.execute(statement)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        :return: the connection of the calling thread, which is opened on its first use
+        """
+
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            self._local.connection = connection
+
+        return connection
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,8 @@
+__all__ = [
+    'ExplorerStore',
+    'IndexedExplorer',
+    'Transfer',
+]
+
+from .explorer_store import ExplorerStore, Transfer
+from .indexed_explorer import IndexedExplorer
@@ -0,0 +1,303 @@
+import json
+import os
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, List
+
+from hydrachain_explorer_requester.sqlite_database import SQLiteDatabase
+# The raw responses are compressed fast, as they are written far more often than read back
+_COMPRESSION_LEVEL = 1
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS blocks ('
+    'height INTEGER PRIMARY KEY, '
+    'hash TEXT NOT NULL UNIQUE, '
+    'prev_hash TEXT, '
+    'timestamp INTEGER, '
+    'miner TEXT, '
+    'transactions_indexed INTEGER NOT NULL DEFAULT 0, '
+    'data BLOB NOT NULL)',
+
+    'CREATE TABLE IF NOT EXISTS transactions ('
+    'id TEXT PRIMARY KEY, '
+    'block_height INTEGER, '
+    'block_hash TEXT, '
+    'timestamp INTEGER, '
+    'data BLOB NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS transactions_block_height ON transactions (block_height)',
+
+    'CREATE TABLE IF NOT EXISTS transaction_addresses ('
+    'address TEXT NOT NULL, '
+    'transaction_id TEXT NOT NULL, '
+    'block_height INTEGER, '
+    'PRIMARY KEY (address, transaction_id)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS transaction_addresses_address_block_height ON transaction_addresses (address, block_height)',
+
+    'CREATE TABLE IF NOT EXISTS transaction_outputs ('
+    'transaction_id TEXT NOT NULL, '
+    'output_index INTEGER NOT NULL, '
+    'block_height INTEGER, '
+    'address TEXT, '
+    'value INTEGER NOT NULL, '
+    'PRIMARY KEY (transaction_id, output_index)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS transaction_outputs_block_height_value ON transaction_outputs (block_height, value)',
+
+    'CREATE TABLE IF NOT EXISTS logs ('
+    'transaction_id TEXT NOT NULL, '
+    'output_index INTEGER NOT NULL, '
+    'log_index INTEGER NOT NULL, '
+    'block_height INTEGER, '
+    'contract TEXT NOT NULL, '
+    'topic1 TEXT, '
+    'topic2 TEXT, '
+    'topic3 TEXT, '
+    'topic4 TEXT, '
+    'data TEXT, '
+    'PRIMARY KEY (transaction_id, output_index, log_index)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS logs_contract_topic1_block_height ON logs (contract, topic1, block_height)',
+    'CREATE INDEX IF NOT EXISTS logs_topic1_block_height ON logs (topic1, block_height)',
+)
+
+
+@dataclass(slots=True)
+class Transfer:
+    """
+    A transaction output, whose value is in the smallest unit of the coin.
+    """
+    transaction_id: str
+    output_index: int
+    block_height: int
+    address: str
+    value: int
+
+
+class ExplorerStore:
+    """
+    Local SQLite database of explorer responses, indexed for the queries, which would otherwise need many explorer requests.
+
+    Blocks are indexed by height and hash, transactions by block height and by the addresses of their inputs and outputs,
+    and the contract event logs by contract and first topic. The raw responses are kept compressed,
+    so they can be served again as they were received.
+
+    A block is marked as having its transactions indexed, once all of them have been added. The range queries rely on that
+    to decide whether the store covers a block range, see is_range_indexed.
+
+    The database is opened in WAL mode with one connection per thread, so the store may be shared by many threads.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self._database = SQLiteDatabase(path, _SCHEMA)
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+
+        self._database.close()
+
+    def add_block(self, block: dict, transactions: List[dict] = None):
+        """
+        :param transactions: all of the block's transactions, which marks the block as having its transactions indexed
+        """
+
+        connection = self._database.get_connection()
+        with connection:
+            self._insert_block(connection, block, transactions is not None)
+            for transaction in transactions or []:
+                self._insert_transaction(connection, transaction)
+
+    def add_transactions(self, transactions: Iterable[dict]):
+        connection = self._database.get_connection()
+        with connection:
+            for transaction in transactions:
+                self._insert_transaction(connection, transaction)
+
+    def get_block(self, value: str | int) -> dict | None:
+        """
+        :param value: height or hash
+        """
+
+        if isinstance(value, int) or value.isdigit():
+            row = self._database.get_connection().execute('SELECT data FROM blocks WHERE height = ?', (int(value),)).fetchone()
+        else:
+            row = self._database.get_connection().execute('SELECT data FROM blocks WHERE hash = ?', (value,)).fetchone()
+
+        return _decode(row[0]) if row is not None else None
+
+    def get_transaction(self, transaction_id: str) -> dict | None:
+        row = self._database.get_connection().execute('SELECT data FROM transactions WHERE id = ?', (transaction_id,)).fetchone()
+
+        return _decode(row[0]) if row is not None else None
+
+    def get_indexed_height_range(self) -> tuple[int, int] | None:
+        """
+        :return: the lowest and highest height of the blocks with indexed transactions, None if there are none
+        """
+
+        row = self._database.get_connection().execute(
+            'SELECT MIN(height), MAX(height) FROM blocks WHERE transactions_indexed = 1'
+        ).fetchone()
+
+        return (row[0], row[1]) if row[0] is not None else None
+
+    def get_missing_heights(self, from_block: int, to_block: int) -> List[int]:
+        """
+        :return: the heights of the inclusive range, whose blocks don't have their transactions indexed
+        """
+
+        indexed = {height for height, in self._database.get_connection().execute(
+            'SELECT height FROM blocks WHERE height BETWEEN ? AND ? AND transactions_indexed = 1',
+            (from_block, to_block)
+        )}
+
+        return [height for height in range(from_block, to_block + 1) if height not in indexed]
+
+    def is_range_indexed(self, from_block: int, to_block: int) -> bool:
+        count = self._database.get_connection().execute(
+            'SELECT COUNT(*) FROM blocks WHERE height BETWEEN ? AND ? AND transactions_indexed = 1',
+            (from_block, to_block)
+        ).fetchone()[0]
+
+        return count == to_block - from_block + 1
+
+    def get_address_transactions(self, address: str, from_block: int, to_block: int) -> List[str]:
+        """
+        :return: the ids of the address' transactions in the inclusive block range, in ascending block order
+        """
+
+        return [transaction_id for transaction_id, in self._database.get_connection().execute(
+            'SELECT transaction_id FROM transaction_addresses WHERE address = ? AND block_height BETWEEN ? AND ? '
+            'ORDER BY block_height, transaction_id',
+            (address, from_block, to_block)
+        )]
+
+    def count_logs(self, contract: str = None, topic1: str = None, from_block: int = None, to_block: int = None) -> int:
+        """
+        :param contract: hex address of the contract, which emitted the logs
+        :param topic1: the first topic, which is the signature of the event
+        """
+
+        conditions = []
+        parameters = []
+        for condition, value in (('contract = ?', contract),
+                                 ('topic1 = ?', topic1),
+                                 ('block_height >= ?', from_block),
+                                 ('block_height <= ?', to_block)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        query = 'SELECT COUNT(*) FROM logs'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        return self._database.get_connection().execute(query, parameters).fetchone()[0]
+
+    def get_largest_transfers(self, from_block: int, to_block: int, limit: int = 10) -> List[Transfer]:
+        """
+        :return: the transaction outputs of the inclusive block range with the highest values, in descending value order
+        """
+
+        return [Transfer(*row) for row in self._database.get_connection().execute(
+            'SELECT transaction_id, output_index, block_height, address, value FROM transaction_outputs '
+            'WHERE block_height BETWEEN ? AND ? ORDER BY value DESC LIMIT ?',
+            (from_block, to_block, limit)
+        )]
+
+    def _insert_block(self, connection: sqlite3.Connection, block: dict, transactions_indexed: bool):
+        """
+        A block replacing another one at its height, e.g. after a reorg, removes the transactions indexed for the replaced one.
+        """
+
+        row = connection.execute('SELECT hash FROM blocks WHERE height = ?', (block['height'],)).fetchone()
+        if row is not None and row[0] != block['hash']:
+            self._delete_transactions(connection, block['height'])
+
+        connection.execute(
+            'INSERT INTO blocks (height, hash, prev_hash, timestamp, miner, transactions_indexed, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (height) DO UPDATE SET hash = excluded.hash, prev_hash = excluded.prev_hash, '
+            'timestamp = excluded.timestamp, miner = excluded.miner, data = excluded.data, '
+            'transactions_indexed = CASE WHEN hash = excluded.hash '
+            'THEN MAX(transactions_indexed, excluded.transactions_indexed) ELSE excluded.transactions_indexed END',
+            (
+                block['height'],
+                block['hash'],
+                block.get('prevHash'),
+                block.get('timestamp'),
+                block.get('miner'),
+                transactions_indexed,
+                _encode(block)
+            )
+        )
+
+    def _delete_transactions(self, connection: sqlite3.Connection, block_height: int):
+        for table in ('transactions', 'transaction_addresses', 'transaction_outputs', 'logs'):
+            connection.execute(f'DELETE FROM {table} WHERE block_height = ?', (block_height,))
+
+    def _insert_transaction(self, connection: sqlite3.Connection, transaction: dict):
+        transaction_id = transaction['id']
+        block_height = transaction.get('blockHeight')
+
+        connection.execute(
+            'INSERT OR REPLACE INTO transactions (id, block_height, block_hash, timestamp, data) VALUES (?, ?, ?, ?, ?)',
+            (transaction_id, block_height, transaction.get('blockHash'), transaction.get('timestamp'), _encode(transaction))
+        )
+
+        addresses = set()
+        for transaction_input in transaction.get('inputs') or []:
+            if transaction_input.get('address'):
+                addresses.add(transaction_input['address'])
+
+        for output_index, output in enumerate(transaction.get('outputs') or []):
+            if output.get('address'):
+                addresses.add(output['address'])
+
+            connection.execute(
+                'INSERT OR REPLACE INTO transaction_outputs (transaction_id, output_index, block_height, address, value) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (transaction_id, output_index, block_height, output.get('address'), int(output.get('value') or 0))
+            )
+
+            receipt = output.get('receipt') or {}
+            for log_index, log in enumerate(receipt.get('logs') or []):
+                self._insert_log(connection, transaction_id, output_index, log_index, block_height, log)
+
+        connection.executemany(
+            'INSERT OR REPLACE INTO transaction_addresses (address, transaction_id, block_height) VALUES (?, ?, ?)',
+            ((address, transaction_id, block_height) for address in addresses)
+        )
+
+    def _insert_log(self,
+                    connection: sqlite3.Connection,
+                    transaction_id: str,
+                    output_index: int,
+                    log_index: int,
+                    block_height: int,
+                    log: dict):
+        topics = (log.get('topics') or []) + [None] * 4
+
+        connection.execute(
+            'INSERT OR REPLACE INTO logs '
+            '(transaction_id, output_index, log_index, block_height, contract, topic1, topic2, topic3, topic4, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                transaction_id,
+                output_index,
+                log_index,
+                block_height,
+                log.get('addressHex') or log.get('address'),
+                *topics[:4],
+                log.get('data')
+            )
+        )
+
+
+def _encode(data: dict) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(',', ':')).encode(), _COMPRESSION_LEVEL)
+
+
+def _decode(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data))
@@ -0,0 +1,138 @@
+import logging
+from typing import List
+
+from hydrachain_explorer_requester.cache.cache_policy import DEFAULT_MIN_CONFIRMATIONS
+from hydrachain_explorer_requester.concurrency import map_concurrently, DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.query_parameters import TransactionsQueryParameters, SearchLogsQueryParameters
+from hydrachain_explorer_requester.store.explorer_store import ExplorerStore, Transfer
+
+_logger = logging.getLogger(__name__)
+
+
+class IndexedExplorer:
+    """
+    Answers the queries from the ExplorerStore when it covers them, falling back to the explorer otherwise.
+    The blocks and transactions received from the explorer are added to the store, so repeated lookups are answered locally.
+    Only the ones with at least min_confirmations are added, as the ones near the chain tip may still be reorged away,
+    and the stored ones keep the confirmations they were received with.
+
+    The range queries are answered locally only when every block of the range has its transactions indexed, see index_blocks.
+    Locally, the transactions of an address are the ones having it in their inputs or outputs.
+    """
+
+    def __init__(self,
+                 explorer_requester: ExplorerRequester,
+                 store: ExplorerStore,
+                 min_confirmations: int = DEFAULT_MIN_CONFIRMATIONS,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 logger: logging = _logger
+                 ):
+        """
+        :param min_confirmations: confirmations, from which on the blocks and transactions looked up are added to the store
+        :param concurrency: maximum number of blocks being indexed at a time
+        """
+        self.explorer_requester = explorer_requester
+        self.store = store
+        self.min_confirmations = min_confirmations
+        self.concurrency = concurrency
+        self.logger = logger
+
+    def index_blocks(self, from_block: int, to_block: int) -> int:
+        """
+        Adds the blocks of the inclusive range, together with all of their transactions, which aren't indexed yet.
+
+        :return: the number of the newly indexed blocks
+        """
+
+        missing_heights = self.store.get_missing_heights(from_block, to_block)
+
+        for result in map_concurrently(self._index_block, missing_heights, self.concurrency):
+            result.get()
+
+        if missing_heights:
+            self.logger.debug(f'Indexed {len(missing_heights)} blocks between {from_block} and {to_block}')
+
+        return len(missing_heights)
+
+    def get_block(self, value: str | int) -> dict:
+        """
+        :param value: height or hash
+        """
+
+        block = self.store.get_block(value)
+        if block is None:
+            block = self.explorer_requester.get_block(value)
+            if self._is_confirmed(block, 'height'):
+                self.store.add_block(block)
+
+        return block
+
+    def get_transaction(self, transaction_id: str) -> dict:
+        transaction = self.store.get_transaction(transaction_id)
+        if transaction is None:
+            transaction = self.explorer_requester.get_transaction(transaction_id)
+            if self._is_confirmed(transaction, 'blockHeight'):
+                self.store.add_transactions([transaction])
+
+        return transaction
+
+    def get_address_transactions(self, address: str, from_block: int, to_block: int) -> List[str]:
+        """
+        :return: the ids of the address' transactions in the inclusive block range, in ascending block order
+        """
+
+        if self.store.is_range_indexed(from_block, to_block):
+            return self.store.get_address_transactions(address, from_block, to_block)
+
+        query_parameters = TransactionsQueryParameters()
+        query_parameters.set_from_block(from_block)
+        query_parameters.set_to_block(to_block)
+        query_parameters.set_reversed('false')
+
+        return list(self.explorer_requester.iter_address_transactions(address, query_parameters))
+
+    def count_logs(self, contract: str = None, topic1: str = None, from_block: int = None, to_block: int = None) -> int:
+        """
+        Counts the contract event logs, e.g. the transfers of a token when given the token and the signature of its Transfer event.
+
+        :param contract: hex address of the contract, which emitted the logs
+        :param topic1: the first topic, which is the signature of the event
+        """
+
+        if from_block is not None and to_block is not None and self.store.is_range_indexed(from_block, to_block):
+            return self.store.count_logs(contract, topic1, from_block, to_block)
+
+        # The filtered logs aren't stored, as they lack the log index within their receipts, which the store is keyed by
+        query_parameters = SearchLogsQueryParameters()
+        query_parameters.set_contract(contract)
+        query_parameters.set_topic1(topic1)
+        query_parameters.set_from_block(from_block)
+        query_parameters.set_to_block(to_block)
+        query_parameters.set_page_size(1)
+
+        return self.explorer_requester.get_search_logs(query_parameters)['totalCount']
+
+    def get_largest_transfers(self, from_block: int, to_block: int, limit: int = 10) -> List[Transfer]:
+        """
+        The explorer has no such query, so the missing blocks of the range are indexed first.
+
+        :return: the transaction outputs of the inclusive block range with the highest values, in descending value order
+        """
+
+        self.index_blocks(from_block, to_block)
+
+        return self.store.get_largest_transfers(from_block, to_block, limit)
+
+    def _is_confirmed(self, item: dict, height_key: str) -> bool:
+        """
+        Unconfirmed transactions have no block height, so they can't be removed by the reorg of their block later on.
+        """
+
+        return item.get(height_key) is not None and item.get('confirmations', 0) >= self.min_confirmations
+
+    def _index_block(self, height: int):
+        block = self.explorer_requester.get_block(height)
+        transactions = self.explorer_requester.get_transactions(block.get('transactions') or [])
+
+        self.store.add_block(block, transactions)
@@ -0,0 +1,15 @@
+__all__ = [
+    'CheckpointStore',
+    'MemoryCheckpointStore',
+    'SQLiteCheckpointStore',
+    'SyncCheckpoint',
+    'SyncResult',
+    'SyncTarget',
+    'TransactionSync',
+]
+
+from .checkpoint_store import CheckpointStore, MemoryCheckpointStore
+from .sqlite_checkpoint_store import SQLiteCheckpointStore
+from .sync_checkpoint import SyncCheckpoint
+from .sync_target import SyncTarget
+from .transaction_sync import SyncResult, TransactionSync
@@ -0,0 +1,49 @@
+import threading
+from typing import Dict
+
+from hydrachain_explorer_requester.sync.sync_checkpoint import SyncCheckpoint
+
+
+class CheckpointStore:
+    """
+    Base of the stores, which hold the checkpoints of the TransactionSync by the keys of the sync targets.
+    All of the functions must be safe to be called from multiple threads.
+    """
+
+    def get(self, key: str) -> SyncCheckpoint | None:
+        raise NotImplementedError
+
+    def set(self, key: str, checkpoint: SyncCheckpoint):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Keeps the checkpoints in memory only, so every restart of the process synchronizes from the beginning again.
+    """
+
+    def __init__(self):
+        self._checkpoints: Dict[str, SyncCheckpoint] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> SyncCheckpoint | None:
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def set(self, key: str, checkpoint: SyncCheckpoint):
+        with self._lock:
+            self._checkpoints[key] = checkpoint
+
+    def delete(self, key: str):
+        with self._lock:
+            self._checkpoints.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._checkpoints.clear()
@@ -0,0 +1,59 @@
+import os
+
+from hydrachain_explorer_requester.sqlite_database import SQLiteDatabase
+from hydrachain_explorer_requester.sync.checkpoint_store import CheckpointStore
+from hydrachain_explorer_requester.sync.sync_checkpoint import SyncCheckpoint
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS checkpoints ('
+    'key TEXT PRIMARY KEY, '
+    'block_height INTEGER NOT NULL, '
+    'transaction_id TEXT, '
+    'synced_at REAL)',
+)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Persists the checkpoints in a SQLite database file, so the synchronization resumes where it stopped after a restart.
+
+    The database is opened in WAL mode with one connection per thread, so the concurrently synchronized targets
+    store their checkpoints without blocking the reads of each other.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self._database = SQLiteDatabase(path, _SCHEMA)
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+
+        self._database.close()
+
+    def get(self, key: str) -> SyncCheckpoint | None:
+        row = self._database.get_connection().execute(
+            'SELECT block_height, transaction_id, synced_at FROM checkpoints WHERE key = ?',
+            (key,)
+        ).fetchone()
+
+        return SyncCheckpoint(*row) if row is not None else None
+
+    def set(self, key: str, checkpoint: SyncCheckpoint):
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO checkpoints (key, block_height, transaction_id, synced_at) VALUES (?, ?, ?, ?)',
+                (key, checkpoint.block_height, checkpoint.transaction_id, checkpoint.synced_at)
+            )
+
+    def delete(self, key: str):
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute('DELETE FROM checkpoints WHERE key = ?', (key,))
+
+    def clear(self):
+        connection = self._database.get_connection()
+        with connection:
+            connection.execute('DELETE FROM checkpoints')
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SyncCheckpoint:
+    """
+    Position, up to which the transactions of a sync target have been synchronized.
+
+    :param block_height: every transaction up to and including this block height has been synchronized
+    :param transaction_id: the id of the latest synchronized transaction, None if there hasn't been any yet
+    :param synced_at: unix time of the synchronization
+    """
+    block_height: int
+    transaction_id: str = None
+    synced_at: float = None
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from hydrachain_explorer_requester.enum import Endpoint
+
+SYNCHRONIZABLE_ENDPOINTS = frozenset({
+    Endpoint.ADDRESS_TRANSACTIONS,
+    Endpoint.CONTRACT_TRANSACTIONS,
+    Endpoint.ADDRESS_QRC20_TRANSACTIONS,
+})
+
+
+@dataclass(frozen=True)
+class SyncTarget:
+    """
+    Transactions of an address, contract or address' token, which are synchronized incrementally.
+    The endpoint determines the explorer request and the arguments are its path arguments.
+    """
+    endpoint: Endpoint
+    arguments: Tuple[str, ...]
+
+    def __post_init__(self):
+        if self.endpoint not in SYNCHRONIZABLE_ENDPOINTS:
+            raise ValueError(f'Transactions of {self.endpoint} can not be synchronized')
+
+    @staticmethod
+    def address(address: str) -> 'SyncTarget':
+        return SyncTarget(Endpoint.ADDRESS_TRANSACTIONS, (address,))
+
+    @staticmethod
+    def contract(contract: str) -> 'SyncTarget':
+        return SyncTarget(Endpoint.CONTRACT_TRANSACTIONS, (contract,))
+
+    @staticmethod
+    def address_qrc20(address: str, token: str) -> 'SyncTarget':
+        return SyncTarget(Endpoint.ADDRESS_QRC20_TRANSACTIONS, (address, token))
+
+    @property
+    def key(self) -> str:
+        """
+        Identifies the target in the checkpoint stores.
+        """
+
+        return ':'.join((self.endpoint.value, *self.arguments))
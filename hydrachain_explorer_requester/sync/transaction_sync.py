@@ -0,0 +1,153 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Any
+
+from hydrachain_explorer_requester.concurrency import ConcurrentResult, map_concurrently, DEFAULT_CONCURRENCY
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.query_parameters import TransactionsQueryParameters
+from hydrachain_explorer_requester.sync.checkpoint_store import CheckpointStore, MemoryCheckpointStore
+from hydrachain_explorer_requester.sync.sync_checkpoint import SyncCheckpoint
+from hydrachain_explorer_requester.sync.sync_target import SyncTarget
+
+_logger = logging.getLogger(__name__)
+
+SyncListener = Callable[['SyncResult'], None]
+
+
+@dataclass
+class SyncResult:
+    """
+    The transactions of a target, which are new since its previous checkpoint, in ascending block order.
+    """
+    target: SyncTarget
+    transactions: List[Any]
+    checkpoint: SyncCheckpoint
+    previous_checkpoint: SyncCheckpoint = None
+
+
+class TransactionSync:
+    """
+    Synchronizes the transactions of addresses and contracts incrementally.
+
+    Every target has a checkpoint with the block height, up to which its transactions have been synchronized.
+    The next synchronization requests only the blocks after it, via the from and to block query parameters,
+    up to the tip of the chain at the time of the synchronization, which then becomes the new checkpoint.
+    A target without a checkpoint is synchronized from its first transaction on.
+
+    The checkpoint is stored only after the listener has processed the new transactions,
+    so a synchronization interrupted before that is repeated from the previous checkpoint.
+    """
+
+    def __init__(self,
+                 explorer_requester: ExplorerRequester,
+                 checkpoint_store: CheckpointStore = None,
+                 confirmations: int = 0,
+                 page_size: int = None,
+                 logger: logging = _logger
+                 ):
+        """
+        :param checkpoint_store: defaults to a MemoryCheckpointStore, use the SQLiteCheckpointStore for resuming after restarts
+        :param confirmations: number of confirmations a block needs before its transactions are synchronized.
+                              Transactions of the blocks orphaned by a reorg after their synchronization are not revoked
+        :param page_size: page size of the transactions requests
+        """
+        self.explorer_requester = explorer_requester
+        self.checkpoint_store = checkpoint_store or MemoryCheckpointStore()
+        self.confirmations = confirmations
+        self.page_size = page_size
+        self.logger = logger
+
+    def get_synchronizable_height(self) -> int:
+        """
+        :return: the height of the latest block, which has enough confirmations to be synchronized
+        """
+
+        return self.explorer_requester.get_info()['height'] - self.confirmations
+
+    def sync(self,
+             target: SyncTarget,
+             listener: SyncListener = None,
+             to_block: int = None
+             ) -> SyncResult:
+        """
+        :param listener: processes the new transactions, before the checkpoint is stored
+        :param to_block: the height to synchronize up to, defaults to the synchronizable height
+        """
+
+        if to_block is None:
+            to_block = self.get_synchronizable_height()
+
+        previous_checkpoint = self.checkpoint_store.get(target.key)
+        from_block = previous_checkpoint.block_height + 1 if previous_checkpoint is not None else None
+
+        if from_block is not None and from_block > to_block:
+            return SyncResult(target, [], previous_checkpoint, previous_checkpoint)
+
+        query_parameters = TransactionsQueryParameters()
+        query_parameters.set_from_block(from_block)
+        query_parameters.set_to_block(to_block)
+        query_parameters.set_reversed('false')
+
+        transactions = list(self._iter_transactions(target, query_parameters))
+
+        checkpoint = SyncCheckpoint(
+            block_height=to_block,
+            transaction_id=_get_transaction_id(transactions[-1]) if transactions
+            else previous_checkpoint.transaction_id if previous_checkpoint is not None else None,
+            synced_at=time.time()
+        )
+        result = SyncResult(target, transactions, checkpoint, previous_checkpoint)
+
+        if listener is not None:
+            listener(result)
+
+        self.checkpoint_store.set(target.key, checkpoint)
+        self.logger.debug(f'Synchronized {len(transactions)} transactions of {target.key} up to block {to_block}')
+
+        return result
+
+    def sync_all(self,
+                 targets: Iterable[SyncTarget],
+                 listener: SyncListener = None,
+                 concurrency: int = DEFAULT_CONCURRENCY
+                 ) -> Iterator[ConcurrentResult]:
+        """
+        Synchronizes the targets concurrently, all of them up to the same height.
+        A failed target keeps its previous checkpoint and doesn't abort the rest.
+
+        :param listener: called from the synchronizing threads
+        :return: results in the order of the targets, whose argument is the target and result is the SyncResult
+        """
+
+        to_block = self.get_synchronizable_height()
+
+        return map_concurrently(lambda target: self.sync(target, listener, to_block), targets, concurrency)
+
+    def reset(self, target: SyncTarget):
+        """
+        Deletes the checkpoint of the target, so its next synchronization starts from the beginning.
+        """
+
+        self.checkpoint_store.delete(target.key)
+
+    def _iter_transactions(self, target: SyncTarget, query_parameters: TransactionsQueryParameters) -> Iterator:
+        match target.endpoint:
+            case Endpoint.ADDRESS_TRANSACTIONS:
+                return self.explorer_requester.iter_address_transactions(*target.arguments, query_parameters, self.page_size)
+            case Endpoint.CONTRACT_TRANSACTIONS:
+                return self.explorer_requester.iter_contract_transactions(*target.arguments, query_parameters, self.page_size)
+            case Endpoint.ADDRESS_QRC20_TRANSACTIONS:
+                return self.explorer_requester.iter_address_qrc20_transactions(*target.arguments, query_parameters, self.page_size)
+
+
+def _get_transaction_id(transaction: str | dict) -> str:
+    """
+    The address and contract transactions are listed by their ids, while the token transactions are objects.
+    """
+
+    if isinstance(transaction, dict):
+        return transaction.get('transactionId') or transaction.get('id')
+
+    return transaction
@@ -0,0 +1,56 @@
+import json
+import threading
+from typing import Callable, Any
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+def create_response(request: requests.PreparedRequest,
+                    body: Any = None,
+                    status_code: int = 200,
+                    headers: dict = None,
+                    content: bytes = None
+                    ) -> requests.Response:
+    """
+    :param body: encoded as the JSON content, unless the content is given
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json; charset=utf-8', **(headers or {})})
+    response._content = content if content is not None else json.dumps(body).encode()
+    response.encoding = 'utf-8'
+    response.url = request.url if request is not None else None
+    response.request = request
+    response.reason = 'OK' if status_code == 200 else 'Error'
+    return response
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Answers the requests via the handler instead of the network, recording them.
+    The handler returns the response of the request, or raises the error of a failed attempt.
+    """
+
+    uses_network = False
+
+    def __init__(self, handler: Callable[[requests.PreparedRequest], requests.Response]):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        with self._lock:
+            self.requests.append(request)
+
+        return self.handler(request)
+
+    def close(self):
+        pass
+
+    @property
+    def urls(self) -> list[str]:
+        return [request.url for request in self.requests]
@@ -0,0 +1,65 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from hydrachain_explorer_requester.async_explorer_requester import AsyncExplorerRequester, AsyncExplorerResponse
+from hydrachain_explorer_requester.retry import RetryPolicy
+
+NO_DELAY_POLICY = RetryPolicy(max_attempts=3, backoff_seconds=0.0, jitter=False, retry_timeouts=False)
+
+
+def send_failing(errors: list) -> tuple[int, BaseException | None]:
+    """
+    :return: the number of attempts made by the requester, whose attempts fail with the errors and then succeed,
+             and the raised error
+    """
+
+    explorer_requester = AsyncExplorerRequester()
+    attempts = 0
+
+    async def send_attempt(url, params, method, tried_backends):
+        nonlocal attempts
+        attempts += 1
+        if attempts <= len(errors):
+            raise errors[attempts - 1]
+
+        return AsyncExplorerResponse('GET', url, 200, {'Content-Type': 'application/json'}, b'{}')
+
+    explorer_requester._send_attempt = send_attempt
+
+    try:
+        asyncio.run(explorer_requester._send('https://explorer/api/info', {}, 'GET', NO_DELAY_POLICY))
+    except Exception as error:
+        return attempts, error
+
+    return attempts, None
+
+
+@pytest.mark.parametrize('error', [
+    asyncio.TimeoutError(),
+    aiohttp.ConnectionTimeoutError('Connection timeout to host'),
+    aiohttp.ClientConnectionError('Connection refused'),
+])
+def test_retries_the_connect_timeouts_without_timeout_retries(error):
+    assert send_failing([error, error]) == (3, None)
+
+
+def test_does_not_retry_the_read_timeouts_without_timeout_retries():
+    error = aiohttp.SocketTimeoutError('Timeout on reading data from socket')
+
+    assert send_failing([error]) == (1, error)
+
+
+def test_session_bounds_the_connecting_and_every_read_like_requests():
+    explorer_requester = AsyncExplorerRequester(timeout_seconds=5.0)
+
+    async def get_timeout() -> aiohttp.ClientTimeout:
+        try:
+            return explorer_requester._get_session().timeout
+        finally:
+            await explorer_requester.session.close()
+
+    timeout = asyncio.run(get_timeout())
+
+    assert (timeout.total, timeout.sock_connect, timeout.sock_read) == (None, 5.0, 5.0)
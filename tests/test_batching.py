@@ -0,0 +1,55 @@
+import pytest
+
+from hydrachain_explorer_requester.batching import order_by_keys, deduplicate, split_into_chunks
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+
+from fake_adapter import FakeAdapter, create_response
+
+
+def test_orders_the_items_by_the_keys_repeating_them():
+    items = [{'id': 'b'}, {'id': 'a'}]
+
+    assert order_by_keys(['a', 'b', 'a'], items, 'id') == [{'id': 'a'}, {'id': 'b'}, {'id': 'a'}]
+
+
+def test_raises_naming_the_keys_without_an_item():
+    with pytest.raises(KeyError, match=r"\['c', 'd'\]"):
+        order_by_keys(['a', 'c', 'd', 'c'], [{'id': 'a'}], 'id')
+
+
+def test_deduplicates_keeping_the_first_occurrences():
+    assert deduplicate(['b', 'a', 'b', 'c', 'a']) == ['b', 'a', 'c']
+
+
+def test_splits_into_chunks():
+    assert split_into_chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    with pytest.raises(ValueError):
+        split_into_chunks([1], 0)
+
+
+def create_requester(missing_ids: set) -> tuple[ExplorerRequester, FakeAdapter]:
+
+    def handler(request):
+        ids = request.path_url.rsplit('/', 1)[1].split(',')
+        return create_response(request, [{'id': transaction_id} for transaction_id in ids if transaction_id not in missing_ids])
+
+    http_adapter = FakeAdapter(handler)
+    return ExplorerRequester(http_adapter=http_adapter), http_adapter
+
+
+def test_get_transactions_lines_up_with_the_given_ids_across_chunks():
+    explorer_requester, http_adapter = create_requester(missing_ids=set())
+    transaction_ids = ['t3', 't1', 't2', 't1', 't4']
+
+    transactions = explorer_requester.get_transactions(transaction_ids, chunk_size=2)
+
+    assert [transaction['id'] for transaction in transactions] == transaction_ids
+    assert len(http_adapter.requests) == 2
+
+
+def test_get_transactions_raises_for_the_transactions_not_returned():
+    explorer_requester, _ = create_requester(missing_ids={'t2'})
+
+    with pytest.raises(KeyError, match='t2'):
+        explorer_requester.get_transactions(['t1', 't2', 't3'], chunk_size=2)
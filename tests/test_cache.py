@@ -0,0 +1,213 @@
+import os
+
+import pytest
+
+from hydrachain_explorer_requester.cache import (
+    CachedResponse, CachePolicy, MemoryCache, SQLiteCache, DEFAULT_CACHE_POLICIES, immutable, volatile
+)
+from hydrachain_explorer_requester.cache import memory_cache, sqlite_cache
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester, ResponseCodeError
+
+from fake_adapter import FakeAdapter, create_response
+
+
+class FakeClock:
+    """
+    Stands for the time module of the caches, advancing only when told to.
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(memory_cache, 'time', clock)
+    monkeypatch.setattr(sqlite_cache, 'time', clock)
+    return clock
+
+
+def cached(content: bytes) -> CachedResponse:
+    return CachedResponse(url='https://explorer/api/info', status_code=200, content=content,
+                          headers={'content-type': 'application/json'}, encoding='utf-8')
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, tmp_path, clock):
+    if request.param == 'memory':
+        yield MemoryCache()
+    else:
+        cache = SQLiteCache(tmp_path / 'cache.sqlite')
+        yield cache
+        cache.close()
+
+
+def test_serves_the_stored_responses_until_they_expire(cache, clock):
+    cache.set('volatile', cached(b'{"height": 1}'), ttl_seconds=5.0)
+    cache.set('immutable', cached(b'{"height": 2}'))
+
+    clock.advance(4.9)
+    assert cache.get('volatile').content == b'{"height": 1}'
+
+    clock.advance(0.1)
+    assert cache.get('volatile') is None
+    clock.advance(1e6)
+    assert cache.get('immutable').content == b'{"height": 2}'
+
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.stores, statistics.size) == (2, 1, 2, 1)
+
+
+def test_reconstructs_the_response(cache):
+    cache.set('key', cached(b'{"height": 1}'))
+
+    response = cache.get('key').to_response()
+
+    assert (response.status_code, response.url, response.json()) == (200, 'https://explorer/api/info', {'height': 1})
+    assert response.headers['Content-Type'] == 'application/json'
+
+
+def test_memory_cache_evicts_the_least_recently_used_entries():
+    cache = MemoryCache(max_entries=2)
+    cache.set('a', cached(b'1'))
+    cache.set('b', cached(b'2'))
+    cache.get('a')
+    cache.set('c', cached(b'3'))
+
+    assert [key for key in 'abc' if cache.get(key) is not None] == ['a', 'c']
+    assert cache.statistics().evictions == 1
+
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_sqlite_cache_persists_the_responses(tmp_path, compress):
+    content = b'{"logs": [' + b', '.join(b'{"data": "00ff"}' for _ in range(100)) + b']}'
+    cache = SQLiteCache(tmp_path / 'cache.sqlite', compress=compress)
+    cache.set('key', cached(content))
+    cache.close()
+
+    reopened = SQLiteCache(tmp_path / 'cache.sqlite')
+    assert reopened.get('key').content == content
+    reopened.close()
+
+
+def test_sqlite_cache_evicts_the_least_recently_used_entries_over_max_bytes(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / 'cache.sqlite', max_bytes=256 * 1024, compress=False, access_resolution_seconds=0)
+
+    for index in range(100):
+        cache.set(f'key{index}', cached(os.urandom(8 * 1024)))
+        clock.advance(1)
+        # Keeps the first entry the most recently used one
+        assert cache.get('key0') is not None
+        clock.advance(1)
+
+    statistics = cache.statistics()
+    assert statistics.evictions > 0
+    assert statistics.size < 100
+    assert cache.get('key1') is None
+    assert cache.get('key0') is not None
+    assert cache.get('key99') is not None
+    cache.close()
+
+
+class FakeExplorer:
+    """
+    Serves the blocks and the chain's info, counting the requests of every path.
+    """
+
+    def __init__(self, confirmations: int):
+        self.confirmations = confirmations
+        self.height = 100
+        self.http_adapter = FakeAdapter(self.handle)
+
+    def handle(self, request):
+        path = request.path_url
+        if path.endswith('/info'):
+            return create_response(request, {'height': self.height})
+        if '/block/' in path:
+            return create_response(request, {'height': 1, 'hash': 'a1', 'confirmations': self.confirmations})
+        if '/raw-tx/' in path:
+            return create_response(request, content=b'0200', headers={'Content-Type': 'text/plain'})
+
+        return create_response(request, {'error': 'not found'}, status_code=404)
+
+    def count(self, path: str) -> int:
+        return sum(url.endswith(path) for url in self.http_adapter.urls)
+
+
+def create_requester(explorer: FakeExplorer, cache_policies: dict = None) -> ExplorerRequester:
+    return ExplorerRequester(http_adapter=explorer.http_adapter, cache=MemoryCache(), cache_policies=cache_policies)
+
+
+def test_caches_a_block_only_once_it_has_the_min_confirmations(clock):
+    explorer = FakeExplorer(confirmations=3)
+    explorer_requester = create_requester(explorer, {Endpoint.BLOCK: immutable(min_confirmations=10)})
+
+    explorer_requester.get_block(1)
+    explorer_requester.get_block(1)
+    assert explorer.count('/block/1') == 2
+
+    explorer.confirmations = 10
+    explorer_requester.get_block(1)
+    explorer_requester.get_block(1)
+    assert explorer.count('/block/1') == 3
+
+
+def test_caches_the_volatile_endpoints_for_their_ttl(clock):
+    explorer = FakeExplorer(confirmations=0)
+    explorer_requester = create_requester(explorer, {Endpoint.INFO: volatile(ttl_seconds=5.0)})
+
+    assert explorer_requester.get_info()['height'] == 100
+    explorer.height = 101
+    clock.advance(4.0)
+    assert explorer_requester.get_info()['height'] == 100
+
+    clock.advance(1.0)
+    assert explorer_requester.get_info()['height'] == 101
+    assert explorer.count('/info') == 2
+
+
+def test_caches_the_non_json_responses_regardless_of_confirmations(clock):
+    explorer = FakeExplorer(confirmations=0)
+    explorer_requester = create_requester(explorer, {Endpoint.RAW_TRANSACTION: immutable(min_confirmations=10)})
+
+    assert explorer_requester.get_raw_transaction('t1') == '0200'
+    assert explorer_requester.get_raw_transaction('t1') == '0200'
+    assert explorer.count('/raw-tx/t1') == 1
+
+
+def test_doesnt_cache_the_failed_responses(clock):
+    explorer = FakeExplorer(confirmations=0)
+    explorer_requester = create_requester(explorer, {Endpoint.TRANSACTION: immutable(min_confirmations=0)})
+
+    for _ in range(2):
+        with pytest.raises(ResponseCodeError):
+            explorer_requester.get_transaction('t1')
+
+    assert explorer.count('/tx/t1') == 2
+
+
+def test_cache_policy_checks_every_item_of_a_list():
+    cache_policy = CachePolicy(min_confirmations=10)
+    response = create_response(None, [{'confirmations': 12}, {'confirmations': 9}])
+
+    assert not cache_policy.is_cacheable(response)
+    assert cache_policy.is_cacheable(response, [{'confirmations': 12}, {'id': 't1'}])
+    assert not cache_policy.is_cacheable(create_response(None, {'confirmations': 12}, status_code=500))
+
+
+def test_default_policies_cache_the_chain_tip_data_only_briefly():
+    assert DEFAULT_CACHE_POLICIES[Endpoint.BLOCK].min_confirmations > 0
+    assert DEFAULT_CACHE_POLICIES[Endpoint.BLOCK].ttl_seconds is None
+    assert DEFAULT_CACHE_POLICIES[Endpoint.INFO].ttl_seconds is not None
+    assert DEFAULT_CACHE_POLICIES[Endpoint.RECENT_BLOCKS].ttl_seconds is not None
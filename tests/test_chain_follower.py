@@ -0,0 +1,117 @@
+from hydrachain_explorer_requester.chain_follower import ChainFollower
+from hydrachain_explorer_requester.concurrency import ConcurrentResult
+
+
+class FakeChain:
+    """
+    The explorer's view of a chain, whose blocks can be replaced to simulate reorgs.
+    A reported height below the chain's height simulates a lagging explorer.
+    """
+
+    def __init__(self, height: int):
+        self.blocks = {}
+        self.reported_height = None
+        for block_height in range(1, height + 1):
+            self.add_block(block_height)
+
+    def add_block(self, height: int, branch: str = 'a'):
+        previous = self.blocks.get(height - 1)
+        self.blocks[height] = {
+            'height': height,
+            'hash': f'{branch}{height}',
+            'prevHash': previous['hash'] if previous else None,
+            'timestamp': height * 32,
+            'interval': 32
+        }
+
+    @property
+    def height(self) -> int:
+        return max(self.blocks)
+
+    @property
+    def visible_height(self) -> int:
+        return self.reported_height if self.reported_height is not None else self.height
+
+    def get_info(self) -> dict:
+        return {'height': self.visible_height}
+
+    def get_block_interval(self) -> list:
+        return [{'interval': 32, 'count': 1}]
+
+    def get_recent_blocks(self, query_parameters) -> list:
+        count = query_parameters.count.value
+        return [self.blocks[height] for height in range(self.visible_height, max(0, self.visible_height - count), -1)]
+
+    def get_blocks_range(self, start_height: int, end_height: int, concurrency: int):
+        for height in range(start_height, end_height + 1):
+            yield ConcurrentResult(height, result=self.blocks[height])
+
+
+def create_follower(chain: FakeChain, **kwargs) -> tuple[ChainFollower, list, list]:
+    chain_follower = ChainFollower(chain, min_poll_seconds=0, **kwargs)
+    delivered = []
+    reorgs = []
+    chain_follower.add_block_listener(delivered.append)
+    chain_follower.add_reorg_listener(lambda fork_height, hashes: reorgs.append((fork_height, hashes)))
+    return chain_follower, delivered, reorgs
+
+
+def test_delivers_the_new_blocks_in_height_order():
+    chain = FakeChain(10)
+    chain_follower, delivered, reorgs = create_follower(chain, start_height=5)
+
+    chain_follower.poll()
+    chain.add_block(11)
+    chain.add_block(12)
+    chain_follower.poll()
+
+    assert [block['height'] for block in delivered] == list(range(5, 13))
+    assert reorgs == []
+
+
+def test_detects_a_reorg_keeping_the_tip_height():
+    chain = FakeChain(10)
+    chain_follower, delivered, reorgs = create_follower(chain, start_height=8)
+    chain_follower.poll()
+
+    chain.add_block(10, branch='b')
+    blocks = chain_follower.poll()
+
+    assert reorgs == [(10, ['a10'])]
+    assert [block['hash'] for block in blocks] == ['b10']
+    assert chain_follower.height == 10
+
+
+def test_skips_a_stale_tip_without_rolling_back():
+    chain = FakeChain(10)
+    chain_follower, delivered, reorgs = create_follower(chain, start_height=8)
+    chain_follower.poll()
+
+    chain.reported_height = 7
+    assert chain_follower.poll() == []
+
+    assert reorgs == []
+    assert chain_follower.height == 10
+    assert chain_follower.tip_height == 10
+
+
+def test_unchanged_tip_delivers_nothing():
+    chain = FakeChain(10)
+    chain_follower, delivered, reorgs = create_follower(chain, start_height=8)
+    chain_follower.poll()
+
+    assert chain_follower.poll() == []
+    assert [block['height'] for block in delivered] == [8, 9, 10]
+
+
+def test_notifies_the_tip_listeners_after_a_reorg_keeping_the_tip_height():
+    chain = FakeChain(10)
+    chain_follower, delivered, reorgs = create_follower(chain, start_height=8)
+    tips = []
+    chain_follower.add_tip_listener(tips.append)
+    chain_follower.poll()
+
+    chain.add_block(10, branch='b')
+    chain_follower.poll()
+
+    assert tips == [10, 10]
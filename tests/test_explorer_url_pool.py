@@ -0,0 +1,213 @@
+import threading
+
+import pytest
+
+from hydrachain_explorer_requester import explorer_url_pool
+from hydrachain_explorer_requester.enum import LoadBalancing
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.explorer_url_pool import ExplorerURLPool
+from hydrachain_explorer_requester.retry import RetryPolicy
+
+from fake_adapter import FakeAdapter, create_response
+
+NO_DELAY_POLICY = RetryPolicy(max_attempts=3, backoff_seconds=0.0, jitter=False)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(explorer_url_pool, 'time', clock)
+    return clock
+
+
+def create_pool(count: int, **kwargs) -> ExplorerURLPool:
+    return ExplorerURLPool([ExplorerURL(f'https://explorer{index}.test') for index in range(count)], **kwargs)
+
+
+class FakeBackends:
+    """
+    Answers the requests of every explorer of the pool by its own status code, counting the requests it received.
+    """
+
+    def __init__(self, status_codes: dict):
+        self.status_codes = status_codes
+        self.http_adapter = FakeAdapter(self.handle)
+
+    def handle(self, request):
+        domain = request.url.split('/')[2]
+        status_code = self.status_codes[domain]
+        return create_response(request, {'height': 1, 'explorer': domain}, status_code=status_code)
+
+    def count(self, domain: str, path: str = '') -> int:
+        return sum(url.split('/')[2] == domain and url.endswith(path) for url in self.http_adapter.urls)
+
+
+def wait_for_health_checks():
+    for thread in threading.enumerate():
+        if thread.name == 'explorer-health-check':
+            thread.join()
+
+
+def test_least_outstanding_spreads_the_requests_in_flight():
+    pool = create_pool(3)
+
+    backends = [pool.acquire() for _ in range(3)]
+    assert backends == pool.backends
+
+    pool.release(backends[1])
+    assert pool.acquire() is backends[1]
+
+
+def test_least_outstanding_takes_turns_between_the_idle_backends():
+    pool = create_pool(2)
+
+    picked = []
+    for _ in range(4):
+        backend = pool.acquire()
+        picked.append(pool.backends.index(backend))
+        pool.release(backend, 0.1)
+
+    assert picked == [0, 1, 0, 1]
+
+
+def test_avoids_the_excluded_backends_while_there_are_others():
+    pool = create_pool(2)
+
+    assert pool.acquire(excluded=[pool.backends[0]]) is pool.backends[1]
+    assert pool.acquire(excluded=pool.backends) is pool.backends[0]
+
+
+def test_latency_measures_every_backend_and_then_prefers_the_fastest():
+    pool = create_pool(3, load_balancing=LoadBalancing.LATENCY)
+    fast, slow, unmeasured = pool.backends
+
+    pool.release(pool.acquire(), 0.1)
+    pool.release(pool.acquire(), 1.0)
+    assert pool.acquire() is unmeasured
+    pool.release(unmeasured, 2.0)
+
+    assert (fast.latency_seconds, slow.latency_seconds) == (0.1, 1.0)
+    assert pool.acquire() is fast
+    # Weighted by its requests in flight, the fast backend is still preferred until it is as loaded as the slow one
+    assert [pool.acquire() for _ in range(8)] == [fast] * 8
+    assert pool.acquire() is slow
+
+
+def test_latency_is_a_moving_average():
+    pool = create_pool(1, load_balancing=LoadBalancing.LATENCY)
+    backend = pool.backends[0]
+
+    pool.release(pool.acquire(), 1.0)
+    pool.release(pool.acquire(), 2.0)
+    pool.release(pool.acquire(), failed=True)
+
+    assert backend.latency_seconds == pytest.approx(1.2)
+
+
+def test_ejects_a_backend_after_max_failures_in_a_row(clock):
+    pool = create_pool(2, max_failures=2)
+    failing = pool.backends[0]
+
+    pool.release(pool.acquire(), failed=True)
+    pool.release(pool.acquire([pool.backends[1]]), 0.1)
+    assert not failing.is_ejected()
+
+    pool.release(pool.acquire([pool.backends[1]]), failed=True)
+    pool.release(pool.acquire([pool.backends[1]]), failed=True)
+    assert failing.ejected_at == clock.now
+
+    assert [pool.acquire() for _ in range(3)] == [pool.backends[1]] * 3
+    assert not pool.has_untried_backend([pool.backends[1]])
+
+
+def test_sends_to_the_backend_ejected_the_longest_ago_while_all_are_ejected(clock):
+    pool = create_pool(2, max_failures=1)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    pool.release(second, failed=True)
+    clock.now += 1
+    pool.release(first, failed=True)
+
+    assert pool.acquire() is second
+
+
+def test_checks_the_ejected_backends_once_their_ejection_expired(clock):
+    pool = create_pool(2, max_failures=1, ejection_seconds=30.0)
+    failing = pool.backends[0]
+    pool.release(pool.acquire(), failed=True)
+
+    clock.now += 29.0
+    assert pool.get_backends_to_check() == []
+
+    clock.now += 1.0
+    assert pool.get_backends_to_check() == [failing]
+    assert pool.get_backends_to_check() == []
+
+    pool.finish_check(failing, healthy=False)
+    assert failing.ejected_at == clock.now
+    clock.now += 30.0
+    assert pool.get_backends_to_check() == [failing]
+
+    pool.finish_check(failing, healthy=True)
+    assert not failing.is_ejected()
+    assert failing.consecutive_failures == 0
+
+
+def test_rebases_the_urls_onto_the_picked_backend():
+    pool = ExplorerURLPool([ExplorerURL('https://explorer.hydrachain.org'), ExplorerURL('https://mirror.test', '/api')])
+
+    url = pool.get_block_url(5)
+
+    assert url == 'https://explorer.hydrachain.org/7001/block/5'
+    assert pool.rebase(url, pool.backends[1]) == 'https://mirror.test/api/block/5'
+    assert pool.rebase(url, pool.backends[0]) == url
+
+
+def test_requester_fails_over_and_ejects_the_failing_backend(clock):
+    fake_backends = FakeBackends({'explorer0.test': 503, 'explorer1.test': 200})
+    pool = create_pool(2, max_failures=2)
+    explorer_requester = ExplorerRequester(http_adapter=fake_backends.http_adapter, urls=pool,
+                                           retry_policy=NO_DELAY_POLICY, retry_policies={})
+
+    for _ in range(4):
+        assert explorer_requester.get_info()['explorer'] == 'explorer1.test'
+
+    assert fake_backends.count('explorer0.test') == 2
+    assert fake_backends.count('explorer1.test') == 4
+    assert pool.backends[0].is_ejected()
+
+
+def test_requester_readmits_the_backend_once_its_health_check_succeeds(clock):
+    fake_backends = FakeBackends({'explorer0.test': 503, 'explorer1.test': 200})
+    pool = create_pool(2, max_failures=1, ejection_seconds=30.0)
+    explorer_requester = ExplorerRequester(http_adapter=fake_backends.http_adapter, urls=pool,
+                                           retry_policy=NO_DELAY_POLICY, retry_policies={})
+
+    explorer_requester.get_info()
+    assert pool.backends[0].is_ejected()
+
+    clock.now += 30.0
+    explorer_requester.get_block(1)
+    wait_for_health_checks()
+    assert fake_backends.count('explorer0.test', '/info') == 2
+    assert pool.backends[0].is_ejected()
+
+    fake_backends.status_codes['explorer0.test'] = 200
+    clock.now += 30.0
+    explorer_requester.get_block(2)
+    wait_for_health_checks()
+    assert not pool.backends[0].is_ejected()
+
+    explorer_requester.get_block(3)
+    assert fake_backends.count('explorer0.test', '/block/3') == 1
@@ -0,0 +1,106 @@
+import threading
+
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.explorer_url_pool import ExplorerURLPool
+from hydrachain_explorer_requester.hedging import HedgingPolicy
+from hydrachain_explorer_requester.retry import NO_RETRY_POLICY
+
+from fake_adapter import FakeAdapter, create_response
+
+
+def test_hedges_only_after_min_samples_of_the_hedged_endpoints():
+    hedging_policy = HedgingPolicy(percentile=50.0, min_samples=4, endpoints=frozenset({Endpoint.BLOCK}))
+
+    for latency_seconds in (0.4, 0.1, 0.3):
+        hedging_policy.record_latency(Endpoint.BLOCK, latency_seconds)
+    assert hedging_policy.get_delay_seconds(Endpoint.BLOCK) is None
+
+    hedging_policy.record_latency(Endpoint.BLOCK, 0.2)
+    assert hedging_policy.get_delay_seconds(Endpoint.BLOCK) == 0.2
+    assert hedging_policy.get_delay_seconds(Endpoint.INFO) is None
+
+
+def test_hedges_no_sooner_than_the_min_delay():
+    hedging_policy = HedgingPolicy(min_samples=1, min_delay_seconds=0.5)
+    hedging_policy.record_latency(Endpoint.BLOCK, 0.1)
+
+    assert hedging_policy.get_delay_seconds(Endpoint.BLOCK) == 0.5
+
+
+def test_budget_grows_by_the_max_hedge_ratio_per_request_up_to_the_max_budget():
+    hedging_policy = HedgingPolicy(max_hedge_ratio=0.25, max_budget=2.0)
+
+    for _ in range(3):
+        hedging_policy.get_delay_seconds(Endpoint.BLOCK)
+    assert not hedging_policy.try_acquire_hedge()
+
+    hedging_policy.get_delay_seconds(Endpoint.BLOCK)
+    assert hedging_policy.try_acquire_hedge()
+
+    for _ in range(100):
+        hedging_policy.get_delay_seconds(Endpoint.BLOCK)
+    assert [hedging_policy.try_acquire_hedge() for _ in range(3)] == [True, True, False]
+
+    statistics = hedging_policy.statistics()
+    assert (statistics.requests, statistics.hedges, statistics.hedges_over_budget) == (104, 3, 2)
+
+
+class StalledBackend:
+    """
+    Answers the requests of the first explorer only once released, while the other explorers answer right away.
+    """
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.answered = threading.Event()
+        self.http_adapter = FakeAdapter(self.handle)
+
+    def handle(self, request):
+        domain = request.url.split('/')[2]
+        if domain == 'explorer0.test':
+            self.released.wait()
+
+        response = create_response(request, {'height': 1, 'explorer': domain})
+        if domain == 'explorer0.test':
+            self.answered.set()
+
+        return response
+
+
+def create_requester(backend: StalledBackend, hedging_policy: HedgingPolicy) -> ExplorerRequester:
+    pool = ExplorerURLPool([ExplorerURL('https://explorer0.test'), ExplorerURL('https://explorer1.test')])
+    return ExplorerRequester(http_adapter=backend.http_adapter, urls=pool, retry_policy=NO_RETRY_POLICY,
+                             retry_policies={}, hedging_policy=hedging_policy)
+
+
+def test_hedges_the_stalled_request_to_another_backend():
+    backend = StalledBackend()
+    hedging_policy = HedgingPolicy(min_samples=1, max_hedge_ratio=1.0)
+    hedging_policy.record_latency(Endpoint.BLOCK, 0.05)
+
+    with create_requester(backend, hedging_policy) as explorer_requester:
+        try:
+            assert explorer_requester.get_block(1)['explorer'] == 'explorer1.test'
+        finally:
+            backend.released.set()
+
+        assert backend.answered.wait(timeout=5.0)
+
+    assert backend.http_adapter.urls == ['https://explorer0.test/7001/block/1', 'https://explorer1.test/7001/block/1']
+    statistics = hedging_policy.statistics()
+    assert (statistics.hedges, statistics.hedge_wins) == (1, 1)
+
+
+def test_waits_for_the_stalled_request_without_a_hedge_budget():
+    backend = StalledBackend()
+    hedging_policy = HedgingPolicy(min_samples=1, max_hedge_ratio=0.5)
+    hedging_policy.record_latency(Endpoint.BLOCK, 0.05)
+    threading.Timer(0.2, backend.released.set).start()
+
+    with create_requester(backend, hedging_policy) as explorer_requester:
+        assert explorer_requester.get_block(1)['explorer'] == 'explorer0.test'
+
+    assert len(backend.http_adapter.requests) == 1
+    assert hedging_policy.statistics().hedges_over_budget == 1
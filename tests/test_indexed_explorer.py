@@ -0,0 +1,126 @@
+import pytest
+
+from hydrachain_explorer_requester.store import ExplorerStore, IndexedExplorer
+
+CONTRACT = '4ab26aaa1803daa638910d71075c06386e391147'
+TRANSFER = 'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+APPROVAL = '8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925'
+
+
+def create_transaction(transaction_id: str, block_height: int, block_hash: str, address: str, topics: list) -> dict:
+    return {
+        'id': transaction_id,
+        'blockHeight': block_height,
+        'blockHash': block_hash,
+        'inputs': [{'address': address}],
+        'outputs': [{
+            'address': address,
+            'value': '1000',
+            'receipt': {'logs': [{'addressHex': CONTRACT, 'topics': [topic], 'data': ''} for topic in topics]}
+        }]
+    }
+
+
+class FakeExplorerRequester:
+
+    def __init__(self):
+        self.blocks = {}
+        self.transactions = {}
+        self.search_logs_total_count = 0
+
+    def add_block(self, height: int, block_hash: str, transactions: list):
+        self.blocks[height] = {'height': height, 'hash': block_hash, 'transactions': [transaction['id'] for transaction in transactions]}
+        self.transactions.update({transaction['id']: transaction for transaction in transactions})
+
+    def get_block(self, height: int) -> dict:
+        return self.blocks[height]
+
+    def get_transaction(self, transaction_id: str) -> dict:
+        return self.transactions[transaction_id]
+
+    def get_transactions(self, transaction_ids: list) -> list:
+        return [self.transactions[transaction_id] for transaction_id in transaction_ids]
+
+    def get_search_logs(self, query_parameters) -> dict:
+        return {'totalCount': self.search_logs_total_count, 'logs': []}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ExplorerStore(tmp_path / 'explorer.sqlite')
+    yield store
+    store.close()
+
+
+def test_counts_the_logs_of_indexed_ranges_locally(store):
+    explorer_requester = FakeExplorerRequester()
+    explorer_requester.add_block(1, 'a1', [create_transaction('t1', 1, 'a1', 'H1', [TRANSFER, APPROVAL, TRANSFER])])
+    explorer_requester.add_block(2, 'a2', [create_transaction('t2', 2, 'a2', 'H2', [TRANSFER])])
+    indexed_explorer = IndexedExplorer(explorer_requester, store)
+
+    assert indexed_explorer.index_blocks(1, 2) == 2
+    assert indexed_explorer.count_logs(CONTRACT, TRANSFER, 1, 2) == 3
+    assert indexed_explorer.count_logs(CONTRACT, APPROVAL, 1, 2) == 1
+
+
+def test_counting_unindexed_ranges_leaves_the_indexed_logs_intact(store):
+    explorer_requester = FakeExplorerRequester()
+    explorer_requester.add_block(1, 'a1', [create_transaction('t1', 1, 'a1', 'H1', [TRANSFER, APPROVAL, TRANSFER])])
+    indexed_explorer = IndexedExplorer(explorer_requester, store)
+    indexed_explorer.index_blocks(1, 1)
+
+    explorer_requester.search_logs_total_count = 7
+    assert indexed_explorer.count_logs(CONTRACT, TRANSFER, 1, 5) == 7
+
+    assert indexed_explorer.count_logs(CONTRACT, TRANSFER, 1, 1) == 2
+    assert indexed_explorer.count_logs(CONTRACT, APPROVAL, 1, 1) == 1
+
+
+def test_reindexing_a_reorged_height_removes_the_orphaned_transactions(store):
+    explorer_requester = FakeExplorerRequester()
+    explorer_requester.add_block(1, 'a1', [create_transaction('t1', 1, 'a1', 'H1', [TRANSFER])])
+    indexed_explorer = IndexedExplorer(explorer_requester, store)
+    indexed_explorer.index_blocks(1, 1)
+
+    explorer_requester.add_block(1, 'b1', [create_transaction('t2', 1, 'b1', 'H2', [APPROVAL])])
+    store.add_block(explorer_requester.get_block(1))
+    indexed_explorer.index_blocks(1, 1)
+
+    assert store.get_block(1)['hash'] == 'b1'
+    assert store.get_transaction('t1') is None
+    assert store.get_address_transactions('H1', 1, 1) == []
+    assert store.get_address_transactions('H2', 1, 1) == ['t2']
+    assert store.count_logs(CONTRACT, TRANSFER, 1, 1) == 0
+    assert [transfer.transaction_id for transfer in store.get_largest_transfers(1, 1)] == ['t2']
+
+
+def test_stores_a_looked_up_block_only_once_confirmed(store):
+    explorer_requester = FakeExplorerRequester()
+    explorer_requester.add_block(1, 'a1', [])
+    explorer_requester.blocks[1]['confirmations'] = 1
+    indexed_explorer = IndexedExplorer(explorer_requester, store, min_confirmations=10)
+
+    assert indexed_explorer.get_block(1)['hash'] == 'a1'
+    assert store.get_block(1) is None
+
+    explorer_requester.add_block(1, 'b1', [])
+    explorer_requester.blocks[1]['confirmations'] = 10
+
+    assert indexed_explorer.get_block(1)['hash'] == 'b1'
+    assert store.get_block(1)['hash'] == 'b1'
+
+
+def test_refetches_an_unconfirmed_transaction(store):
+    explorer_requester = FakeExplorerRequester()
+    transaction = create_transaction('t1', None, None, 'H1', [TRANSFER])
+    explorer_requester.transactions['t1'] = {**transaction, 'confirmations': 0}
+    indexed_explorer = IndexedExplorer(explorer_requester, store, min_confirmations=10)
+
+    assert indexed_explorer.get_transaction('t1')['blockHeight'] is None
+    assert store.get_transaction('t1') is None
+    assert store.get_address_transactions('H1', 0, 100) == []
+
+    explorer_requester.transactions['t1'] = {**transaction, 'blockHeight': 5, 'blockHash': 'a5', 'confirmations': 12}
+
+    assert indexed_explorer.get_transaction('t1')['blockHeight'] == 5
+    assert store.get_transaction('t1')['blockHeight'] == 5
@@ -0,0 +1,56 @@
+import pytest
+import requests
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.json_decoding import decode_json, stdlib_decoder, get_default_json_decoder
+
+from fake_adapter import FakeAdapter, create_response
+
+
+def available_decoders() -> list:
+    decoders = [stdlib_decoder, get_default_json_decoder()]
+
+    try:
+        import orjson
+        decoders.append(orjson.loads)
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+        decoders.append(msgspec.json.Decoder().decode)
+    except ImportError:
+        pass
+
+    return decoders
+
+
+@pytest.mark.parametrize('json_decoder', available_decoders())
+def test_decodes_a_valid_body(json_decoder):
+    assert decode_json(json_decoder, b'{"height": 1, "hash": "a1"}') == {'height': 1, 'hash': 'a1'}
+
+
+@pytest.mark.parametrize('json_decoder', available_decoders())
+def test_raises_the_json_decode_error_of_requests_whichever_the_decoder(json_decoder):
+    with pytest.raises(requests.JSONDecodeError) as error:
+        decode_json(json_decoder, b'{"height": 1,')
+
+    assert isinstance(error.value, ValueError)
+
+
+def test_keeps_the_errors_other_than_decoding():
+
+    def failing_decoder(content: bytes):
+        raise TypeError('not a decoding error')
+
+    with pytest.raises(TypeError):
+        decode_json(failing_decoder, b'{}')
+
+
+@pytest.mark.parametrize('json_decoder', available_decoders())
+def test_requester_raises_the_json_decode_error_of_requests(json_decoder):
+    http_adapter = FakeAdapter(lambda request: create_response(request, content=b'<html>'))
+    explorer_requester = ExplorerRequester(http_adapter=http_adapter, json_decoder=json_decoder)
+
+    with pytest.raises(requests.JSONDecodeError):
+        explorer_requester.get_info()
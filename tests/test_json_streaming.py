@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from hydrachain_explorer_requester.json_streaming import iterate_json_array_items
+
+BODIES = [
+    (None, b'[]'),
+    (None, b' [1, -2.5e3, true ,false,null, "a", {}, []] '),
+    ('logs', b'{"totalCount": 3, "logs": [{"a": 1}, {"b": [1, {"c": "]}"}]}, "x"], "after": [4]}'),
+    # The key's name elsewhere, as a nested key and as a string value, doesn't select those arrays
+    ('logs', b'{"type": "logs", "nested": {"logs": [0]}, "list": [{"logs": [1]}], "logs": [2, 3]}'),
+    # Escaped quotes and backslashes in the keys, the items and the strings before the array
+    ('logs', b'{"k\\"ey": "v\\\\\\"]", "logs": ["a\\"b", {"c\\\\": "\\"[{"}, "\\\\"]}'),
+    ('items', b'{"items": [[[]], [[1], [2, [3]]], {"a": {"b": {}}}]}'),
+]
+
+
+def split(body: bytes, chunk_size: int) -> list[bytes]:
+    return [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 1024])
+@pytest.mark.parametrize('items_key, body', BODIES)
+def test_yields_the_items_of_the_array_in_any_chunking(items_key, body, chunk_size):
+    decoded = json.loads(body)
+    expected = decoded if items_key is None else decoded[items_key]
+
+    items = list(iterate_json_array_items(split(body, chunk_size), items_key))
+
+    assert [json.loads(item) for item in items] == expected
+
+
+def test_yields_the_undecoded_bytes_of_the_items():
+    body = b'{"logs": [ {"a" : 1} ,"b",2 ]}'
+
+    assert list(iterate_json_array_items(split(body, 4), 'logs')) == [b'{"a" : 1}', b'"b"', b'2']
+
+
+def test_yields_nothing_without_the_key():
+    body = b'{"totalCount": 0, "other": [1, 2]}'
+
+    assert list(iterate_json_array_items(split(body, 3), 'logs')) == []
+
+
+def test_stops_reading_the_chunks_once_the_array_is_closed():
+    read_chunks = []
+
+    def chunks():
+        for chunk in [b'{"logs": [1, ', b'2]', b', "totalCount": 2', b'}']:
+            read_chunks.append(chunk)
+            yield chunk
+
+    assert list(iterate_json_array_items(chunks(), 'logs')) == [b'1', b'2']
+    assert read_chunks == [b'{"logs": [1, ', b'2]']
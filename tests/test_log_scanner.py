@@ -0,0 +1,134 @@
+import random
+import threading
+import time
+
+import pytest
+import requests
+
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester
+from hydrachain_explorer_requester.log_scanner import LogScanner
+from hydrachain_explorer_requester.pagination import iterate_paginated
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+from hydrachain_explorer_requester.retry import RetryPolicy, EXPENSIVE_RETRY_POLICY
+
+from fake_adapter import FakeAdapter, create_response
+
+
+class FakeExplorerRequester:
+    """
+    Serves the search logs of a chain, whose blocks hold the given numbers of logs, after a random delay.
+    Ranges wider than timeout_blocks time out, after as many retries as the retry policy of the request allows.
+    """
+
+    def __init__(self, logs_per_block: dict, timeout_blocks: int = None):
+        self.logs_per_block = logs_per_block
+        self.timeout_blocks = timeout_blocks
+        self.retry_policy = RetryPolicy()
+        self.retry_policies = {Endpoint.SEARCH_LOGS: EXPENSIVE_RETRY_POLICY}
+        self.requests = []
+        self.retried_ranges = []
+        self._lock = threading.Lock()
+
+    def get_search_logs(self, query_parameters: SearchLogsQueryParameters, retry_policy: RetryPolicy = None) -> dict:
+        from_block = query_parameters.from_block.value
+        to_block = query_parameters.to_block.value
+        with self._lock:
+            self.requests.append(query_parameters.pairs())
+
+        time.sleep(random.uniform(0, 0.002))
+        if self.timeout_blocks is not None and to_block - from_block + 1 > self.timeout_blocks:
+            retry_policy = retry_policy or self.retry_policies.get(Endpoint.SEARCH_LOGS, self.retry_policy)
+            if retry_policy.should_retry_error('GET', 1, timed_out=True):
+                with self._lock:
+                    self.retried_ranges.append((from_block, to_block))
+            raise requests.ReadTimeout(f'blocks {from_block} to {to_block}')
+
+        logs = [{'blockHeight': height, 'position': position}
+                for height in range(from_block, to_block + 1)
+                for position in range(self.logs_per_block.get(height, 0))]
+        # The explorer orders the logs of a block by their index, but not necessarily the blocks
+        logs.sort(key=lambda log: (-log['blockHeight'], log['position']))
+
+        page_size = query_parameters.page_size.value
+        start = query_parameters.page.value * page_size
+        return {'totalCount': len(logs), 'logs': logs[start:start + page_size]}
+
+    def iter_search_logs(self, query_parameters: SearchLogsQueryParameters, page_size: int = None):
+        return iterate_paginated(self.get_search_logs, query_parameters, 'logs', page_size)
+
+
+def expected_logs(logs_per_block: dict, from_block: int, to_block: int) -> list:
+    return [(height, position) for height in range(from_block, to_block + 1) for position in range(logs_per_block.get(height, 0))]
+
+
+def scanned_logs(log_scanner: LogScanner, from_block: int, to_block: int, **kwargs) -> list:
+    return [(log['blockHeight'], log['position']) for log in log_scanner.scan(from_block, to_block, **kwargs)]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_scans_a_dense_range_in_block_and_log_order(seed):
+    random.seed(seed)
+    logs_per_block = {height: random.choice([0, 0, 1, 3]) for height in range(1, 5001)}
+    logs_per_block[777] = 250
+    explorer_requester = FakeExplorerRequester(logs_per_block)
+    log_scanner = LogScanner(explorer_requester, sub_range_blocks=700, max_logs_per_request=100, concurrency=8)
+
+    assert scanned_logs(log_scanner, 1, 5000) == expected_logs(logs_per_block, 1, 5000)
+
+
+def test_halves_the_timed_out_sub_ranges_without_retrying_them():
+    logs_per_block = {height: 1 for height in range(1, 1001)}
+    explorer_requester = FakeExplorerRequester(logs_per_block, timeout_blocks=150)
+    log_scanner = LogScanner(explorer_requester, sub_range_blocks=500, max_logs_per_request=1000, concurrency=4)
+
+    assert scanned_logs(log_scanner, 1, 1000) == expected_logs(logs_per_block, 1, 1000)
+    assert explorer_requester.retried_ranges == []
+
+
+def test_requester_halves_the_timed_out_sub_ranges_without_retrying_them():
+    timed_out_ranges = []
+
+    def handler(request):
+        query = dict(parameter.split('=') for parameter in request.path_url.split('?')[1].split('&'))
+        from_block, to_block = int(query['fromBlock']), int(query['toBlock'])
+        if to_block - from_block + 1 > 100:
+            timed_out_ranges.append((from_block, to_block))
+            raise requests.ReadTimeout(f'blocks {from_block} to {to_block}')
+
+        logs = [{'blockHeight': height, 'position': 0} for height in range(from_block, to_block + 1)]
+        return create_response(request, {'totalCount': len(logs), 'logs': logs})
+
+    http_adapter = FakeAdapter(handler)
+    explorer_requester = ExplorerRequester(http_adapter=http_adapter, retry_policies={Endpoint.SEARCH_LOGS: EXPENSIVE_RETRY_POLICY})
+    log_scanner = LogScanner(explorer_requester, sub_range_blocks=400, concurrency=2)
+
+    assert scanned_logs(log_scanner, 1, 400) == [(height, 0) for height in range(1, 401)]
+    # Every timed out sub-range was requested once and then halved, into 4 sub-ranges of 100 blocks
+    assert sorted(timed_out_ranges) == [(1, 200), (1, 400), (201, 400)]
+    assert len(http_adapter.requests) == 7
+    assert explorer_requester.retry_policies[Endpoint.SEARCH_LOGS].retry_timeouts
+
+
+def test_retries_and_raises_the_timeout_once_a_sub_range_can_no_longer_be_halved():
+    explorer_requester = FakeExplorerRequester({1: 1}, timeout_blocks=1)
+    log_scanner = LogScanner(explorer_requester, sub_range_blocks=4, max_split_depth=1, concurrency=1)
+
+    with pytest.raises(requests.ReadTimeout):
+        list(log_scanner.scan(1, 4))
+
+    assert explorer_requester.retried_ranges == [(1, 2)]
+
+
+def test_ignores_the_pagination_of_the_query_parameters():
+    logs_per_block = {height: 2 for height in range(1, 101)}
+    explorer_requester = FakeExplorerRequester(logs_per_block)
+    log_scanner = LogScanner(explorer_requester, sub_range_blocks=10, max_logs_per_request=50)
+    query_parameters = SearchLogsQueryParameters()
+    query_parameters.set_limit(5)
+    query_parameters.set_offset(10)
+    query_parameters.set_from(0)
+    query_parameters.set_to(5)
+
+    assert scanned_logs(log_scanner, 1, 100, query_parameters=query_parameters) == expected_logs(logs_per_block, 1, 100)
+    assert all(not {'limit', 'offset', 'from', 'to'} & pairs.keys() for pairs in explorer_requester.requests)
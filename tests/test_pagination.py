@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from hydrachain_explorer_requester.pagination import iterate_paginated, aiterate_paginated
+from hydrachain_explorer_requester.query_parameters import SearchLogsQueryParameters
+
+
+class FakePaginatedEndpoint:
+    """
+    Serves the items in pages of the requested size, capped at max_page_size like an explorer limiting the page size.
+    """
+
+    def __init__(self, total_count: int, max_page_size: int = None, with_total_count: bool = True):
+        self.items = list(range(total_count))
+        self.max_page_size = max_page_size
+        self.with_total_count = with_total_count
+        self.requested_pages = []
+
+    def request(self, query_parameters: SearchLogsQueryParameters) -> dict:
+        page = query_parameters.page.value
+        page_size = query_parameters.page_size.value
+        if self.max_page_size is not None:
+            page_size = min(page_size, self.max_page_size)
+
+        self.requested_pages.append(page)
+        response = {'logs': self.items[page * page_size:(page + 1) * page_size]}
+        if self.with_total_count:
+            response['totalCount'] = len(self.items)
+
+        return response
+
+    async def arequest(self, query_parameters: SearchLogsQueryParameters) -> dict:
+        return self.request(query_parameters)
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_walks_all_pages_of_an_explorer_capping_the_page_size(prefetch):
+    endpoint = FakePaginatedEndpoint(230, max_page_size=50)
+
+    items = list(iterate_paginated(endpoint.request, SearchLogsQueryParameters(), 'logs', page_size=100, prefetch=prefetch))
+
+    assert items == endpoint.items
+    assert endpoint.requested_pages == [0, 1, 2, 3, 4]
+
+
+def test_stops_at_the_total_count_without_requesting_an_empty_page():
+    endpoint = FakePaginatedEndpoint(300)
+
+    assert list(iterate_paginated(endpoint.request, SearchLogsQueryParameters(), 'logs', page_size=100)) == endpoint.items
+    assert endpoint.requested_pages == [0, 1, 2]
+
+
+def test_starts_from_the_page_of_the_query_parameters():
+    endpoint = FakePaginatedEndpoint(230, max_page_size=50)
+    query_parameters = SearchLogsQueryParameters()
+    query_parameters.set_page(2)
+
+    assert list(iterate_paginated(endpoint.request, query_parameters, 'logs', page_size=100)) == endpoint.items[100:]
+
+
+def test_stops_at_a_short_page_without_the_total_count():
+    endpoint = FakePaginatedEndpoint(230, with_total_count=False)
+
+    assert list(iterate_paginated(endpoint.request, SearchLogsQueryParameters(), 'logs', page_size=100)) == endpoint.items
+    assert endpoint.requested_pages == [0, 1, 2]
+
+
+def test_stops_at_an_empty_page():
+    endpoint = FakePaginatedEndpoint(200, with_total_count=False)
+
+    assert list(iterate_paginated(endpoint.request, SearchLogsQueryParameters(), 'logs', page_size=100)) == endpoint.items
+    assert endpoint.requested_pages == [0, 1, 2]
+
+
+def test_async_walks_all_pages_of_an_explorer_capping_the_page_size():
+    endpoint = FakePaginatedEndpoint(230, max_page_size=50)
+
+    async def collect() -> list:
+        return [item async for item in aiterate_paginated(endpoint.arequest, SearchLogsQueryParameters(), 'logs', page_size=100)]
+
+    assert asyncio.run(collect()) == endpoint.items
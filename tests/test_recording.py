@@ -0,0 +1,135 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester, ResponseCodeError
+from hydrachain_explorer_requester.explorer_url import ExplorerURL
+from hydrachain_explorer_requester.recording import ArchiveMissError, RecordingAdapter, ReplayAdapter, ResponseArchive, get_archive_key
+from hydrachain_explorer_requester.retry import RetryPolicy
+
+from fake_adapter import FakeAdapter, create_response
+
+NO_DELAY_POLICY = RetryPolicy(max_attempts=2, backoff_seconds=0.0, jitter=False)
+
+
+class FakeExplorer:
+    """
+    Answers the requests, which the RecordingAdapter sends to the network.
+    """
+
+    def __init__(self):
+        self.http_adapter = FakeAdapter(self.handle)
+
+    def handle(self, request):
+        path = request.path_url
+        if '/block/' in path:
+            return create_response(request, {'height': 1, 'hash': 'a1', 'confirmations': 50})
+        if '/raw-tx/' in path:
+            return create_response(request, content=b'0200', headers={'Content-Type': 'text/plain; charset=utf-8'})
+        if path.endswith('/info'):
+            return create_response(request, {'error': 'unavailable'}, status_code=503)
+
+        return create_response(request, {'error': 'not found'}, status_code=404)
+
+
+@pytest.fixture
+def explorer(monkeypatch) -> FakeExplorer:
+    explorer = FakeExplorer()
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda adapter, request, *args, **kwargs: explorer.http_adapter.send(request))
+    return explorer
+
+
+def create_requester(http_adapter, domain: str = 'https://explorer.hydrachain.org') -> ExplorerRequester:
+    return ExplorerRequester(http_adapter=http_adapter, urls=ExplorerURL(domain),
+                             retry_policy=NO_DELAY_POLICY, retry_policies={}, cache_policies={})
+
+
+def send(http_adapter, url: str) -> requests.Response:
+    with requests.Session() as session:
+        session.mount('https://', http_adapter)
+        return session.get(url)
+
+
+URLS = [
+    'https://explorer.hydrachain.org/7001/block/1',
+    'https://explorer.hydrachain.org/7001/raw-tx/t1',
+    'https://explorer.hydrachain.org/7001/tx/missing',
+    'https://explorer.hydrachain.org/7001/search-logs?fromBlock=1&toBlock=9',
+]
+
+
+def test_replays_the_recorded_responses_identically(explorer, tmp_path):
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+    recorded = [send(RecordingAdapter(archive), url) for url in URLS]
+    archive.close()
+
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+    replayed = [send(ReplayAdapter(archive), url) for url in URLS]
+
+    assert len(explorer.http_adapter.requests) == len(URLS)
+    for recorded_response, replayed_response in zip(recorded, replayed):
+        assert replayed_response.url == recorded_response.url
+        assert replayed_response.status_code == recorded_response.status_code
+        assert replayed_response.headers['Content-Type'] == recorded_response.headers['Content-Type']
+        assert replayed_response.encoding == recorded_response.encoding
+        assert replayed_response.content == recorded_response.content
+        assert replayed_response.text == recorded_response.text
+    archive.close()
+
+
+def test_replays_through_the_requester_from_any_explorer_instance(explorer, tmp_path):
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+    recording_requester = create_requester(RecordingAdapter(archive))
+    block = recording_requester.get_block(1)
+    raw_transaction = recording_requester.get_raw_transaction('t1')
+    with pytest.raises(ResponseCodeError, match='404'):
+        recording_requester.get_transaction('missing')
+
+    replaying_requester = create_requester(ReplayAdapter(archive), domain='https://mirror.test')
+
+    assert replaying_requester.get_block(1) == block
+    assert replaying_requester.get_raw_transaction('t1') == raw_transaction
+    with pytest.raises(ResponseCodeError, match='404'):
+        replaying_requester.get_transaction('missing')
+    archive.close()
+
+
+def test_doesnt_record_the_retryable_responses(explorer, tmp_path):
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+
+    with pytest.raises(ResponseCodeError, match='503'):
+        create_requester(RecordingAdapter(archive)).get_info()
+
+    assert len(explorer.http_adapter.requests) == 2
+    assert len(archive) == 0
+    archive.close()
+
+
+def test_raises_for_the_requests_not_recorded_without_retrying_them(tmp_path):
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+    # Counts the attempts sent to the ReplayAdapter
+    http_adapter = FakeAdapter(ReplayAdapter(archive).send)
+
+    with pytest.raises(ArchiveMissError, match='/7001/block/1'):
+        create_requester(http_adapter).get_block(1)
+
+    assert len(http_adapter.requests) == 1
+    archive.close()
+
+
+def test_records_the_missing_requests_through_the_fallback(explorer, tmp_path):
+    archive = ResponseArchive(tmp_path / 'archive.sqlite')
+    replay_adapter = ReplayAdapter(archive, fallback_adapter=RecordingAdapter(archive))
+
+    assert send(replay_adapter, URLS[0]).json()['hash'] == 'a1'
+    assert send(replay_adapter, URLS[0]).json()['hash'] == 'a1'
+
+    assert len(explorer.http_adapter.requests) == 1
+    assert get_archive_key('GET', URLS[0]) in archive
+    archive.close()
+
+
+def test_archive_key_ignores_the_domain_and_the_order_of_the_query_parameters():
+    assert (get_archive_key('GET', 'https://explorer.hydrachain.org/7001/search-logs?toBlock=9&fromBlock=1')
+            == get_archive_key('GET', 'https://mirror.test/7001/search-logs?fromBlock=1&toBlock=9')
+            == 'GET /7001/search-logs?fromBlock=1&toBlock=9')
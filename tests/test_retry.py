@@ -0,0 +1,204 @@
+import time
+import types
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from hydrachain_explorer_requester import explorer_requester as explorer_requester_module
+from hydrachain_explorer_requester import rate_limiter as rate_limiter_module
+from hydrachain_explorer_requester.enum import Endpoint
+from hydrachain_explorer_requester.explorer_requester import ExplorerRequester, ResponseCodeError
+from hydrachain_explorer_requester.rate_limiter import RateLimiter, TokenBucket
+from hydrachain_explorer_requester.retry import RetryPolicy
+
+from fake_adapter import FakeAdapter, create_response
+
+
+def test_backs_off_exponentially_up_to_the_max_backoff():
+    retry_policy = RetryPolicy(backoff_seconds=0.5, max_backoff_seconds=3.0, jitter=False)
+
+    assert [retry_policy.get_delay_seconds(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_jitters_between_zero_and_the_exponential_backoff():
+    retry_policy = RetryPolicy(backoff_seconds=0.5, max_backoff_seconds=3.0)
+
+    delays = [retry_policy.get_delay_seconds(3) for _ in range(200)]
+
+    assert all(0.0 <= delay <= 2.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize('retry_after, delay', [
+    ('7', 7.0),
+    ('-3', 0.0),
+    ('500', 120.0),
+    ('soon', 1.0),
+])
+def test_respects_the_retry_after_seconds_up_to_the_max(retry_after, delay):
+    retry_policy = RetryPolicy(jitter=False, backoff_seconds=1.0)
+
+    assert retry_policy.get_delay_seconds(1, {'Retry-After': retry_after}) == delay
+
+
+def test_respects_the_retry_after_date():
+    retry_policy = RetryPolicy(jitter=False)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 25.0 <= retry_policy.get_delay_seconds(1, {'Retry-After': format_datetime(retry_at, usegmt=True)}) <= 30.0
+
+
+def test_ignores_the_retry_after_when_told_to():
+    retry_policy = RetryPolicy(jitter=False, backoff_seconds=1.0, respect_retry_after=False)
+
+    assert retry_policy.get_delay_seconds(2, {'Retry-After': '60'}) == 2.0
+
+
+def test_retries_only_the_retryable_statuses_of_the_idempotent_methods_within_max_attempts():
+    retry_policy = RetryPolicy(max_attempts=3)
+
+    assert retry_policy.should_retry_status('GET', 1, 503)
+    assert retry_policy.should_retry_status('get', 2, 429)
+    assert not retry_policy.should_retry_status('GET', 3, 503)
+    assert not retry_policy.should_retry_status('GET', 1, 404)
+    assert not retry_policy.should_retry_status('POST', 1, 503)
+    assert RetryPolicy(retry_methods=frozenset({'GET', 'POST'})).should_retry_status('POST', 1, 503)
+
+
+def test_retries_the_timeouts_only_with_retry_timeouts():
+    assert RetryPolicy().should_retry_error('GET', 1, timed_out=True)
+    assert not RetryPolicy(retry_timeouts=False).should_retry_error('GET', 1, timed_out=True)
+    assert RetryPolicy(retry_timeouts=False).should_retry_error('GET', 1, timed_out=False)
+
+
+class RetryingExplorer:
+    """
+    Fails the first attempts with the given errors or status codes, then answers.
+    The requester's sleeps are recorded instead of slept.
+    """
+
+    def __init__(self, monkeypatch, failures: list, retry_policy: RetryPolicy):
+        self.failures = list(failures)
+        self.sleeps = []
+        self.http_adapter = FakeAdapter(self.handle)
+        self.explorer_requester = ExplorerRequester(http_adapter=self.http_adapter, retry_policy=retry_policy, retry_policies={})
+
+        monkeypatch.setattr(explorer_requester_module, 'time', types.SimpleNamespace(
+            sleep=self.sleeps.append,
+            perf_counter=time.perf_counter,
+            monotonic=time.monotonic,
+            time=time.time
+        ))
+
+    def handle(self, request):
+        if not self.failures:
+            return create_response(request, {'height': 1})
+
+        failure = self.failures.pop(0)
+        if isinstance(failure, BaseException):
+            raise failure
+
+        status_code, headers = failure
+        return create_response(request, {'error': 'unavailable'}, status_code=status_code, headers=headers)
+
+
+def test_requester_retries_the_retryable_statuses_after_their_delays(monkeypatch):
+    retry_policy = RetryPolicy(max_attempts=4, backoff_seconds=0.5, jitter=False)
+    explorer = RetryingExplorer(monkeypatch, [(503, {}), (429, {'Retry-After': '7'}), (502, {})], retry_policy)
+
+    assert explorer.explorer_requester.get_info() == {'height': 1}
+    assert len(explorer.http_adapter.requests) == 4
+    assert explorer.sleeps == [0.5, 7.0, 2.0]
+
+
+def test_requester_returns_the_last_retryable_response_once_the_attempts_are_exhausted(monkeypatch):
+    retry_policy = RetryPolicy(max_attempts=2, backoff_seconds=0.0, jitter=False)
+    explorer = RetryingExplorer(monkeypatch, [(503, {})] * 3, retry_policy)
+
+    with pytest.raises(ResponseCodeError, match='503'):
+        explorer.explorer_requester.get_info()
+
+    assert len(explorer.http_adapter.requests) == 2
+
+
+def test_requester_doesnt_retry_the_non_idempotent_methods(monkeypatch):
+    explorer = RetryingExplorer(monkeypatch, [(503, {})], RetryPolicy(jitter=False))
+    prepared_request = requests.Request('POST', 'https://explorer.hydrachain.org/api/info').prepare()
+
+    response = explorer.explorer_requester._send(prepared_request, explorer.explorer_requester.retry_policy, Endpoint.INFO)
+
+    assert response.status_code == 503
+    assert len(explorer.http_adapter.requests) == 1
+
+
+def test_requester_retries_connect_timeouts_but_not_read_timeouts_without_retry_timeouts(monkeypatch):
+    retry_policy = RetryPolicy(backoff_seconds=0.0, jitter=False, retry_timeouts=False)
+    explorer = RetryingExplorer(monkeypatch, [requests.ConnectTimeout('connect'), requests.ConnectionError('refused')], retry_policy)
+    assert explorer.explorer_requester.get_info() == {'height': 1}
+    assert len(explorer.http_adapter.requests) == 3
+
+    explorer = RetryingExplorer(monkeypatch, [requests.ReadTimeout('read')], retry_policy)
+    with pytest.raises(requests.ReadTimeout):
+        explorer.explorer_requester.get_info()
+    assert len(explorer.http_adapter.requests) == 1
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, 'time', clock)
+    return clock
+
+
+def test_token_bucket_allows_the_burst_and_then_paces(clock):
+    bucket = TokenBucket(requests_per_second=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(5)] == pytest.approx([0.0, 0.0, 0.0, 0.1, 0.2])
+
+    clock.now += 10
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.0, 0.1])
+
+
+def test_token_bucket_rejects_a_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(requests_per_second=0)
+
+
+def test_rate_limiter_applies_the_stricter_endpoint_limits(clock):
+    rate_limiter = RateLimiter(requests_per_second=100, endpoint_limits={Endpoint.SEARCH_LOGS: TokenBucket(1, burst=1)})
+
+    waits = [rate_limiter.acquire(Endpoint.SEARCH_LOGS) for _ in range(3)] + [rate_limiter.acquire(Endpoint.BLOCK)]
+
+    assert waits == pytest.approx([0.0, 1.0, 1.0, 0.0])
+    assert clock.sleeps == pytest.approx([1.0, 1.0])
+
+    statistics = rate_limiter.statistics()
+    assert (statistics.acquired, statistics.waited) == (4, 2)
+    assert statistics.max_waited_seconds == pytest.approx(1.0)
+
+
+def test_requester_paces_every_attempt_through_the_rate_limiter(monkeypatch, clock):
+    rate_limiter = RateLimiter(requests_per_second=2, burst=1)
+    explorer = RetryingExplorer(monkeypatch, [(503, {})], RetryPolicy(backoff_seconds=0.0, jitter=False))
+    explorer.explorer_requester.rate_limiter = rate_limiter
+
+    explorer.explorer_requester.get_info()
+
+    assert rate_limiter.statistics().acquired == 2
+    assert clock.sleeps == pytest.approx([0.5])